@@ -15,6 +15,7 @@ sys.path.append(os.getcwd())
 load_dotenv()
 
 from models import PhotoRecord  # Import models to register them
+from app.models.user import User  # noqa: F401
 from database import Base, DATABASE_URL
 
 # this is the Alembic Config object, which provides
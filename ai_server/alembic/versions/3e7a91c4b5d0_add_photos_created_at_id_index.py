@@ -0,0 +1,45 @@
+"""Add (created_at, id) index to photos for keyset pagination
+
+Revision ID: 3e7a91c4b5d0
+Revises: 8b4f0c6d2e71
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3e7a91c4b5d0'
+down_revision: Union[str, Sequence[str], None] = '8b4f0c6d2e71'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _indexes(table: str) -> set:
+    # 앱 startup의 create_all로 이미 생성된 인덱스는 건너뜀
+    return {i["name"] for i in sa.inspect(op.get_bind()).get_indexes(table)}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if "ix_photos_created_at_id" in _indexes("photos"):
+        return
+    if op.get_bind().dialect.name == "postgresql":
+        # 운영 중인 테이블을 잠그지 않도록 CONCURRENTLY (트랜잭션 밖에서 실행)
+        with op.get_context().autocommit_block():
+            op.create_index(
+                "ix_photos_created_at_id",
+                "photos",
+                ["created_at", "id"],
+                postgresql_concurrently=True,
+            )
+    else:
+        op.create_index("ix_photos_created_at_id", "photos", ["created_at", "id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_photos_created_at_id", table_name="photos")
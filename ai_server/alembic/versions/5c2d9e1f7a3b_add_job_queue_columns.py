@@ -0,0 +1,53 @@
+"""Add job queue lease columns to photos
+
+Revision ID: 5c2d9e1f7a3b
+Revises: 12aeab7cf18e
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c2d9e1f7a3b'
+down_revision: Union[str, Sequence[str], None] = '12aeab7cf18e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _columns(table: str) -> set:
+    # 앱 startup의 create_all로 이미 생성된 컬럼은 건너뜀
+    return {c["name"] for c in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def _indexes(table: str) -> set:
+    return {i["name"] for i in sa.inspect(op.get_bind()).get_indexes(table)}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    columns = _columns("photos")
+    if "locked_by" not in columns:
+        op.add_column("photos", sa.Column("locked_by", sa.String(), nullable=True))
+    if "locked_until" not in columns:
+        op.add_column("photos", sa.Column("locked_until", sa.DateTime(), nullable=True))
+    if "attempts" not in columns:
+        op.add_column(
+            "photos",
+            sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+        )
+    if "ix_photos_status_created_at" not in _indexes("photos"):
+        op.create_index(
+            "ix_photos_status_created_at", "photos", ["status", "created_at"]
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_photos_status_created_at", table_name="photos")
+    op.drop_column("photos", "attempts")
+    op.drop_column("photos", "locked_until")
+    op.drop_column("photos", "locked_by")
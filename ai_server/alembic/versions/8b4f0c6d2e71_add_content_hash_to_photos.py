@@ -0,0 +1,49 @@
+"""Add content hash and model version to photos (result cache)
+
+Revision ID: 8b4f0c6d2e71
+Revises: 5c2d9e1f7a3b
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b4f0c6d2e71'
+down_revision: Union[str, Sequence[str], None] = '5c2d9e1f7a3b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _columns(table: str) -> set:
+    # 앱 startup의 create_all로 이미 생성된 컬럼은 건너뜀
+    return {c["name"] for c in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def _indexes(table: str) -> set:
+    return {i["name"] for i in sa.inspect(op.get_bind()).get_indexes(table)}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    columns = _columns("photos")
+    if "content_hash" not in columns:
+        op.add_column("photos", sa.Column("content_hash", sa.String(64), nullable=True))
+    if "model_version" not in columns:
+        op.add_column("photos", sa.Column("model_version", sa.String(), nullable=True))
+    if "ix_photos_content_hash_model_version" not in _indexes("photos"):
+        op.create_index(
+            "ix_photos_content_hash_model_version",
+            "photos",
+            ["content_hash", "model_version"],
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_photos_content_hash_model_version", table_name="photos")
+    op.drop_column("photos", "model_version")
+    op.drop_column("photos", "content_hash")
@@ -0,0 +1,108 @@
+"""Add owner_id to photos, backfill, and index (owner_id, created_at, id)
+
+Revision ID: a4d2f7e9c1b8
+Revises: 3e7a91c4b5d0
+Create Date: 2026-10-17 16:00:00.000000
+
+기존 사진의 소유자 채우기 (owner_id IS NULL 인 행만):
+- PHOTO_BACKFILL_OWNER=<username> 이 설정되어 있으면 그 사용자
+- 아니면 사용자가 한 명뿐일 때 그 사용자
+- 둘 다 아니면 비워 둠 (어느 사용자의 목록에도 나오지 않음, 나중에 직접 지정)
+
+"""
+import os
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d2f7e9c1b8'
+down_revision: Union[str, Sequence[str], None] = '3e7a91c4b5d0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _columns(table: str) -> set:
+    # 앱 startup의 create_all로 이미 생성된 컬럼/인덱스는 건너뜀
+    return {c["name"] for c in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def _indexes(table: str) -> set:
+    return {i["name"] for i in sa.inspect(op.get_bind()).get_indexes(table)}
+
+
+def _backfill_owner() -> None:
+    bind = op.get_bind()
+    username = os.getenv("PHOTO_BACKFILL_OWNER")
+    if username:
+        result = bind.execute(
+            sa.text(
+                "UPDATE photos SET owner_id = (SELECT id FROM users WHERE username = :username) "
+                "WHERE owner_id IS NULL"
+            ),
+            {"username": username},
+        )
+    else:
+        result = bind.execute(
+            sa.text(
+                "UPDATE photos SET owner_id = (SELECT id FROM users) "
+                "WHERE owner_id IS NULL AND (SELECT count(*) FROM users) = 1"
+            )
+        )
+    print(f"owner_id backfilled for {result.rowcount} photos")
+    remaining = bind.execute(
+        sa.text("SELECT count(*) FROM photos WHERE owner_id IS NULL")
+    ).scalar()
+    if remaining:
+        print(f"⚠️ {remaining} photos have no owner (set PHOTO_BACKFILL_OWNER and re-run)")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    is_postgresql = op.get_bind().dialect.name == "postgresql"
+
+    if "owner_id" not in _columns("photos"):
+        op.add_column("photos", sa.Column("owner_id", postgresql.UUID(as_uuid=True), nullable=True))
+        if is_postgresql:
+            # SQLite는 ALTER TABLE로 외래 키를 추가할 수 없음 (테스트/개발 DB는 생략)
+            op.create_foreign_key(
+                "fk_photos_owner_id_users",
+                "photos",
+                "users",
+                ["owner_id"],
+                ["id"],
+                ondelete="CASCADE",
+            )
+
+    _backfill_owner()
+
+    indexes = _indexes("photos")
+    if "ix_photos_owner_created_at" not in indexes:
+        if is_postgresql:
+            # 운영 중인 테이블을 잠그지 않도록 CONCURRENTLY (트랜잭션 밖에서 실행)
+            with op.get_context().autocommit_block():
+                op.create_index(
+                    "ix_photos_owner_created_at",
+                    "photos",
+                    ["owner_id", "created_at", "id"],
+                    postgresql_concurrently=True,
+                )
+        else:
+            op.create_index(
+                "ix_photos_owner_created_at", "photos", ["owner_id", "created_at", "id"]
+            )
+    # 목록은 항상 owner_id로 거르므로 전체 목록용 인덱스는 더 이상 쓰이지 않음
+    if "ix_photos_created_at_id" in indexes:
+        op.drop_index("ix_photos_created_at_id", table_name="photos")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("ix_photos_created_at_id", "photos", ["created_at", "id"])
+    op.drop_index("ix_photos_owner_created_at", table_name="photos")
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_constraint("fk_photos_owner_id_users", "photos", type_="foreignkey")
+    op.drop_column("photos", "owner_id")
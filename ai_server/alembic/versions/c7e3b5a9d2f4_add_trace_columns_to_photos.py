@@ -0,0 +1,38 @@
+"""Add request_id and traceparent to photos (upload → worker tracing)
+
+Revision ID: c7e3b5a9d2f4
+Revises: a4d2f7e9c1b8
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e3b5a9d2f4'
+down_revision: Union[str, Sequence[str], None] = 'a4d2f7e9c1b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _columns(table: str) -> set:
+    # 앱 startup의 create_all로 이미 생성된 컬럼은 건너뜀
+    return {c["name"] for c in sa.inspect(op.get_bind()).get_columns(table)}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    columns = _columns("photos")
+    if "request_id" not in columns:
+        op.add_column("photos", sa.Column("request_id", sa.String(64), nullable=True))
+    if "traceparent" not in columns:
+        op.add_column("photos", sa.Column("traceparent", sa.String(55), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("photos", "traceparent")
+    op.drop_column("photos", "request_id")
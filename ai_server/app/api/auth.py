@@ -8,7 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from app.auth import (
-    get_password_hash,
+    get_password_hash_async,
     create_access_token,
     authenticate_user,
 )
@@ -30,6 +30,7 @@ async def register_user(
     새 사용자 등록
     - username: 3~50자
     - password: 6자 이상
+    - 해싱 대기열이 가득 차면 503 (Retry-After)
     """
     # 중복 확인
     result = await db.execute(select(User).filter(User.username == user_data.username))
@@ -41,7 +42,7 @@ async def register_user(
         )
 
     # 사용자 생성
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await get_password_hash_async(user_data.password)
     new_user = User(
         username=user_data.username,
         hashed_password=hashed_password,
@@ -68,6 +69,7 @@ async def login_for_access_token(
     로그인 및 JWT 토큰 발급
     - OAuth2 표준 form 형식 (username, password)
     - 성공 시 access_token 반환
+    - 해싱 대기열이 가득 차면 503 (Retry-After)
     """
     user = await authenticate_user(db, form_data.username, form_data.password)
     if not user:
@@ -1,13 +1,47 @@
 """
 헬스체크 API 라우터
+
+- /health: 프로세스가 살아있는지 (항상 200) + 모델 상태 + 결과/사용자 캐시 적중/미스
+  (DB 커넥션 풀 사용량은 /metrics 의 petcam_db_pool_*)
+- /health/ready: 요청을 받을 준비가 됐는지 (모델 로드/워밍업 중이거나 실패하면 503)
 """
 
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from app.services import result_cache
+from app.services.principal_cache import principals
+from app.services.ai_service import model_manager
+from app.services.model_manager import MODEL_PRELOAD, ModelState
 
 router = APIRouter(tags=["health"])
 
 
+def _is_ready() -> bool:
+    # 지연 로드 모드(MODEL_PRELOAD=0)에서는 아직 로드 전이어도 요청을 받을 수 있음
+    if model_manager.state == ModelState.NOT_LOADED:
+        return not MODEL_PRELOAD
+    return model_manager.ready
+
+
 @router.get("/health")
 async def health_check():
     """서버 상태 확인용 헬스체크 엔드포인트"""
-    return {"status": "ok", "version": "1.0.0"}
+    return {
+        "status": "ok",
+        "version": "1.0.0",
+        "ready": _is_ready(),
+        "model": model_manager.status(),
+        "result_cache": result_cache.stats.snapshot(),
+        "principal_cache": principals.snapshot(),
+    }
+
+
+@router.get("/health/ready")
+async def readiness_check():
+    """로드밸런서/오케스트레이터용 준비 상태 확인 (준비 전에는 503)"""
+    ready = _is_ready()
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"ready": ready, "model": model_manager.status()},
+    )
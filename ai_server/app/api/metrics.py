@@ -0,0 +1,32 @@
+"""
+Prometheus 메트릭 API 라우터
+
+- /metrics: Prometheus 텍스트 형식 (gunicorn 워커 / 업스케일 워커 합계, app/core/metrics.py)
+  nginx 로는 노출하지 않음 (Prometheus 가 내부 네트워크에서 app:8000 을 직접 수집)
+"""
+
+import logging
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import Response
+from prometheus_client import CONTENT_TYPE_LATEST
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import metrics
+from app.core.deps import get_db
+from app.services import job_queue
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+async def prometheus_metrics(db: AsyncSession = Depends(get_db)):
+    # 큐 깊이는 수집할 때 DB에서 셈 (DB 오류여도 나머지 메트릭은 반환)
+    try:
+        metrics.QUEUE_DEPTH.set(await job_queue.count_queued(db))
+        await db.commit()
+    except Exception as e:
+        logger.warning(f"Queue depth unavailable: {e}")
+    return Response(metrics.render(), media_type=CONTENT_TYPE_LATEST)
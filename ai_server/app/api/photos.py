@@ -1,128 +1,192 @@
 """
-사진 관련 API 라우터 (/upscale, /bestcut, /photos)
+사진 관련 API 라우터 (/upscale, /bestcut, /photos, /photos/status, /photos/events)
 """
 
+import json
 import os
 import uuid
-import shutil
-import asyncio
-from typing import List
+from typing import Optional
 
 from fastapi import (
     APIRouter,
     Depends,
     HTTPException,
-    BackgroundTasks,
-    UploadFile,
-    File,
     Query,
     Request,
 )
-from fastapi.responses import Response
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from models import PhotoRecord, ProcessingStatus
+from app.core import tracing
 from app.core.deps import get_db, limiter
-from app.services.ai_service import process_image_task, get_blur_score_sync
+from app.services import result_cache, status_events
+from app.services.blur import score_frames
+from app.services import renditions
+from app.services.file_serving import file_response, first_existing
+from app.services.pagination import next_cursor, photos_page_query
+from app.services.ingest import (
+    MAX_UPLOAD_FILES,
+    ORIGINALS_DIR,
+    StoredUpload,
+    commit_upload,
+    content_hash,
+    discard_uploads,
+    receive_uploads,
+)
 from app.auth import get_current_user
 from app.models.user import User
 
 router = APIRouter(prefix="", tags=["photos"])
 
+# GET /photos/status, /photos/events 한 번에 요청할 수 있는 최대 사진 수
+MAX_STATUS_IDS = 100
+_TERMINAL_STATUSES = {ProcessingStatus.COMPLETED.value, ProcessingStatus.FAILED.value}
+_UPSCALED_RENDITIONS = list(renditions.RENDITION_SIZES)
+
+
+def _multipart_body(field: str, multiple: bool = False) -> dict:
+    """본문을 직접 스트리밍하는 엔드포인트의 OpenAPI 요청 스키마"""
+    file_schema = {"type": "string", "format": "binary"}
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "multipart/form-data": {
+                    "schema": {
+                        "type": "object",
+                        "required": [field],
+                        "properties": {
+                            field: {"type": "array", "items": file_schema}
+                            if multiple
+                            else file_schema
+                        },
+                    }
+                }
+            },
+        }
+    }
+
+
+async def _create_photo(
+    db: AsyncSession, owner: User, upload: StoredUpload, lat: float, lng: float
+) -> tuple:
+    """
+    업로드로 PhotoRecord 생성 → (photo_id, 캐시 적중 여부)
+
+    같은 내용의 완료된 결과가 있으면 새 원본을 저장하지 않고 그 파일들을 가리키는
+    COMPLETED 레코드를 만들고, 없으면 원본을 저장하고 QUEUED로 큐에 넣음
+    """
+    photo_id = str(uuid.uuid4())
+    digest = await content_hash(upload)
+    # 적중한 행은 아래 커밋까지 잠김 (그 사이 DELETE /photos 가 파일을 지우지 않도록)
+    cached = await result_cache.lookup(db, digest)
+
+    if cached:
+        discard_uploads([upload])
+        db_record = PhotoRecord(
+            id=photo_id,
+            owner_id=owner.id,
+            original_path=cached.original_path,
+            upscaled_path=cached.upscaled_path,
+            status=ProcessingStatus.COMPLETED,
+            content_hash=digest,
+            model_version=cached.model_version,
+            latitude=lat,
+            longitude=lng,
+        )
+    else:
+        orig_path = f"{ORIGINALS_DIR}/{photo_id}.jpg"
+        try:
+            with tracing.span("upload.commit"):
+                await commit_upload(upload, orig_path)
+        except Exception as e:
+            discard_uploads([upload])
+            raise HTTPException(status_code=500, detail=f"File save failed: {e}")
+
+        db_record = PhotoRecord(
+            id=photo_id,
+            owner_id=owner.id,
+            original_path=orig_path,
+            upscaled_path=None,
+            status=ProcessingStatus.QUEUED,
+            content_hash=digest,
+            latitude=lat,
+            longitude=lng,
+        )
+    # 워커가 이 요청의 trace 를 이어서 기록하도록 (app/core/tracing.py)
+    db_record.request_id = tracing.current_request_id()
+    db_record.traceparent = tracing.current_traceparent()
+    db.add(db_record)
+    with tracing.span("db.commit", **{"photo.id": photo_id}):
+        await db.commit()
+    return photo_id, cached is not None
+
+
+async def _get_owned_photo(
+    db: AsyncSession, photo_id: str, owner: User
+) -> Optional[PhotoRecord]:
+    """본인 사진만 조회 (다른 사용자의 사진은 없는 것과 같이 404)"""
+    result = await db.execute(
+        select(PhotoRecord).filter(
+            PhotoRecord.id == photo_id, PhotoRecord.owner_id == owner.id
+        )
+    )
+    return result.scalar_one_or_none()
+
 
-@router.post("/upscale")
+@router.post("/upscale", openapi_extra=_multipart_body("file"))
 @limiter.limit("10/minute")
 async def upscale_image(
     request: Request,
-    background_tasks: BackgroundTasks,
-    file: UploadFile = File(...),
     lat: float = 0.0,
     lng: float = 0.0,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    photo_id = str(uuid.uuid4())
-    orig_path = f"storage/originals/{photo_id}.jpg"
-
-    try:
-        with open(orig_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"File save failed: {e}")
-    finally:
-        file.file.close()
-
-    db_record = PhotoRecord(
-        id=photo_id,
-        original_path=orig_path,
-        upscaled_path=None,
-        status=ProcessingStatus.QUEUED,
-        latitude=lat,
-        longitude=lng,
-    )
-    db.add(db_record)
-    await db.commit()
+    # 본문은 청크 단위로 디스크에 기록 (크기/JPEG 검사는 받는 도중에)
+    with tracing.span("upload.receive"):
+        (upload,) = await receive_uploads(request, "file")
 
-    background_tasks.add_task(process_image_task, photo_id, orig_path)
+    photo_id, cached = await _create_photo(db, current_user, upload, lat, lng)
 
+    if cached:
+        return {"message": "Upload successful, reused existing result", "id": photo_id}
+    # 실제 처리는 워커 프로세스가 큐(QUEUED)에서 가져감 (worker.py)
     return {"message": "Upload successful, processing in background", "id": photo_id}
 
 
-@router.post("/bestcut")
+@router.post("/bestcut", openapi_extra=_multipart_body("files", multiple=True))
 @limiter.limit("10/minute")
 async def process_best_cut(
     request: Request,
-    background_tasks: BackgroundTasks,
-    files: List[UploadFile] = File(...),
     lat: float = 0.0,
     lng: float = 0.0,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    loop = asyncio.get_running_loop()
     best_score = -1.0
-    best_file_path = None
-    temp_files = []
+    best_upload = None
 
-    try:
-        for file in files:
-            temp_id = str(uuid.uuid4())
-            temp_path = f"storage/originals/temp_{temp_id}.jpg"
-
-            with open(temp_path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
-            file.file.close()
-            temp_files.append(temp_path)
+    # 프레임은 메모리로만 받고, 가장 선명한 한 장만 디스크에 저장
+    with tracing.span("upload.receive"):
+        uploads = await receive_uploads(
+            request, "files", max_files=MAX_UPLOAD_FILES, in_memory=True
+        )
 
-            score = await loop.run_in_executor(None, get_blur_score_sync, temp_path)
+    try:
+        # 업로드 바이트를 바로 디코딩해서 프로세스 풀에서 병렬 채점
+        scores = await score_frames([upload.data for upload in uploads])
 
+        for upload, score in zip(uploads, scores):
             if score > best_score:
                 best_score = score
-                best_file_path = temp_path
-
-        if best_file_path:
-            photo_id = str(uuid.uuid4())
-            final_path = f"storage/originals/{photo_id}.jpg"
-
-            os.rename(best_file_path, final_path)
-
-            for path in temp_files:
-                if path != best_file_path and os.path.exists(path):
-                    os.remove(path)
-
-            db_record = PhotoRecord(
-                id=photo_id,
-                original_path=final_path,
-                upscaled_path=None,
-                status=ProcessingStatus.QUEUED,
-                latitude=lat,
-                longitude=lng,
-            )
-            db.add(db_record)
-            await db.commit()
+                best_upload = upload
 
-            background_tasks.add_task(process_image_task, photo_id, final_path)
+        if best_upload:
+            discard_uploads([u for u in uploads if u is not best_upload])  # 메모리 해제
+            photo_id, _ = await _create_photo(db, current_user, best_upload, lat, lng)
 
             return {
                 "message": "Best cut selected, processing in background",
@@ -130,10 +194,10 @@ async def process_best_cut(
                 "score": best_score,
             }
 
+    except HTTPException:
+        raise
     except Exception as e:
-        for path in temp_files:
-            if os.path.exists(path):
-                os.remove(path)
+        discard_uploads(uploads)
         raise HTTPException(status_code=500, detail=f"Processing failed: {e}")
 
     return {"error": "No valid images found"}
@@ -143,43 +207,183 @@ async def process_best_cut(
 @limiter.limit("60/minute")
 async def get_photos(
     request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 헤더 값"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    result = await db.execute(
-        select(PhotoRecord)
-        .order_by(PhotoRecord.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-    )
+    # 본문은 기존처럼 목록 그대로, 다음 페이지 커서는 X-Next-Cursor 헤더로 전달
+    try:
+        query = photos_page_query(current_user.id, cursor, skip, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    result = await db.execute(query)
     photos = result.scalars().all()
+
+    next_page = next_cursor(photos, limit)
+    if next_page:
+        response.headers["X-Next-Cursor"] = next_page
     return photos
 
 
+def _parse_ids(ids: str) -> list:
+    """쉼표로 구분한 사진 ID (중복 제거, 1 ~ MAX_STATUS_IDS개)"""
+    photo_ids = [photo_id for photo_id in dict.fromkeys(ids.split(",")) if photo_id]
+    if not photo_ids or len(photo_ids) > MAX_STATUS_IDS:
+        raise HTTPException(
+            status_code=400, detail=f"ids must list 1 to {MAX_STATUS_IDS} photo ids"
+        )
+    return photo_ids
+
+
+@router.get("/photos/status")
+@limiter.limit("120/minute")
+async def get_photos_status(
+    request: Request,
+    ids: str = Query(..., description="쉼표로 구분한 사진 ID (최대 100개)"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    여러 사진의 처리 상태를 한 번에 조회 (파일은 보내지 않음)
+
+    - 기본 키 IN (...) 한 번 + 필요한 컬럼만 조회
+    - 없는 ID / 다른 사용자의 사진은 결과에서 빠짐
+    - renditions: 업스케일 결과로 받을 수 있는 size (결과가 없으면 빈 목록, 이때 파일 조회는 원본을 반환)
+    """
+    photo_ids = _parse_ids(ids)
+    result = await db.execute(
+        select(
+            PhotoRecord.id,
+            PhotoRecord.status,
+            PhotoRecord.error_message,
+            PhotoRecord.upscaled_path.is_not(None),
+        ).filter(PhotoRecord.id.in_(photo_ids), PhotoRecord.owner_id == current_user.id)
+    )
+
+    # 응답 모델 검증 없이 바로 직렬화, 값이 없는 필드는 생략 (공백 없는 JSON)
+    photos = []
+    for photo_id, status, error_message, upscaled in result.all():
+        item = {"id": photo_id, "status": status.value}
+        if error_message:
+            item["error_message"] = error_message
+        item["renditions"] = _UPSCALED_RENDITIONS if upscaled else []
+        photos.append(item)
+    return JSONResponse(photos, headers={"Cache-Control": "no-store"})
+
+
+def _sse(payload: dict) -> str:
+    return f"event: status\ndata: {json.dumps(payload)}\n\n"
+
+
+@router.get("/photos/events")
+async def photo_status_events(
+    ids: str = Query(..., description="쉼표로 구분한 사진 ID (최대 100개)"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    사진 처리 상태 스트림 (Server-Sent Events)
+
+    - 구독한 사진마다 현재 상태를 먼저 보내고, 이후 상태가 바뀔 때마다 `event: status` 전송
+    - 모든 사진이 COMPLETED/FAILED 가 되면 스트림 종료 (다시 폴링할 필요 없음)
+    - 본인 사진이 하나도 없으면 404, 다른 사용자의 ID는 무시
+    """
+    photo_ids = _parse_ids(ids)
+
+    # 현재 상태를 읽기 전에 구독 → 그 사이의 변경도 놓치지 않음
+    subscription = status_events.broker.subscribe(photo_ids)
+    # 여기서 나가면(404, 조회 실패, 취소) 바로 구독 해제, 스트림이 시작되면 stream() 이 해제
+    await subscription.__aenter__()
+    try:
+        result = await db.execute(
+            select(PhotoRecord.id, PhotoRecord.status, PhotoRecord.error_message).filter(
+                PhotoRecord.id.in_(photo_ids), PhotoRecord.owner_id == current_user.id
+            )
+        )
+        rows = result.all()
+        await db.commit()  # 스트리밍 동안 커넥션을 잡지 않음
+    except BaseException:
+        await subscription.__aexit__(None, None, None)
+        raise
+    if not rows:
+        await subscription.__aexit__(None, None, None)
+        return Response(status_code=404)
+
+    async def stream():
+        try:
+            pending = set()
+            for row in rows:
+                payload = {"id": row.id, "status": row.status.value}
+                if row.error_message:
+                    payload["error_message"] = row.error_message
+                if payload["status"] not in _TERMINAL_STATUSES:
+                    pending.add(row.id)
+                yield _sse(payload)
+
+            while pending:
+                payload = await subscription.get(status_events.STATUS_EVENTS_KEEPALIVE_SECONDS)
+                if payload is None:
+                    if subscription.closed:
+                        return  # 클라이언트가 다시 구독 (현재 상태부터 다시 받음)
+                    yield ": keepalive\n\n"
+                    continue
+                if payload["id"] not in pending:
+                    continue  # 다른 사용자의 사진이거나 이미 끝난 사진
+                yield _sse(payload)
+                if payload["status"] in _TERMINAL_STATUSES:
+                    pending.discard(payload["id"])
+        finally:
+            await subscription.__aexit__(None, None, None)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        # nginx 가 버퍼링하지 않고 바로 전달하도록
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/photos/{photo_id}")
 async def get_photo_file(
+    request: Request,
     photo_id: str,
     type: str = "upscaled",
+    size: str = Query("full", pattern="^(thumb|medium|full)$"),
+    format: str = Query("jpeg", pattern="^(jpeg|webp|avif)$"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    result = await db.execute(select(PhotoRecord).filter(PhotoRecord.id == photo_id))
-    record = result.scalar_one_or_none()
+    record = await _get_owned_photo(db, photo_id, current_user)
     if not record:
         return Response(status_code=404)
 
-    file_path = record.upscaled_path if type == "upscaled" else record.original_path
-
-    if type == "upscaled" and (file_path is None or not os.path.exists(file_path)):
-        file_path = record.original_path
-
-    if not file_path or not os.path.exists(file_path):
+    # 업스케일 결과가 아직 없으면 원본으로 대체
+    if type == "upscaled":
+        paths = [record.upscaled_path, record.original_path]
+    else:
+        paths = [record.original_path]
+
+    if size == "full" and format == "jpeg":
+        # 스트리밍 전송 (ETag/304, Range 지원) 또는 nginx X-Accel-Redirect
+        return await file_response(request, paths)
+
+    # 갤러리용 렌디션 (없으면 만들어서 저장)
+    if not renditions.is_supported(format):
+        raise HTTPException(status_code=415, detail=f"Format '{format}' is not supported")
+    source_path = await first_existing(paths)
+    if source_path is None:
         return Response(status_code=404)
-
-    with open(file_path, "rb") as f:
-        return Response(content=f.read(), media_type="image/jpeg")
+    try:
+        rendition_path = await renditions.get_rendition(source_path, size, format)
+    except OSError as e:
+        raise HTTPException(status_code=500, detail=f"Rendition failed: {e}")
+    return await file_response(
+        request, [rendition_path], media_type=renditions.media_type(format)
+    )
 
 
 @router.delete("/photos/{photo_id}")
@@ -188,17 +392,21 @@ async def delete_photo(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    result = await db.execute(select(PhotoRecord).filter(PhotoRecord.id == photo_id))
-    record = result.scalar_one_or_none()
+    record = await _get_owned_photo(db, photo_id, current_user)
     if not record:
         return Response(status_code=404)
 
-    if record.original_path and os.path.exists(record.original_path):
-        os.remove(record.original_path)
-    if record.upscaled_path and os.path.exists(record.upscaled_path):
-        os.remove(record.upscaled_path)
-
+    # 같은 결과를 재사용 중인 업로드와 직렬화 (그 레코드가 커밋된 뒤에 참조를 셈)
+    await result_cache.lock_shared(db, record.content_hash)
     await db.delete(record)
     await db.commit()
 
+    # 캐시로 공유 중인 파일은 마지막 레코드가 지워질 때만 삭제 (참조 카운트)
+    for path in await result_cache.unreferenced_paths(
+        db, [record.original_path, record.upscaled_path]
+    ):
+        if os.path.exists(path):
+            os.remove(path)
+        renditions.remove_renditions(path)
+
     return {"message": "Deleted successfully"}
@@ -3,10 +3,10 @@ from fastapi.responses import Response
 from sqlalchemy.orm import Session
 from typing import List
 import uuid
-import io
 import os
 
 from app.api import deps
+from app.services import encoder
 from app.services.image_service import image_service
 from app.models.photo import PhotoRecord
 from app.core.config import settings
@@ -23,10 +23,10 @@ def save_and_record(db: Session, contents: bytes, sr_image) -> bytes:
     with open(orig_path, "wb") as f:
         f.write(contents)
 
-    # Save result
+    # Save result (encoded once; the same bytes are returned in the response)
     res_filename = f"{photo_id}.jpg"
     res_path = os.path.join(settings.RESULTS_DIR, res_filename)
-    sr_image.save(res_path, format="JPEG")
+    result_bytes = encoder.save_jpeg(sr_image, res_path)
 
     # DB Record
     db_record = PhotoRecord(
@@ -39,10 +39,7 @@ def save_and_record(db: Session, contents: bytes, sr_image) -> bytes:
     db.commit()
     db.refresh(db_record)
 
-    # Return bytes
-    img_byte_arr = io.BytesIO()
-    sr_image.save(img_byte_arr, format="JPEG")
-    return img_byte_arr.getvalue()
+    return result_bytes
 
 
 @router.post("/upscale")
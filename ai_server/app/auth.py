@@ -1,12 +1,14 @@
 """
 JWT 인증 모듈
 
-- 비밀번호 해싱 (bcrypt)
+- 비밀번호 해싱 (bcrypt, 이벤트 루프 밖의 전용 스레드 풀에서 실행)
 - JWT 토큰 생성/검증
-- FastAPI 의존성 주입용 get_current_user
+- FastAPI 의존성 주입용 get_current_user (조회한 사용자는 principal_cache 에 보관)
 """
 
+import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -17,9 +19,10 @@ from passlib.context import CryptContext
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
-from database import SessionLocal
+from app.core.deps import get_db
 from app.models.user import User
 from app.schemas.user import TokenData
+from app.services.principal_cache import principals
 
 
 # ============ 설정 ============
@@ -34,6 +37,11 @@ if not SECRET_KEY:
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
 
+# bcrypt 해싱 스레드 수 (bcrypt는 해싱 중 GIL을 놓으므로 그동안 다른 요청은 계속 처리됨)
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+# 실행 중 + 대기 중인 해싱이 이 수에 도달하면 기다리지 않고 바로 503
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "16"))
+
 
 # ============ 비밀번호 해싱 ============
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -49,6 +57,39 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+# 해싱 한 번이 수백 ms CPU → 이벤트 루프에서 실행하면 그동안 이 워커의 모든 요청이 멈춤
+_hash_executor = ThreadPoolExecutor(
+    max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt"
+)
+_hash_pending = 0  # 이벤트 루프에서만 변경
+
+
+async def _run_in_hash_pool(fn, *args):
+    """해싱 스레드 풀에서 실행 (대기열이 가득 차면 503, 로그인 폭주 시 지연이 쌓이지 않도록)"""
+    global _hash_pending
+    if _hash_pending >= PASSWORD_HASH_MAX_PENDING:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many password checks in progress, retry later",
+            headers={"Retry-After": "1"},
+        )
+    _hash_pending += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_hash_executor, fn, *args)
+    finally:
+        _hash_pending -= 1
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password 를 해싱 스레드 풀에서 실행"""
+    return await _run_in_hash_pool(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """get_password_hash 를 해싱 스레드 풀에서 실행"""
+    return await _run_in_hash_pool(get_password_hash, password)
+
+
 # ============ JWT 토큰 ============
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
@@ -73,16 +114,6 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
-# ============ DB 세션 의존성 ============
-async def get_db():
-    """비동기 DB 세션 생성"""
-    async with SessionLocal() as db:
-        try:
-            yield db
-        finally:
-            await db.close()
-
-
 # ============ 현재 사용자 조회 ============
 async def get_current_user(
     token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)
@@ -93,6 +124,8 @@ async def get_current_user(
     - 토큰 검증 실패 시 401 Unauthorized
     - 사용자 미존재 시 401 Unauthorized
     - 비활성 사용자 시 400 Bad Request
+    - 최근(PRINCIPAL_CACHE_TTL 초 이내)에 조회한 사용자는 DB를 조회하지 않음
+    - db는 라우터와 같은 app.core.deps.get_db → 요청당 세션 하나를 함께 사용
     """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -109,12 +142,19 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
 
-    # DB에서 사용자 조회
-    result = await db.execute(select(User).filter(User.username == token_data.username))
-    user = result.scalar_one_or_none()
-
+    user = principals.get(token_data.username)
     if user is None:
-        raise credentials_exception
+        # DB에서 사용자 조회
+        result = await db.execute(select(User).filter(User.username == token_data.username))
+        user = result.scalar_one_or_none()
+
+        # 조회 트랜잭션을 끝내 커넥션을 풀에 반환
+        # (업로드 본문을 받는 동안 커넥션을 잡고 있지 않도록, expire_on_commit=False)
+        await db.commit()
+
+        if user is None:
+            raise credentials_exception
+        principals.put(token_data.username, user)
 
     if not user.is_active:
         raise HTTPException(
@@ -136,9 +176,12 @@ async def authenticate_user(
     result = await db.execute(select(User).filter(User.username == username))
     user = result.scalar_one_or_none()
 
+    # 비밀번호 확인 전에 조회 트랜잭션을 끝내 해싱 동안 커넥션을 잡고 있지 않음
+    await db.commit()
+
     if not user:
         return None
-    if not verify_password(password, user.hashed_password):
+    if not await verify_password_async(password, user.hashed_password):
         return None
 
     return user
@@ -0,0 +1,169 @@
+"""
+DB 커넥션 사용량 계측 (요청 단위)
+
+요청마다 풀에서 커넥션을 몇 번 꺼냈는지(checkouts), 동시에 몇 개를 잡고 있었는지(peak_held),
+커넥션을 얻기까지 기다린 시간(wait)을 기록하고 프로세스 합계(pool_stats)를 모읍니다 (벤치마크용 snapshot).
+대기 시간은 히스토그램(누적, WAIT_BUCKETS_MS 경계)으로도 모으고, 풀 대기 시간 초과(timeouts)도 셉니다.
+꺼낸 커넥션 수, 대기 시간, 시간 초과는 /metrics 의 petcam_db_pool_* 로도 내보냅니다 (app/core/metrics.py).
+
+- checkout/checkin 은 모든 풀의 이벤트로 셈 (테스트용 StaticPool 포함)
+- 대기 시간은 database.TimedQueuePool 이 connect() 시간을 재서 record_wait 로 전달
+- 요청 구분은 DBStatsMiddleware 가 contextvar 로 설정 (요청 밖의 사용은 합계에만 반영)
+"""
+
+import bisect
+import threading
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.pool import Pool
+
+from app.core.metrics import (
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_TIMEOUTS,
+    DB_POOL_WAIT_BUCKETS_MS,
+    DB_POOL_WAIT_SECONDS,
+)
+
+# 대기 시간 히스토그램 경계(ms), 마지막 칸은 +Inf
+WAIT_BUCKETS_MS = DB_POOL_WAIT_BUCKETS_MS
+
+
+class RequestDBStats:
+    """요청 하나의 커넥션 사용량"""
+
+    __slots__ = ("checkouts", "held", "peak_held", "wait_seconds")
+
+    def __init__(self):
+        self.checkouts = 0
+        self.held = 0
+        self.peak_held = 0
+        self.wait_seconds = 0.0
+
+
+class PoolStats:
+    """프로세스 합계 (요청 수, 요청당 checkout 수, 최대 동시 보유 수, 대기 시간)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.checkouts = 0  # 요청 밖(워커, 시작 시 create_all 등) 포함
+        self.request_checkouts = 0
+        self.max_checkouts_per_request = 0
+        self.max_held_per_request = 0
+        self.checked_out = 0
+        self.peak_checked_out = 0
+        self.timeouts = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self.wait_buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+
+    def record_wait(self, seconds: float):
+        DB_POOL_WAIT_SECONDS.observe(seconds)
+        with self._lock:
+            self.wait_seconds += seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+            self.wait_buckets[bisect.bisect_left(WAIT_BUCKETS_MS, seconds * 1000)] += 1
+
+    def record_timeout(self):
+        DB_POOL_TIMEOUTS.inc()
+        with self._lock:
+            self.timeouts += 1
+
+    def record_request(self, stats: RequestDBStats):
+        with self._lock:
+            self.requests += 1
+            self.request_checkouts += stats.checkouts
+            self.max_checkouts_per_request = max(self.max_checkouts_per_request, stats.checkouts)
+            self.max_held_per_request = max(self.max_held_per_request, stats.peak_held)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "checkouts": self.checkouts,
+                "checkouts_per_request": (
+                    round(self.request_checkouts / self.requests, 3) if self.requests else 0.0
+                ),
+                "max_checkouts_per_request": self.max_checkouts_per_request,
+                "max_held_per_request": self.max_held_per_request,
+                "checked_out": self.checked_out,
+                "peak_checked_out": self.peak_checked_out,
+                "timeouts": self.timeouts,
+                "wait_ms_total": round(self.wait_seconds * 1000, 2),
+                "wait_ms_max": round(self.max_wait_seconds * 1000, 2),
+                "wait_ms_histogram": self._cumulative_buckets(),
+            }
+
+    def _cumulative_buckets(self) -> dict:
+        # Prometheus 처럼 누적 (le 이하인 대기 수)
+        histogram, total = {}, 0
+        for bound, count in zip(WAIT_BUCKETS_MS + ("+Inf",), self.wait_buckets):
+            total += count
+            histogram[str(bound)] = total
+        return histogram
+
+    def reset(self):
+        """누적값 초기화 (지금 꺼내져 있는 커넥션 수는 유지)"""
+        with self._lock:
+            checked_out = self.checked_out
+            self.__init__()
+            self.checked_out = self.peak_checked_out = checked_out
+
+
+pool_stats = PoolStats()
+_current: ContextVar[Optional[RequestDBStats]] = ContextVar("db_request_stats", default=None)
+
+
+def record_wait(seconds: float):
+    """커넥션을 얻기까지 걸린 시간 (풀 대기 + 필요 시 새 연결)"""
+    pool_stats.record_wait(seconds)
+    stats = _current.get()
+    if stats is not None:
+        stats.wait_seconds += seconds
+
+
+@event.listens_for(Pool, "checkout")
+def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+    with pool_stats._lock:
+        pool_stats.checkouts += 1
+        pool_stats.checked_out += 1
+        pool_stats.peak_checked_out = max(pool_stats.peak_checked_out, pool_stats.checked_out)
+    DB_POOL_CHECKED_OUT.inc()
+    stats = _current.get()
+    if stats is not None:
+        stats.checkouts += 1
+        stats.held += 1
+        stats.peak_held = max(stats.peak_held, stats.held)
+        # checkin 은 다른 컨텍스트에서 불릴 수 있으므로 커넥션에 요청을 기록해 둠
+        connection_record.info["db_request_stats"] = stats
+
+
+@event.listens_for(Pool, "checkin")
+def _on_checkin(dbapi_connection, connection_record):
+    with pool_stats._lock:
+        pool_stats.checked_out -= 1
+    DB_POOL_CHECKED_OUT.dec()
+    stats = connection_record.info.pop("db_request_stats", None)
+    if stats is not None:
+        stats.held -= 1
+
+
+class DBStatsMiddleware:
+    """요청마다 RequestDBStats 를 만들고, 응답이 끝나면 합계에 더함 (ASGI 미들웨어)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        stats = RequestDBStats()
+        token = _current.set(stats)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current.reset(token)
+            pool_stats.record_request(stats)
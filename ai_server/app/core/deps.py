@@ -2,6 +2,8 @@
 공통 의존성 (DB 세션, Rate Limiter 등)
 """
 
+import os
+
 from sqlalchemy.ext.asyncio import AsyncSession
 from slowapi import Limiter
 from slowapi.util import get_remote_address
@@ -9,11 +11,20 @@ from slowapi.util import get_remote_address
 from database import SessionLocal
 
 # Rate Limiter (전역)
-limiter = Limiter(key_func=get_remote_address)
+# RATE_LIMIT_ENABLED=0 → 한도 비활성화 (부하 테스트/벤치마크용, 프로덕션에서는 끄지 말 것)
+limiter = Limiter(
+    key_func=get_remote_address,
+    enabled=os.getenv("RATE_LIMIT_ENABLED", "1") == "1",
+)
 
 
 async def get_db():
-    """비동기 DB 세션 생성"""
+    """
+    비동기 DB 세션 생성 (요청당 하나)
+
+    FastAPI는 같은 의존성을 한 요청 안에서 한 번만 실행하므로,
+    get_current_user 와 라우터가 모두 이 함수를 쓰면 같은 세션을 공유합니다.
+    """
     async with SessionLocal() as db:
         try:
             yield db
@@ -0,0 +1,182 @@
+"""
+Prometheus 메트릭 (GET /metrics)
+
+- petcam_pipeline_stage_seconds{stage}: 이미지 처리 단계별 소요 시간
+    upload_write (업로드 디스크 기록), decode, inference, encode (결과 JPEG 저장),
+    thumbnail (갤러리용 렌디션 생성), db_update (COMPLETED 기록)
+- petcam_http_request_duration_seconds{method, route, status}: 라우트별 요청 처리 시간
+  (route 는 /photos/{photo_id} 같은 경로 템플릿, 매칭되지 않은 요청과 SSE 스트림은 제외)
+- petcam_queue_depth: QUEUED 작업 수 (/metrics 를 읽을 때 DB에서 셈)
+- petcam_jobs_in_flight: 업스케일 워커가 처리 중인 작업 수
+- petcam_model_load_seconds{backend}: 모델 로드(또는 모델 서버 연결) 시간, 프로세스별
+- petcam_db_pool_checked_out / petcam_db_pool_overflow: 프로세스별 꺼낸 커넥션 수 / overflow 수
+  (풀 설정은 gunicorn 워커마다 적용되므로 pid 별로 노출)
+- petcam_db_pool_checkout_wait_seconds: 커넥션을 얻기까지 기다린 시간 (풀 대기 + 새 연결)
+- petcam_db_pool_timeouts_total: 풀 대기 시간 초과(DB_POOL_TIMEOUT) 수
+
+멀티 프로세스 (gunicorn 워커 여러 개 + 업스케일 워커 + 모델 서버):
+    PROMETHEUS_MULTIPROC_DIR 을 설정하면 프로세스마다 이 디렉터리의 mmap 파일에 기록하고,
+    /metrics 는 디렉터리의 파일을 모두 합쳐서 반환합니다 (어느 gunicorn 워커가 받아도 같은 값).
+    컨테이너끼리 디렉터리를 공유해도 섞이지 않도록 파일 이름에 호스트명-pid 를 씁니다.
+    gunicorn.conf.py 가 시작할 때 이 호스트의 이전 파일을 지우고, 워커가 종료되면 정리합니다.
+    (디렉터리는 prometheus_client import 전에 환경 변수로 설정되어 있어야 함)
+"""
+
+import os
+import socket
+import time
+from typing import Optional
+
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+    values,
+)
+
+# ============ 설정 ============
+PROMETHEUS_MULTIPROC_DIR = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+
+
+def _host() -> str:
+    return socket.gethostname().replace("_", "-")
+
+
+def process_identifier(pid: Optional[int] = None) -> str:
+    """멀티 프로세스 파일 이름에 쓰는 프로세스 구분자 (호스트명-pid, '_' 는 쓸 수 없음)"""
+    return f"{_host()}-{pid if pid is not None else os.getpid()}"
+
+
+if PROMETHEUS_MULTIPROC_DIR:
+    # 아래 메트릭을 만들기 전에 설정해야 적용됨
+    values.ValueClass = values.MultiProcessValue(process_identifier)
+
+
+PIPELINE_STAGES = ("upload_write", "decode", "inference", "encode", "thumbnail", "db_update")
+
+PIPELINE_STAGE_SECONDS = Histogram(
+    "petcam_pipeline_stage_seconds",
+    "Time spent in each image pipeline stage",
+    ["stage"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120),
+)
+REQUEST_SECONDS = Histogram(
+    "petcam_http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+)
+QUEUE_DEPTH = Gauge(
+    "petcam_queue_depth",
+    "Photos waiting in the upscale queue",
+    multiprocess_mode="mostrecent",
+)
+JOBS_IN_FLIGHT = Gauge(
+    "petcam_jobs_in_flight",
+    "Upscale jobs currently being processed",
+    multiprocess_mode="livesum",
+)
+MODEL_LOAD_SECONDS = Gauge(
+    "petcam_model_load_seconds",
+    "Model load (or model server connect) time of each process",
+    ["backend"],
+    multiprocess_mode="liveall",
+)
+# 커넥션 대기 시간 경계(ms), db_stats 의 프로세스 내 히스토그램과 같은 경계
+DB_POOL_WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+DB_POOL_CHECKED_OUT = Gauge(
+    "petcam_db_pool_checked_out",
+    "DB connections currently checked out of each process's pool",
+    multiprocess_mode="liveall",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "petcam_db_pool_overflow",
+    "Overflow connections of each process's pool (negative until pool_size is reached)",
+    multiprocess_mode="liveall",
+)
+DB_POOL_WAIT_SECONDS = Histogram(
+    "petcam_db_pool_checkout_wait_seconds",
+    "Time to get a DB connection from the pool (waiting + connecting)",
+    buckets=[ms / 1000 for ms in DB_POOL_WAIT_BUCKETS_MS],
+)
+DB_POOL_TIMEOUTS = Counter(
+    "petcam_db_pool_timeouts",
+    "DB pool checkouts that timed out (DB_POOL_TIMEOUT)",
+)
+
+# 아직 기록이 없는 단계도 0으로 노출 (대시보드에서 빈 시계열이 생기지 않도록)
+for _stage in PIPELINE_STAGES:
+    PIPELINE_STAGE_SECONDS.labels(_stage)
+
+
+def stage_timer(stage: str):
+    """with stage_timer("decode"): ... → 블록 소요 시간을 단계 히스토그램에 기록"""
+    return PIPELINE_STAGE_SECONDS.labels(stage).time()
+
+
+def observe_stage(stage: str, seconds: float):
+    PIPELINE_STAGE_SECONDS.labels(stage).observe(seconds)
+
+
+def render() -> bytes:
+    """현재 메트릭 (멀티 프로세스면 모든 프로세스의 파일을 합침)"""
+    if PROMETHEUS_MULTIPROC_DIR:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest(REGISTRY)
+
+
+def mark_process_dead(pid: int):
+    """종료된 프로세스의 live* 게이지 파일 삭제 (gunicorn child_exit 에서 호출)"""
+    if PROMETHEUS_MULTIPROC_DIR:
+        multiprocess.mark_process_dead(process_identifier(pid), PROMETHEUS_MULTIPROC_DIR)
+
+
+def clear_host_files():
+    """이 호스트(컨테이너)가 남긴 이전 실행의 파일 삭제 (gunicorn on_starting 에서 호출)"""
+    if not PROMETHEUS_MULTIPROC_DIR:
+        return
+    os.makedirs(PROMETHEUS_MULTIPROC_DIR, exist_ok=True)
+    # 파일 이름: <type>[_<mode>]_<host>-<pid>.db
+    marker = f"_{_host()}-"
+    for name in os.listdir(PROMETHEUS_MULTIPROC_DIR):
+        if name.endswith(".db") and marker in name:
+            os.remove(os.path.join(PROMETHEUS_MULTIPROC_DIR, name))
+
+
+class MetricsMiddleware:
+    """라우트별 요청 처리 시간 기록 (ASGI 미들웨어, 응답 본문 전송까지 포함)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        response = {"status": 500, "stream": False}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+                for name, value in message.get("headers", ()):
+                    if name == b"content-type" and value.startswith(b"text/event-stream"):
+                        response["stream"] = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            # 매칭되지 않은 경로(스캐너 등)는 라벨 폭증을 막기 위해, SSE 는 연결 시간이라 제외
+            if route is not None and not response["stream"]:
+                REQUEST_SECONDS.labels(
+                    scope["method"], route.path, str(response["status"])
+                ).observe(time.perf_counter() - start)
+
@@ -0,0 +1,274 @@
+"""
+요청 ID + 처리 과정 추적 (OpenTelemetry)
+
+업로드 하나가 결과가 나오기까지 어디서 시간을 썼는지 하나의 trace 로 봅니다.
+
+    POST /upscale                 요청 span (X-Request-ID, 상태 코드)
+    ├── upload.receive            본문 수신 + 디스크 기록
+    ├── upload.commit             원본 파일 최종 경로로 이동
+    ├── db.commit                 PhotoRecord 저장 (request_id, traceparent 같이 저장)
+    └── upscale.job               워커 프로세스: photos.traceparent 를 부모로 이어서 기록 (업로드 시각부터)
+        ├── queue.wait            업로드 → 워커가 점유한 시각
+        ├── decode / inference / encode / thumbnail   (추론 스레드)
+        └── db_update
+
+- X-Request-ID: 요청 헤더 값을 그대로 쓰고 (영숫자 . _ - 64자까지), 없으면 만들어서 응답 헤더로 돌려줌
+- 요청에 W3C traceparent 헤더가 있으면 그 trace 를 이어감
+- 스레드 경계: run_in_executor 는 contextvars 를 복사하지 않으므로 in_current_context() 로 감싸서 넘김
+- 단계 span 은 같은 이름의 /metrics 단계 히스토그램도 함께 기록 (stage())
+
+설정 (환경변수):
+- TRACING_EXPORTER:
+    memory: 프로세스 메모리에 최근 TRACING_MEMORY_SPANS 개만 보관 (기본, recent_spans() 로 조회)
+    console: 표준 출력 (개발용)
+    otlp: OTLP/gRPC 로 전송 (opentelemetry-exporter-otlp 필요, OTEL_EXPORTER_OTLP_ENDPOINT 등 표준 환경 변수)
+    none: 기록하지 않음 (요청 ID 는 그대로 전달)
+- TRACING_SAMPLE_RATIO: 새 trace 를 기록할 비율 (부모가 있으면 부모의 결정을 따름)
+- OTEL_SERVICE_NAME: trace 에 표시할 서비스 이름
+"""
+
+import collections
+import contextvars
+import datetime
+import logging
+import os
+import re
+import threading
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
+from typing import Callable, List, Optional
+
+from opentelemetry import trace
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    ConsoleSpanExporter,
+    SimpleSpanProcessor,
+    SpanExporter,
+    SpanExportResult,
+)
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+from opentelemetry.trace import SpanKind, Status, StatusCode
+from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
+
+from app.core.metrics import stage_timer
+
+logger = logging.getLogger(__name__)
+
+# ============ 설정 ============
+TRACING_EXPORTER = os.getenv("TRACING_EXPORTER", "memory")
+TRACING_MEMORY_SPANS = int(os.getenv("TRACING_MEMORY_SPANS", "2048"))
+TRACING_SAMPLE_RATIO = float(os.getenv("TRACING_SAMPLE_RATIO", "1.0"))
+SERVICE_NAME = os.getenv("OTEL_SERVICE_NAME", "petcam-ai-server")
+
+REQUEST_ID_HEADER = "x-request-id"
+_REQUEST_ID_PATTERN = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
+
+_request_id: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+_propagator = TraceContextTextMapPropagator()
+
+
+class RecentSpanExporter(SpanExporter):
+    """최근 maxlen 개 span 만 메모리에 보관 (오래된 것부터 버림)"""
+
+    def __init__(self, maxlen: int):
+        self._spans = collections.deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def export(self, spans) -> SpanExportResult:
+        with self._lock:
+            self._spans.extend(spans)
+        return SpanExportResult.SUCCESS
+
+    def spans(self, trace_id: Optional[int] = None) -> List[ReadableSpan]:
+        with self._lock:
+            spans = list(self._spans)
+        if trace_id is None:
+            return spans
+        return [span for span in spans if span.context.trace_id == trace_id]
+
+    def clear(self):
+        with self._lock:
+            self._spans.clear()
+
+    def shutdown(self):
+        pass
+
+
+def _create_provider() -> TracerProvider:
+    ratio = 0.0 if TRACING_EXPORTER == "none" else TRACING_SAMPLE_RATIO
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": SERVICE_NAME}),
+        sampler=ParentBased(TraceIdRatioBased(ratio)),
+    )
+    if TRACING_EXPORTER == "memory":
+        provider.add_span_processor(SimpleSpanProcessor(memory_exporter))
+    elif TRACING_EXPORTER == "console":
+        provider.add_span_processor(BatchSpanProcessor(ConsoleSpanExporter()))
+    elif TRACING_EXPORTER == "otlp":
+        try:
+            from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+        except ImportError:
+            logger.warning(
+                "⚠️ TRACING_EXPORTER=otlp but opentelemetry-exporter-otlp is not installed"
+            )
+        else:
+            provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+    return provider
+
+
+memory_exporter = RecentSpanExporter(TRACING_MEMORY_SPANS)
+provider = _create_provider()
+trace.set_tracer_provider(provider)
+tracer = provider.get_tracer("petcam")
+
+
+def recent_spans(trace_id: Optional[int] = None) -> List[ReadableSpan]:
+    """memory exporter 에 남아 있는 span (trace_id 를 주면 그 trace 만)"""
+    return memory_exporter.spans(trace_id)
+
+
+def current_request_id() -> Optional[str]:
+    return _request_id.get()
+
+
+def current_traceparent() -> Optional[str]:
+    """지금 span 의 W3C traceparent (작업 큐로 넘겨서 워커가 이어서 기록)"""
+    carrier: dict = {}
+    _propagator.inject(carrier)
+    return carrier.get("traceparent")
+
+
+def span(name: str, **attributes):
+    """현재 span 의 자식 span (with span("db.commit"): ...)"""
+    return tracer.start_as_current_span(name, attributes=attributes or None)
+
+
+@contextmanager
+def stage(name: str):
+    """처리 단계: span + /metrics 단계 히스토그램"""
+    with tracer.start_as_current_span(name), stage_timer(name):
+        yield
+
+
+def in_current_context(fn: Callable, *args) -> Callable:
+    """
+    run_in_executor 로 넘길 함수를 지금의 contextvars(현재 span, 요청 ID)에서 실행되도록 감쌈
+
+        await loop.run_in_executor(None, in_current_context(process_image_sync, a, b))
+    """
+    return partial(contextvars.copy_context().run, fn, *args)
+
+
+def _epoch_ns(value: Optional[datetime.datetime]) -> Optional[int]:
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)  # DB 에는 UTC naive 로 저장
+    return int(value.timestamp() * 1_000_000_000)
+
+
+@contextmanager
+def job_span(
+    photo_id: str,
+    request_id: Optional[str] = None,
+    traceparent: Optional[str] = None,
+    queued_at: Optional[datetime.datetime] = None,
+    attempt: Optional[int] = None,
+):
+    """
+    워커의 작업 하나 (업로드 요청의 trace 를 이어서 기록)
+
+    span 시작은 업로드 시각(queued_at)이라 upscale.job 길이가 업로드부터 완료까지의 시간이 되고,
+    그중 점유되기까지 기다린 시간은 queue.wait 로 따로 남깁니다.
+    """
+    parent = _propagator.extract({"traceparent": traceparent}) if traceparent else None
+    queued_ns = _epoch_ns(queued_at)
+    attributes = {"photo.id": photo_id}
+    if request_id:
+        attributes["request_id"] = request_id
+    if attempt is not None:
+        attributes["job.attempt"] = attempt
+
+    token = _request_id.set(request_id)
+    try:
+        with tracer.start_as_current_span(
+            "upscale.job",
+            context=parent,
+            kind=SpanKind.CONSUMER,
+            attributes=attributes,
+            start_time=queued_ns,
+        ) as job:
+            if queued_ns is not None:
+                wait = tracer.start_span("queue.wait", start_time=queued_ns)
+                wait.end()
+            yield job
+    finally:
+        _request_id.reset(token)
+
+
+def _request_id_from(value: Optional[str]) -> str:
+    if value and _REQUEST_ID_PATTERN.match(value):
+        return value
+    return uuid.uuid4().hex
+
+
+class TracingMiddleware:
+    """
+    요청 ID + 요청 span (ASGI 미들웨어, 가장 바깥에 둠)
+
+    span 이름은 라우팅 후 "METHOD /경로/템플릿" 으로 바꿈 (매칭되지 않으면 "METHOD")
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = {
+            name.decode("latin-1"): value.decode("latin-1")
+            for name, value in scope.get("headers", ())
+        }
+        request_id = _request_id_from(headers.get(REQUEST_ID_HEADER))
+        token = _request_id.set(request_id)
+        status = {"code": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (REQUEST_ID_HEADER.encode(), request_id.encode()),
+                ]
+            await send(message)
+
+        method = scope["method"]
+        try:
+            with tracer.start_as_current_span(
+                method,
+                context=_propagator.extract(headers),
+                kind=SpanKind.SERVER,
+                attributes={
+                    "http.method": method,
+                    "http.target": scope["path"],
+                    "request_id": request_id,
+                },
+            ) as request_span:
+                try:
+                    await self.app(scope, receive, send_wrapper)
+                finally:
+                    route = scope.get("route")
+                    if route is not None:
+                        request_span.update_name(f"{method} {route.path}")
+                        request_span.set_attribute("http.route", route.path)
+                    request_span.set_attribute("http.status_code", status["code"])
+                    if status["code"] >= 500:
+                        request_span.set_status(Status(StatusCode.ERROR))
+        finally:
+            _request_id.reset(token)
@@ -6,34 +6,15 @@ AI 이미지 처리 서비스
 """
 
 import asyncio
-from functools import partial
 
 import cv2
-import torch
 from PIL import Image
-from sqlalchemy.future import select
 
 from database import SessionLocal
-from models import PhotoRecord, ProcessingStatus
-
-# RealESRGAN import (모듈 없으면 None)
-try:
-    from RealESRGAN import RealESRGAN
-except ImportError:
-    RealESRGAN = None
-    print("⚠️ Warning: RealESRGAN module not found. AI features will be disabled.")
-
-# GPU 가속 설정
-device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-model = None
-
-if RealESRGAN:
-    try:
-        model = RealESRGAN(device, scale=4)
-        model.load_weights("weights/RealESRGAN_x4.pth", download=True)
-        print("✅ RealESRGAN model loaded successfully!")
-    except Exception as e:
-        print(f"❌ Error loading RealESRGAN: {e}")
+from app.core import tracing
+from app.services import encoder, job_queue, renditions, result_cache
+from app.services.model_loader import model_manager
+from app.services.tiling import load_input, upscale_tiled
 
 
 def get_blur_score_sync(image_path: str) -> float:
@@ -48,81 +29,108 @@ def get_blur_score_sync(image_path: str) -> float:
         return 0.0
 
 
-def process_image_sync(original_path: str, res_path: str):
-    """동기식 AI 처리 (별도 스레드에서 실행됨)"""
+def process_image_sync(original_path: str, res_path: str) -> str:
+    """동기식 AI 처리 (별도 스레드에서 실행됨). 결과를 만든 모델 버전 반환"""
     try:
-        image = Image.open(original_path).convert("RGB")
-
-        # [OOM 방지] 이미지 크기 조정 (Max 1080px)
-        max_size = 1080
-        if image.width > max_size or image.height > max_size:
-            image.thumbnail((max_size, max_size), Image.LANCZOS)
-
-        if model:
-            # RealESRGAN 처리
-            torch.cuda.empty_cache()
-            with torch.no_grad():
-                sr_image = model.predict(image)
-            torch.cuda.empty_cache()
-        else:
-            # Fallback: 모델 없으면 4배 리사이즈
-            print("⚠️ RealESRGAN not available, using fallback resize.")
-            new_size = (image.width * 4, image.height * 4)
-            sr_image = image.resize(new_size, Image.BICUBIC)
-
-        sr_image.save(res_path, format="JPEG")
-        return True
+        with tracing.stage("decode"):
+            # 입력 크기 제한 (UXGA 1600px까지 유지)
+            # 큰 JPEG는 목표 크기 근처로 축소 디코딩
+            image = load_input(original_path)
+
+        inference_engine = model_manager.get()
+        version = result_cache.MODEL_VERSION
+        with tracing.stage("inference"):
+            if inference_engine:
+                # [OOM 방지] 타일 단위 처리 → 피크 메모리는 타일 크기에 비례
+                # (타일은 다른 작업의 타일과 배치로 묶여서 실행될 수 있음)
+                sr_image = upscale_tiled(
+                    image,
+                    inference_engine.infer_many,
+                    scale=inference_engine.scale,
+                    batch_size=inference_engine.max_batch_size,
+                )
+            else:
+                # Fallback: 모델 없으면 4배 리사이즈
+                print("⚠️ RealESRGAN not available, using fallback resize.")
+                new_size = (image.width * 4, image.height * 4)
+                sr_image = image.resize(new_size, Image.BICUBIC)
+                version = result_cache.FALLBACK_VERSION
+
+        with tracing.stage("encode"):
+            encoder.save_jpeg(sr_image, res_path)
+
+        # 갤러리용 썸네일/미리보기 (메모리에 있는 결과로 바로 생성, 실패해도 작업은 성공)
+        try:
+            with tracing.stage("thumbnail"):
+                renditions.pregenerate(sr_image, res_path)
+        except Exception as e:
+            print(f"⚠️ Rendition generation failed: {e}")
+        return version
     except Exception as e:
         print(f"AI Processing Error: {e}")
         raise e
 
 
-async def process_image_task(photo_id: str, original_path: str):
-    """백그라운드에서 실행될 AI 처리 작업 (Non-blocking)"""
-    print(f"🔄 [Background] Processing photo {photo_id} started...")
+async def process_image_task(photo_id: str, original_path: str, worker_id: str):
+    """
+    백그라운드에서 실행될 AI 처리 작업 (Non-blocking)
+
+    상태 변경은 job_queue 의 조건부 UPDATE 한 문장씩이고,
+    추론하는 동안에는 DB 세션/커넥션을 잡고 있지 않습니다.
+    worker_id: 작업을 점유한 워커 (점유를 잃었으면 결과/오류를 기록하지 않음)
+    """
+    # 업로드 요청의 X-Request-ID (워커의 job_span 이 설정, 로그에서 요청과 연결)
+    request_id = tracing.current_request_id()
+    print(f"🔄 [Background] Processing photo {photo_id} started... (request_id={request_id})")
 
     try:
         async with SessionLocal() as db:
-            # 0. 상태 업데이트: PROCESSING
-            result = await db.execute(
-                select(PhotoRecord).filter(PhotoRecord.id == photo_id)
-            )
-            record = result.scalar_one_or_none()
-            if record:
-                record.status = ProcessingStatus.PROCESSING
+            # 0. 상태 업데이트: PROCESSING (+ 결과 캐시 조회용 content_hash)
+            found, content_hash = await job_queue.mark_processing(db, photo_id, worker_id)
+            if not found:
                 await db.commit()
-
-            # 1. AI 처리 (Blocking 함수를 Executor에서 실행)
-            loop = asyncio.get_running_loop()
-            res_path = f"storage/results/{photo_id}.jpg"
-
-            await loop.run_in_executor(
-                None, partial(process_image_sync, original_path, res_path)
-            )
-
-            # 2. DB 업데이트: COMPLETED
-            result = await db.execute(
-                select(PhotoRecord).filter(PhotoRecord.id == photo_id)
-            )
-            record = result.scalar_one_or_none()
-            if record:
-                record.upscaled_path = res_path
-                record.status = ProcessingStatus.COMPLETED
+                print(f"⚠️ [Background] Photo {photo_id} is no longer ours to process, skipping")
+                return
+
+            # 같은 내용이 그 사이 먼저 완료됐으면 그 결과를 가리키고 추론은 건너뜀 (재시도 업로드)
+            # (찾은 행의 잠금을 유지한 채 같은 트랜잭션에서 완료 처리 → 삭제와 겹치지 않음)
+            cached = await result_cache.lookup(db, content_hash)
+            if cached:
+                await job_queue.mark_completed(
+                    db, photo_id, worker_id, cached.upscaled_path, cached.model_version
+                )
+            else:
                 await db.commit()
 
-            print(f"✅ [Background] Processing photo {photo_id} completed!")
+        if cached:
+            print(f"♻️ [Background] Photo {photo_id} reused result of {cached.id}")
+            return
+
+        # 1. AI 처리 (Blocking 함수를 Executor에서 실행)
+        loop = asyncio.get_running_loop()
+        res_path = f"storage/results/{photo_id}.jpg"
+
+        # 추론 스레드에서도 이 작업의 span 아래에 단계가 기록되도록 컨텍스트를 넘김
+        version = await loop.run_in_executor(
+            None, tracing.in_current_context(process_image_sync, original_path, res_path)
+        )
+
+        # 2. DB 업데이트: COMPLETED
+        with tracing.stage("db_update"):
+            async with SessionLocal() as db:
+                completed = await job_queue.mark_completed(
+                    db, photo_id, worker_id, res_path, version
+                )
+        if not completed:
+            print(f"⚠️ [Background] Photo {photo_id} changed during processing, not recorded")
+            return
+
+        print(f"✅ [Background] Processing photo {photo_id} completed! (request_id={request_id})")
 
     except Exception as e:
-        print(f"❌ [Background] Error processing {photo_id}: {e}")
+        print(f"❌ [Background] Error processing {photo_id} (request_id={request_id}): {e}")
         try:
             async with SessionLocal() as db:
-                result = await db.execute(
-                    select(PhotoRecord).filter(PhotoRecord.id == photo_id)
-                )
-                record = result.scalar_one_or_none()
-                if record:
-                    record.status = ProcessingStatus.FAILED
-                    record.error_message = str(e)
-                    await db.commit()
+                await job_queue.mark_failed(db, photo_id, worker_id, str(e))
         except Exception as db_e:
             print(f"❌ [Background] Failed to update error status: {db_e}")
@@ -0,0 +1,90 @@
+"""
+블러 점수 계산 (/bestcut 연사 프레임 선택)
+
+- 업로드 바이트에서 바로 디코딩 (디스크에 썼다가 cv2.imread로 다시 읽지 않음)
+- 1/2 해상도 그레이스케일로 디코딩 (IMREAD_REDUCED_GRAYSCALE_2)
+  JPEG 디코더가 DCT 단계에서 축소하므로 전체 해상도 디코딩보다 훨씬 빠르고,
+  프레임 간 선명도 순위는 그대로 유지됨
+- 프레임들을 프로세스 풀에 나눠 채점 (GIL 밖에서 병렬 처리, 이벤트 루프를 막지 않음)
+- 풀은 첫 /bestcut 요청 때 생성 (gunicorn 워커마다 생기므로 /bestcut 을 받지 않는 워커는
+  cv2/numpy 를 올린 인터프리터를 띄우지 않음)
+
+설정 (환경변수):
+- BLUR_SCORE_WORKERS: gunicorn 워커당 채점 프로세스 수, 기본 2 (CPU 가 1개면 1)
+  전체 프로세스 수는 GUNICORN_WORKERS x BLUR_SCORE_WORKERS
+"""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional
+
+import cv2
+import numpy as np
+
+# ============ 설정 ============
+BLUR_SCORE_WORKERS = int(os.getenv("BLUR_SCORE_WORKERS", str(min(2, os.cpu_count() or 1))))
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def get_blur_score_bytes(data: bytes) -> float:
+    """JPEG 바이트의 블러 점수 (Laplacian 분산, 1/2 해상도 기준). 디코딩 실패 시 0.0"""
+    try:
+        img = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_REDUCED_GRAYSCALE_2)
+        if img is None:
+            return 0.0
+        return float(cv2.Laplacian(img, cv2.CV_64F).var())
+    except Exception as e:
+        print(f"Error calculating blur score: {e}")
+        return 0.0
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn: 서버 프로세스의 스레드/이벤트 루프 상태를 복제하지 않음 (이 모듈만 import)
+            _pool = ProcessPoolExecutor(
+                max_workers=BLUR_SCORE_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+def start_score_pool():
+    """채점 프로세스를 미리 띄움 (벤치마크에서 프로세스 시작 비용을 측정에서 뺄 때)"""
+    pool = _get_pool()
+    for future in [pool.submit(os.getpid) for _ in range(BLUR_SCORE_WORKERS)]:
+        future.result()
+
+
+def shutdown_score_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+async def score_frames(frames: List[bytes]) -> List[float]:
+    """프레임들의 블러 점수를 프로세스 풀에서 병렬로 계산 (입력 순서대로 반환)"""
+    global _pool
+    loop = asyncio.get_running_loop()
+    pool = _get_pool()
+    try:
+        return list(
+            await asyncio.gather(
+                *[loop.run_in_executor(pool, get_blur_score_bytes, frame) for frame in frames]
+            )
+        )
+    except BrokenProcessPool:
+        # 채점 프로세스가 죽으면 다음 요청에서 풀을 새로 만듦
+        with _pool_lock:
+            if _pool is pool:
+                _pool = None
+        raise
@@ -0,0 +1,113 @@
+"""
+결과 이미지 JPEG 인코딩 (한 번 인코딩한 바이트를 파일 저장과 응답에 같이 사용)
+
+업스케일 결과(x4)의 JPEG 인코딩은 추론 다음으로 CPU를 많이 쓰는 단계라,
+같은 이미지를 파일용/응답용으로 두 번 인코딩하지 않도록 encode_jpeg() 로 바이트를 만들고
+write_bytes() 로 저장합니다.
+
+설정 (환경변수):
+- RESULT_JPEG_QUALITY: 품질 1~95 (기본 75, Pillow 기본값과 같음)
+- RESULT_JPEG_PROGRESSIVE: 1이면 progressive JPEG (모바일에서 먼저 흐리게 보임, 보통 조금 작음)
+- RESULT_JPEG_OPTIMIZE: 1이면 허프만 테이블 최적화 (조금 작아지고 인코딩이 느려짐)
+- RESULT_JPEG_BACKEND:
+    pil: Pillow (배포 wheel 은 libjpeg-turbo 로 빌드됨)
+    turbojpeg: PyTurboJPEG 로 libjpeg-turbo 를 직접 호출 (SIMD, Pillow 의 스트림 처리 부담 없음)
+      패키지나 libturbojpeg 가 없으면 경고 후 pil 사용, optimize 옵션은 지원하지 않음
+      (progressive 는 허프만 최적화를 포함)
+"""
+
+import io
+import logging
+import os
+import uuid
+from typing import Optional
+
+import numpy as np
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+# ============ 설정 ============
+RESULT_JPEG_QUALITY = int(os.getenv("RESULT_JPEG_QUALITY", "75"))
+RESULT_JPEG_PROGRESSIVE = os.getenv("RESULT_JPEG_PROGRESSIVE", "0") == "1"
+RESULT_JPEG_OPTIMIZE = os.getenv("RESULT_JPEG_OPTIMIZE", "0") == "1"
+RESULT_JPEG_BACKEND = os.getenv("RESULT_JPEG_BACKEND", "pil")
+
+_turbojpeg = None
+
+
+def _load_turbojpeg():
+    """PyTurboJPEG 인스턴스 (처음 한 번만 로드, 사용할 수 없으면 None)"""
+    global _turbojpeg
+    if _turbojpeg is None:
+        try:
+            from turbojpeg import TurboJPEG
+
+            _turbojpeg = TurboJPEG()
+        except (ImportError, OSError, RuntimeError) as e:
+            logger.warning(f"⚠️ turbojpeg backend unavailable, using Pillow: {e}")
+            _turbojpeg = False
+    return _turbojpeg or None
+
+
+def active_backend(backend: Optional[str] = None) -> str:
+    """실제로 사용할 백엔드 이름 (turbojpeg 를 쓸 수 없으면 pil)"""
+    if (backend or RESULT_JPEG_BACKEND) == "turbojpeg" and _load_turbojpeg() is not None:
+        return "turbojpeg"
+    return "pil"
+
+
+def _encode_turbojpeg(jpeg, image: Image.Image, quality: int, progressive: bool) -> bytes:
+    from turbojpeg import TJFLAG_PROGRESSIVE, TJPF_RGB, TJSAMP_420
+
+    return jpeg.encode(
+        np.asarray(image),
+        quality=quality,
+        pixel_format=TJPF_RGB,
+        jpeg_subsample=TJSAMP_420,  # Pillow 기본값과 같은 4:2:0
+        flags=TJFLAG_PROGRESSIVE if progressive else 0,
+    )
+
+
+def encode_jpeg(
+    image: Image.Image,
+    quality: Optional[int] = None,
+    progressive: Optional[bool] = None,
+    optimize: Optional[bool] = None,
+    backend: Optional[str] = None,
+) -> bytes:
+    """RGB 이미지 → JPEG 바이트 (인자를 주지 않으면 RESULT_JPEG_* 설정 사용)"""
+    quality = RESULT_JPEG_QUALITY if quality is None else quality
+    progressive = RESULT_JPEG_PROGRESSIVE if progressive is None else progressive
+    optimize = RESULT_JPEG_OPTIMIZE if optimize is None else optimize
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+
+    if active_backend(backend) == "turbojpeg":
+        return _encode_turbojpeg(_load_turbojpeg(), image, quality, progressive)
+
+    buffer = io.BytesIO()
+    image.save(
+        buffer, format="JPEG", quality=quality, progressive=progressive, optimize=optimize
+    )
+    return buffer.getvalue()
+
+
+def write_bytes(path: str, data: bytes):
+    """임시 파일에 쓰고 rename (읽는 쪽이 쓰다 만 파일을 보지 않도록)"""
+    tmp_path = f"{path}.{uuid.uuid4().hex}.part"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def save_jpeg(image: Image.Image, path: str) -> bytes:
+    """결과 이미지를 한 번 인코딩해서 path 에 저장하고 그 바이트 반환"""
+    data = encode_jpeg(image)
+    write_bytes(path, data)
+    return data
@@ -0,0 +1,109 @@
+"""
+이미지 파일 응답 (GET /photos/{photo_id})
+
+파일 전체를 메모리로 읽어 Response로 돌려주지 않고:
+- direct (기본): FileResponse로 청크 단위 전송 (요청당 메모리 일정)
+  ETag / Last-Modified, If-None-Match / If-Modified-Since → 304, Range → 206 지원
+- X-Accel-Redirect: X_ACCEL_REDIRECT_PREFIX 를 설정하면 본문 없이 헤더만 반환하고
+  nginx가 internal location에서 sendfile로 직접 전송 (Range/조건부 요청도 nginx가 처리)
+
+stat()은 한 번만, 스레드에서 호출합니다 (이벤트 루프에서 파일 시스템 접근 없음).
+
+설정 (환경변수):
+- X_ACCEL_REDIRECT_PREFIX: nginx internal location 경로 (예: /_storage/), 비어 있으면 direct
+"""
+
+import asyncio
+import os
+from email.utils import parsedate_to_datetime
+from typing import List, Optional, Tuple
+
+from fastapi import Request
+from fastapi.responses import FileResponse, Response
+
+# ============ 설정 ============
+STORAGE_DIR = "storage"
+X_ACCEL_REDIRECT_PREFIX = os.getenv("X_ACCEL_REDIRECT_PREFIX", "")
+
+# 같은 id라도 원본 → 업스케일 결과로 바뀔 수 있으므로 캐시는 하되 매번 재검증 (ETag → 304)
+CACHE_CONTROL = "private, no-cache"
+
+
+def _stat_first(paths: List[Optional[str]]) -> Optional[Tuple[str, os.stat_result]]:
+    """존재하는 첫 번째 파일의 (경로, stat)"""
+    for path in paths:
+        if not path:
+            continue
+        try:
+            return path, os.stat(path)
+        except FileNotFoundError:
+            continue
+    return None
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # 약한 비교 (W/ 접두사 무시)
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in tags
+
+
+def _is_not_modified(request: Request, headers) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, headers["etag"])
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return parsedate_to_datetime(headers["last-modified"]) <= parsedate_to_datetime(
+                if_modified_since
+            )
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+async def first_existing(paths: List[Optional[str]]) -> Optional[str]:
+    """paths 중 존재하는 첫 번째 경로 (stat은 스레드에서)"""
+    found = await asyncio.get_running_loop().run_in_executor(None, _stat_first, paths)
+    return found[0] if found else None
+
+
+async def file_response(
+    request: Request, paths: List[Optional[str]], media_type: str = "image/jpeg"
+) -> Response:
+    """paths 중 존재하는 첫 번째 파일을 응답 (없으면 404)"""
+    found = await asyncio.get_running_loop().run_in_executor(None, _stat_first, paths)
+    if found is None:
+        return Response(status_code=404)
+    path, stat_result = found
+
+    if X_ACCEL_REDIRECT_PREFIX:
+        relative = os.path.relpath(path, STORAGE_DIR)
+        if not relative.startswith(".."):
+            return Response(
+                media_type=media_type,
+                headers={
+                    "X-Accel-Redirect": X_ACCEL_REDIRECT_PREFIX.rstrip("/") + "/" + relative,
+                    "Cache-Control": CACHE_CONTROL,
+                },
+            )
+
+    response = FileResponse(
+        path,
+        media_type=media_type,
+        stat_result=stat_result,
+        headers={"Cache-Control": CACHE_CONTROL},
+    )
+    if _is_not_modified(request, response.headers):
+        return Response(
+            status_code=304,
+            headers={
+                "ETag": response.headers["etag"],
+                "Last-Modified": response.headers["last-modified"],
+                "Cache-Control": CACHE_CONTROL,
+            },
+        )
+    return response
@@ -4,6 +4,14 @@ import numpy as np
 from PIL import Image
 import io
 from app.core.config import settings
+from app.services.inference_engine import BatchInferenceEngine
+from app.services.model_manager import MODEL_PRELOAD, ModelManager
+from app.services.model_server import (
+    INFERENCE_BACKEND,
+    MODEL_SERVER_SOCKET,
+    RemoteInferenceClient,
+)
+from app.services.tiling import TILE_SIZE, load_input, upscale_tiled
 import os
 
 try:
@@ -17,6 +25,7 @@ class ImageService:
     _instance = None
     _model = None
     _device = None
+    _manager = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -25,20 +34,43 @@ class ImageService:
         return cls._instance
 
     def _initialize_model(self):
+        # Weights are loaded on first use (or by MODEL_PRELOAD), not at import time
+        self._manager = ModelManager(
+            self._create_engine,
+            warmup_size=32 if INFERENCE_BACKEND == "remote" else TILE_SIZE,
+            backend=INFERENCE_BACKEND,
+        )
+        if MODEL_PRELOAD:
+            self._manager.start_background_load()
+
+    def _create_engine(self):
+        if INFERENCE_BACKEND == "remote":
+            # The model server process owns the weights; share it instead of loading a copy
+            return RemoteInferenceClient(MODEL_SERVER_SOCKET, scale=settings.MODEL_SCALE)
+
         self._device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
         if RealESRGAN:
             try:
                 self._model = RealESRGAN(self._device, scale=settings.MODEL_SCALE)
-                if os.path.exists(settings.MODEL_PATH):
-                    self._model.load_weights(settings.MODEL_PATH, download=False)
-                else:
-                    print(f"Warning: Model weights not found at {settings.MODEL_PATH}")
+                if not os.path.exists(settings.MODEL_PATH):
+                    raise FileNotFoundError(f"Model weights not found at {settings.MODEL_PATH}")
+                self._model.load_weights(settings.MODEL_PATH, download=False)
             except Exception as e:
+                # Never serve an untrained network; the manager reports FAILED and retries later
                 print(f"Error initializing RealESRGAN: {e}")
                 self._model = None
         else:
             self._model = None
 
+        if self._model is None:
+            return None
+        return BatchInferenceEngine(self._forward_batch, scale=settings.MODEL_SCALE)
+
+    def _forward_batch(self, batch: torch.Tensor) -> torch.Tensor:
+        """Run the RRDBNet on a (N, 3, H, W) batch."""
+        with torch.no_grad():
+            return self._model.model(batch.to(self._device)).clamp_(0, 1).cpu()
+
     def get_blur_score(self, image_bytes: bytes) -> float:
         """Calculate Laplacian variance to determine image sharpness."""
         nparr = np.frombuffer(image_bytes, np.uint8)
@@ -49,18 +81,19 @@ class ImageService:
 
     def upscale_image(self, image_bytes: bytes) -> Image.Image:
         """Upscale image using RealESRGAN."""
-        torch.cuda.empty_cache()
+        # Tiled inference keeps the full UXGA frame.
+        # Large JPEGs are decoded at a reduced scale close to that size.
+        image = load_input(io.BytesIO(image_bytes))
 
-        image = Image.open(io.BytesIO(image_bytes)).convert("RGB")
-
-        # Prevent OOM by resizing if too large
-        max_size = 1080
-        if image.width > max_size or image.height > max_size:
-            image.thumbnail((max_size, max_size), Image.LANCZOS)
-
-        if self._model:
-            with torch.no_grad():
-                sr_image = self._model.predict(image)
+        engine = self._manager.get()
+        if engine:
+            # Peak memory is bounded by the tile size, not the image size
+            sr_image = upscale_tiled(
+                image,
+                engine.infer_many,
+                scale=engine.scale,
+                batch_size=engine.max_batch_size,
+            )
         else:
             # Fallback: just resize x4 if model is missing (for testing)
             print("Warning: RealESRGAN model not loaded. Returning resized image.")
@@ -70,7 +103,6 @@ class ImageService:
             )
             sr_image = image.resize(new_size, Image.BICUBIC)
 
-        torch.cuda.empty_cache()
         return sr_image
 
 
@@ -0,0 +1,192 @@
+"""
+마이크로 배칭 추론 엔진
+
+여러 작업(스레드)이 동시에 요청한 이미지를 모아서 한 번의 forward로 처리합니다.
+- 최대 max_wait_ms 동안 또는 max_batch_size개가 모일 때까지 대기
+- 입력을 pad_multiple 배수 크기로 패딩해서 같은 shape끼리 묶음
+- 배치 결과를 잘라서 각 작업의 Future로 돌려줌
+
+CPU 서버에서는 이미지 한 장당 고정 오버헤드(모델 호출, 스레드 동기화 등)가 크기 때문에
+업로드가 몰릴 때 배치로 묶으면 처리량이 올라갑니다.
+"""
+
+import os
+import queue
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+import torch
+import torch.nn.functional as F
+from PIL import Image
+
+# ============ 설정 ============
+INFERENCE_BATCH_SIZE = int(os.getenv("INFERENCE_BATCH_SIZE", "4"))
+INFERENCE_BATCH_WAIT_MS = float(os.getenv("INFERENCE_BATCH_WAIT_MS", "20"))
+INFERENCE_PAD_MULTIPLE = int(os.getenv("INFERENCE_PAD_MULTIPLE", "32"))
+
+
+def image_to_tensor(image: Image.Image) -> torch.Tensor:
+    """PIL RGB 이미지 → (3, H, W) float 텐서 (0~1)"""
+    array = np.array(image, dtype=np.uint8)
+    return torch.from_numpy(array).permute(2, 0, 1).float().div_(255.0)
+
+
+def tensor_to_image(tensor: torch.Tensor) -> Image.Image:
+    """(3, H, W) float 텐서 (0~1) → PIL RGB 이미지"""
+    array = (
+        tensor.clamp(0, 1).mul(255.0).round().byte().permute(1, 2, 0).cpu().numpy()
+    )
+    return Image.fromarray(array)
+
+
+class _Job:
+    __slots__ = ("tensor", "future", "height", "width")
+
+    def __init__(self, tensor: torch.Tensor):
+        self.tensor = tensor
+        self.future: Future = Future()
+        self.height = tensor.shape[1]
+        self.width = tensor.shape[2]
+
+
+class BatchInferenceEngine:
+    """
+    배치 추론 엔진
+
+    Args:
+        forward_fn: (N, 3, H, W) → (N, 3, H*scale, W*scale) 배치 추론 함수
+        scale: 업스케일 배율
+        max_batch_size: 한 번에 묶을 최대 이미지 수 (M)
+        max_wait_ms: 배치를 채우기 위해 기다리는 최대 시간 (N ms)
+        pad_multiple: 입력을 이 값의 배수로 패딩 (같은 shape끼리 묶기 위함)
+    """
+
+    def __init__(
+        self,
+        forward_fn: Callable[[torch.Tensor], torch.Tensor],
+        scale: int = 4,
+        max_batch_size: int = INFERENCE_BATCH_SIZE,
+        max_wait_ms: float = INFERENCE_BATCH_WAIT_MS,
+        pad_multiple: int = INFERENCE_PAD_MULTIPLE,
+    ):
+        self.forward_fn = forward_fn
+        self.scale = scale
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+        self.pad_multiple = max(1, pad_multiple)
+
+        self._queue: "queue.Queue[_Job]" = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+        # 통계 (배치 크기 분포 확인용)
+        self.batches_run = 0
+        self.images_run = 0
+
+    # ------------------------------------------------------------------
+    # 공개 API
+    # ------------------------------------------------------------------
+    def submit(self, tensor: torch.Tensor) -> Future:
+        """(3, H, W) 텐서를 큐에 넣고 결과 Future 반환"""
+        self._ensure_started()
+        job = _Job(tensor)
+        self._queue.put(job)
+        return job.future
+
+    def infer(self, tensor: torch.Tensor) -> torch.Tensor:
+        """submit 후 결과를 기다림 (동기 호출)"""
+        return self.submit(tensor).result()
+
+    def submit_array(self, array: np.ndarray) -> Future:
+        """uint8 (H, W, 3) 배열을 큐에 넣고 결과 Future 반환 (결과는 (3, H', W') 텐서)"""
+        return self.submit(torch.from_numpy(np.array(array)).permute(2, 0, 1).float() / 255.0)
+
+    def infer_many(self, arrays: List[np.ndarray]) -> List[np.ndarray]:
+        """
+        uint8 (H, W, 3) 배열 여러 개를 한꺼번에 제출하고 결과를 기다림
+        (타일 업스케일용, 결과는 float32 (H*scale, W*scale, 3), 0~255)
+        """
+        futures = [self.submit_array(a) for a in arrays]
+        return [
+            f.result().permute(1, 2, 0).mul_(255.0).cpu().numpy() for f in futures
+        ]
+
+    def upscale(self, image: Image.Image) -> Image.Image:
+        """PIL 이미지를 업스케일 (동기 호출, 다른 작업과 배치로 묶일 수 있음)"""
+        return tensor_to_image(self.infer(image_to_tensor(image)))
+
+    # ------------------------------------------------------------------
+    # 배치 수집 스레드
+    # ------------------------------------------------------------------
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="batch-inference", daemon=True
+                )
+                self._thread.start()
+
+    def _collect(self) -> List[_Job]:
+        """첫 작업을 받은 뒤 max_wait 동안 max_batch_size개까지 모음"""
+        jobs = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(jobs) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                jobs.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return jobs
+
+    def _padded_shape(self, job: _Job) -> Tuple[int, int]:
+        m = self.pad_multiple
+        return (-(-job.height // m) * m, -(-job.width // m) * m)
+
+    def _run(self):
+        while True:
+            jobs = self._collect()
+
+            # 패딩 후 shape이 같은 작업끼리 그룹화
+            groups: Dict[Tuple[int, int], List[_Job]] = defaultdict(list)
+            for job in jobs:
+                groups[self._padded_shape(job)].append(job)
+
+            for shape, group in groups.items():
+                self._run_group(shape, group)
+
+    def _run_group(self, shape: Tuple[int, int], group: List[_Job]):
+        padded_h, padded_w = shape
+        try:
+            batch = torch.stack(
+                [
+                    F.pad(
+                        job.tensor.unsqueeze(0),
+                        (0, padded_w - job.width, 0, padded_h - job.height),
+                        mode="replicate",
+                    ).squeeze(0)
+                    for job in group
+                ]
+            )
+            output = self.forward_fn(batch)
+            self.batches_run += 1
+            self.images_run += len(group)
+
+            for i, job in enumerate(group):
+                # clone: 배치 텐서 전체가 결과에 붙잡혀 있지 않도록
+                job.future.set_result(
+                    output[
+                        i, :, : job.height * self.scale, : job.width * self.scale
+                    ].clone()
+                )
+        except Exception as e:
+            for job in group:
+                if not job.future.done():
+                    job.future.set_exception(e)
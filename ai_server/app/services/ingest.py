@@ -0,0 +1,310 @@
+"""
+스트리밍 업로드 (multipart 본문을 청크 단위로 디스크에 기록)
+
+UploadFile + shutil.copyfileobj 는 요청 본문을 먼저 임시 파일에 다 받은 뒤,
+이벤트 루프 스레드에서 동기 I/O로 한 번 더 복사합니다.
+여기서는 request.stream()을 직접 multipart 파싱하면서
+
+- 파일 파트의 데이터를 버퍼에 모아 스레드에서 기록 (이벤트 루프를 막지 않음)
+- 기록하면서 SHA-256 계산 (같은 스레드에서 처리)
+- 첫 바이트로 JPEG 여부 확인 (FF D8 FF), 아니면 바로 415
+- 크기 제한(MAX_UPLOAD_SIZE)을 받는 도중에 확인, 넘으면 바로 413
+- 임시 파일(.part)에 기록한 뒤 완료 시 최종 경로로 rename (원자적 교체)
+- in_memory=True 이면 디스크에 쓰지 않고 메모리에만 보관
+  (/bestcut: 채점 후 가장 선명한 한 장만 저장, 나머지는 디스크에 쓰지 않음)
+
+설정 (환경변수):
+- MAX_UPLOAD_SIZE: 파일 하나의 최대 크기(byte), 기본 10MB
+- MAX_UPLOAD_FILES: 한 요청에 담을 수 있는 최대 파일 수 (/bestcut), 기본 10
+"""
+
+import asyncio
+import hashlib
+import os
+import time
+import uuid
+from dataclasses import dataclass
+from typing import List, Optional
+
+from fastapi import HTTPException, Request
+from python_multipart.multipart import MultipartParser, parse_options_header
+
+from app.core.metrics import observe_stage, stage_timer
+
+# ============ 설정 ============
+MAX_UPLOAD_SIZE = int(os.getenv("MAX_UPLOAD_SIZE", str(10 * 1024 * 1024)))
+MAX_UPLOAD_FILES = int(os.getenv("MAX_UPLOAD_FILES", "10"))
+ORIGINALS_DIR = "storage/originals"
+
+# 이 크기만큼 모이면 스레드에서 한 번에 기록 (스레드 전환 횟수 감소)
+WRITE_BUFFER_SIZE = 256 * 1024
+# 파일이 아닌 폼 필드는 작은 값만 허용
+MAX_FIELD_SIZE = 64 * 1024
+# multipart 헤더/경계 문자열 여유분
+MULTIPART_OVERHEAD = 16 * 1024
+
+JPEG_MAGIC = b"\xff\xd8\xff"
+
+
+@dataclass
+class StoredUpload:
+    """수신이 끝난 업로드 파일 (디스크의 path 또는 메모리의 data)"""
+
+    field: str
+    filename: Optional[str]
+    path: Optional[str]
+    size: int
+    sha256: Optional[str]  # 메모리 업로드는 content_hash()에서 계산
+    data: Optional[bytes] = None
+
+
+class _FileSink:
+    """파일 파트 하나를 임시 파일에 기록 (해시 계산, 크기/형식 검사 포함)"""
+
+    def __init__(self, field: str, filename: Optional[str], directory: str, max_size: int):
+        self.field = field
+        self.filename = filename
+        self.max_size = max_size
+        self.tmp_path = os.path.join(directory, f".{uuid.uuid4().hex}.part")
+        self.size = 0
+        self._hash = hashlib.sha256()
+        self._buffer = bytearray()
+        self._head = b""
+        self._file = None
+        self.write_seconds = 0.0  # 디스크 기록에 쓴 시간 (메트릭 upload_write)
+
+    async def write(self, data: bytes):
+        self.size += len(data)
+        if self.size > self.max_size:
+            raise HTTPException(
+                status_code=413,
+                detail=f"File too large (max {self.max_size} bytes)",
+            )
+        if len(self._head) < len(JPEG_MAGIC):
+            self._head += data[: len(JPEG_MAGIC) - len(self._head)]
+            if not JPEG_MAGIC.startswith(self._head):
+                raise HTTPException(status_code=415, detail="Only JPEG images are supported")
+
+        self._buffer += data
+        if len(self._buffer) >= WRITE_BUFFER_SIZE:
+            await self._flush()
+
+    async def _flush(self):
+        if not self._buffer:
+            return
+        chunk, self._buffer = bytes(self._buffer), bytearray()
+        await asyncio.get_running_loop().run_in_executor(None, self._write_sync, chunk)
+
+    def _write_sync(self, chunk: bytes):
+        start = time.perf_counter()
+        if self._file is None:
+            self._file = open(self.tmp_path, "wb")
+        self._file.write(chunk)
+        self._hash.update(chunk)
+        self.write_seconds += time.perf_counter() - start
+
+    def _check_complete(self):
+        if self.size < len(JPEG_MAGIC) or self._head != JPEG_MAGIC:
+            raise HTTPException(status_code=415, detail="Only JPEG images are supported")
+
+    async def finish(self) -> StoredUpload:
+        self._check_complete()
+        await self._flush()
+        await asyncio.get_running_loop().run_in_executor(None, self._file.close)
+        observe_stage("upload_write", self.write_seconds)
+        return StoredUpload(
+            field=self.field,
+            filename=self.filename,
+            path=self.tmp_path,
+            size=self.size,
+            sha256=self._hash.hexdigest(),
+        )
+
+    def discard(self):
+        if self._file is not None and not self._file.closed:
+            self._file.close()
+        if os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+
+
+class _MemorySink(_FileSink):
+    """파일 파트를 메모리에만 보관 (크기/형식 검사는 동일)"""
+
+    async def _flush(self):
+        pass  # 버퍼에 계속 모음
+
+    async def finish(self) -> StoredUpload:
+        self._check_complete()
+        return StoredUpload(
+            field=self.field,
+            filename=self.filename,
+            path=None,
+            size=self.size,
+            sha256=None,
+            data=bytes(self._buffer),
+        )
+
+    def discard(self):
+        self._buffer = bytearray()
+
+
+async def receive_uploads(
+    request: Request,
+    field: str,
+    max_files: int = 1,
+    max_size: Optional[int] = None,
+    directory: str = ORIGINALS_DIR,
+    in_memory: bool = False,
+) -> List[StoredUpload]:
+    """
+    multipart 요청 본문에서 field 이름의 파일들을 스트리밍으로 저장
+
+    반환된 파일은 아직 임시 경로(.part)에 있으므로 commit_upload()로 최종 경로에 옮기거나
+    discard_uploads()로 지워야 합니다. 오류가 나면 지금까지 받은 파일은 모두 삭제됩니다.
+    in_memory=True 이면 파일을 upload.data 로만 받고, commit_upload() 할 때 처음 디스크에 씁니다.
+    (최대 메모리 사용량은 max_files * max_size)
+
+    Raises:
+        HTTPException: 413 (크기 초과), 415 (JPEG 아님), 422 (multipart 아님 / 파일 없음)
+    """
+    max_size = max_size or MAX_UPLOAD_SIZE
+    content_type = request.headers.get("content-type", "")
+    ctype, params = parse_options_header(content_type)
+    boundary = params.get(b"boundary")
+    if ctype.lower() != b"multipart/form-data" or not boundary:
+        raise HTTPException(
+            status_code=422, detail=f"Field '{field}' is required (multipart/form-data)"
+        )
+
+    # Content-Length가 있으면 본문을 받기 전에 거절
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit():
+        if int(content_length) > max_files * (max_size + MULTIPART_OVERHEAD):
+            raise HTTPException(status_code=413, detail="Request body too large")
+
+    events: list = []
+    headers: dict = {}
+    header = {"name": b"", "value": b""}
+
+    def on_header_field(data, start, end):
+        header["name"] += data[start:end]
+
+    def on_header_value(data, start, end):
+        header["value"] += data[start:end]
+
+    def on_header_end():
+        headers[header["name"].lower()] = header["value"]
+        header["name"], header["value"] = b"", b""
+
+    def on_headers_finished():
+        _, options = parse_options_header(headers.get(b"content-disposition", b""))
+        filename = options.get(b"filename")
+        events.append(
+            (
+                "begin",
+                options.get(b"name", b"").decode("utf-8", "replace"),
+                filename.decode("utf-8", "replace") if filename is not None else None,
+            )
+        )
+        headers.clear()
+
+    def on_part_data(data, start, end):
+        events.append(("data", data[start:end]))
+
+    def on_part_end():
+        events.append(("end",))
+
+    parser = MultipartParser(
+        boundary,
+        {
+            "on_header_field": on_header_field,
+            "on_header_value": on_header_value,
+            "on_header_end": on_header_end,
+            "on_headers_finished": on_headers_finished,
+            "on_part_data": on_part_data,
+            "on_part_end": on_part_end,
+        },
+    )
+
+    stored: List[StoredUpload] = []
+    sink: Optional[_FileSink] = None
+    skipped = 0  # 대상이 아닌 파트의 크기
+    try:
+        async for chunk in request.stream():
+            parser.write(chunk)
+            for event in events:
+                kind = event[0]
+                if kind == "begin":
+                    name, filename = event[1], event[2]
+                    if name == field and filename is not None:
+                        if len(stored) >= max_files:
+                            raise HTTPException(
+                                status_code=413,
+                                detail=f"Too many files (max {max_files})",
+                            )
+                        sink_class = _MemorySink if in_memory else _FileSink
+                        sink = sink_class(name, filename, directory, max_size)
+                    else:
+                        sink, skipped = None, 0
+                elif kind == "data":
+                    if sink is not None:
+                        await sink.write(event[1])
+                    else:
+                        skipped += len(event[1])
+                        if skipped > MAX_FIELD_SIZE:
+                            raise HTTPException(status_code=413, detail="Form field too large")
+                elif kind == "end" and sink is not None:
+                    stored.append(await sink.finish())
+                    sink = None
+            events.clear()
+        parser.finalize()
+    except BaseException:
+        if sink is not None:
+            sink.discard()
+        discard_uploads(stored)
+        raise
+
+    if not stored:
+        raise HTTPException(status_code=422, detail=f"Field '{field}' is required")
+    return stored
+
+
+async def content_hash(upload: StoredUpload) -> str:
+    """업로드 내용의 SHA-256 (메모리 업로드는 처음 호출할 때 스레드에서 계산)"""
+    if upload.sha256 is None:
+        upload.sha256 = await asyncio.get_running_loop().run_in_executor(
+            None, lambda: hashlib.sha256(upload.data).hexdigest()
+        )
+    return upload.sha256
+
+
+def _write_file_sync(data: bytes, path: str):
+    """임시 파일에 기록한 뒤 path로 rename"""
+    tmp_path = os.path.join(os.path.dirname(path), f".{uuid.uuid4().hex}.part")
+    try:
+        with stage_timer("upload_write"), open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+async def commit_upload(upload: StoredUpload, path: str) -> str:
+    """임시 파일을 최종 경로로 옮김 (같은 파일시스템 안에서 원자적 rename)"""
+    loop = asyncio.get_running_loop()
+    if upload.data is not None:
+        await loop.run_in_executor(None, _write_file_sync, upload.data, path)
+        upload.data = None
+    else:
+        await loop.run_in_executor(None, os.replace, upload.path, path)
+    upload.path = path
+    return path
+
+
+def discard_uploads(uploads: List[StoredUpload]):
+    for upload in uploads:
+        upload.data = None
+        if upload.path and os.path.exists(upload.path):
+            os.remove(upload.path)
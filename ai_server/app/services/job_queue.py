@@ -0,0 +1,252 @@
+"""
+업스케일 작업 큐 (photos 테이블 기반 영속 큐)
+
+- QUEUED 상태의 PhotoRecord를 워커가 점유(claim)해서 처리
+- PostgreSQL: SELECT ... FOR UPDATE SKIP LOCKED 로 워커 간 경합 없이 점유
+- SQLite(테스트): 조건부 UPDATE 로 낙관적 점유 (rowcount 확인)
+- visibility timeout: lease가 만료된 PROCESSING 작업은 다른 워커가 재점유 (크래시 복구)
+- 처리 중 상태 변경(PROCESSING → COMPLETED/FAILED)은 조건부 UPDATE 한 문장씩
+  (레코드를 읽어 와서 고치지 않음, 추론하는 동안 세션/커넥션을 잡지 않도록)
+  점유한 워커(locked_by)만 바꿀 수 있음 → lease가 만료돼 다른 워커가 재점유한 작업을
+  이전 워커가 덮어쓰지 않음
+- 상태가 바뀌면 같은 트랜잭션에서 status_events 이벤트 발행 (커밋될 때 구독자에게 전달)
+"""
+
+import datetime
+import os
+from typing import List, Optional, Tuple
+
+from sqlalchemy import and_, func, or_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from models import PhotoRecord, ProcessingStatus
+from app.services import status_events
+
+# ============ 설정 ============
+JOB_VISIBILITY_TIMEOUT_SECONDS = int(os.getenv("JOB_VISIBILITY_TIMEOUT_SECONDS", "300"))
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+
+
+def _utcnow() -> datetime.datetime:
+    # created_at과 같은 naive UTC 사용
+    return datetime.datetime.utcnow()
+
+
+def _claimable(now: datetime.datetime):
+    """점유 가능한 작업 조건: QUEUED 이거나, lease가 만료된 PROCESSING"""
+    return or_(
+        PhotoRecord.status == ProcessingStatus.QUEUED,
+        and_(
+            PhotoRecord.status == ProcessingStatus.PROCESSING,
+            PhotoRecord.locked_until < now,
+            PhotoRecord.attempts < JOB_MAX_ATTEMPTS,
+        ),
+    )
+
+
+async def claim_jobs(
+    db: AsyncSession,
+    worker_id: str,
+    limit: int = 1,
+    visibility_timeout: int = JOB_VISIBILITY_TIMEOUT_SECONDS,
+) -> List[PhotoRecord]:
+    """
+    큐에서 최대 limit개의 작업을 점유
+
+    Returns:
+        점유에 성공한 PhotoRecord 목록 (status=PROCESSING, locked_by=worker_id)
+    """
+    now = _utcnow()
+    query = (
+        select(PhotoRecord.id)
+        .where(_claimable(now))
+        .order_by(PhotoRecord.created_at)
+        .limit(limit)
+    )
+    if db.bind.dialect.name == "postgresql":
+        # 다른 워커가 잠근 행은 건너뜀
+        query = query.with_for_update(skip_locked=True)
+
+    candidate_ids = (await db.execute(query)).scalars().all()
+
+    claimed_ids = []
+    for photo_id in candidate_ids:
+        # 조건부 UPDATE: 그 사이 다른 워커가 가져갔다면 rowcount == 0
+        result = await db.execute(
+            update(PhotoRecord)
+            .where(PhotoRecord.id == photo_id, _claimable(now))
+            .values(
+                status=ProcessingStatus.PROCESSING,
+                locked_by=worker_id,
+                locked_until=now + datetime.timedelta(seconds=visibility_timeout),
+                attempts=PhotoRecord.attempts + 1,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 1:
+            claimed_ids.append(photo_id)
+            await status_events.publish(db, photo_id, ProcessingStatus.PROCESSING)
+    await db.commit()
+
+    if not claimed_ids:
+        return []
+
+    result = await db.execute(
+        select(PhotoRecord)
+        .where(PhotoRecord.id.in_(claimed_ids))
+        .order_by(PhotoRecord.created_at)
+        .execution_options(populate_existing=True)
+    )
+    return list(result.scalars().all())
+
+
+async def extend_lease(
+    db: AsyncSession,
+    photo_id: str,
+    worker_id: str,
+    visibility_timeout: int = JOB_VISIBILITY_TIMEOUT_SECONDS,
+) -> bool:
+    """처리 중인 작업의 lease 연장 (heartbeat). 점유를 잃었으면 False"""
+    result = await db.execute(
+        update(PhotoRecord)
+        .where(
+            PhotoRecord.id == photo_id,
+            PhotoRecord.locked_by == worker_id,
+            PhotoRecord.status == ProcessingStatus.PROCESSING,
+        )
+        .values(
+            locked_until=_utcnow() + datetime.timedelta(seconds=visibility_timeout)
+        )
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return result.rowcount == 1
+
+
+async def release_jobs(db: AsyncSession, worker_id: str) -> int:
+    """워커 종료 시 처리하지 못한 작업을 QUEUED로 되돌림"""
+    result = await db.execute(
+        update(PhotoRecord)
+        .where(
+            PhotoRecord.locked_by == worker_id,
+            PhotoRecord.status == ProcessingStatus.PROCESSING,
+        )
+        .values(
+            status=ProcessingStatus.QUEUED,
+            locked_by=None,
+            locked_until=None,
+            attempts=PhotoRecord.attempts - 1,
+        )
+        .returning(PhotoRecord.id)
+        .execution_options(synchronize_session=False)
+    )
+    released = result.scalars().all()
+    for photo_id in released:
+        await status_events.publish(db, photo_id, ProcessingStatus.QUEUED)
+    await db.commit()
+    return len(released)
+
+
+async def fail_exhausted_jobs(
+    db: AsyncSession, max_attempts: int = JOB_MAX_ATTEMPTS
+) -> int:
+    """재시도 횟수를 모두 쓴 채 lease가 만료된 작업을 FAILED 처리"""
+    error_message = f"Worker lease expired {max_attempts} times"
+    result = await db.execute(
+        update(PhotoRecord)
+        .where(
+            PhotoRecord.status == ProcessingStatus.PROCESSING,
+            PhotoRecord.locked_until < _utcnow(),
+            PhotoRecord.attempts >= max_attempts,
+        )
+        .values(
+            status=ProcessingStatus.FAILED,
+            error_message=error_message,
+            locked_by=None,
+            locked_until=None,
+        )
+        .returning(PhotoRecord.id)
+        .execution_options(synchronize_session=False)
+    )
+    failed = result.scalars().all()
+    for photo_id in failed:
+        await status_events.publish(db, photo_id, ProcessingStatus.FAILED, error_message)
+    await db.commit()
+    return len(failed)
+
+
+def _owned_by(photo_id: str, worker_id: str):
+    """worker_id 가 점유 중인 PROCESSING 작업 조건 (extend_lease 와 같음)"""
+    return and_(
+        PhotoRecord.id == photo_id,
+        PhotoRecord.locked_by == worker_id,
+        PhotoRecord.status == ProcessingStatus.PROCESSING,
+    )
+
+
+async def mark_processing(
+    db: AsyncSession, photo_id: str, worker_id: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    점유 확인 + content_hash 조회 (UPDATE ... RETURNING 한 문장)
+
+    Returns:
+        (레코드가 있고 아직 이 워커가 점유 중인지, content_hash)
+        커밋은 호출하는 쪽에서 (결과 캐시 조회와 같은 트랜잭션으로 묶기 위해)
+    """
+    result = await db.execute(
+        update(PhotoRecord)
+        .where(_owned_by(photo_id, worker_id))
+        .values(status=ProcessingStatus.PROCESSING)
+        .returning(PhotoRecord.content_hash)
+        .execution_options(synchronize_session=False)
+    )
+    row = result.first()
+    return (row is not None, row[0] if row else None)
+
+
+async def mark_completed(
+    db: AsyncSession, photo_id: str, worker_id: str, upscaled_path: str, model_version: str
+) -> bool:
+    """PROCESSING → COMPLETED. 그 사이 삭제됐거나 다른 상태가 됐거나 점유를 잃었으면 False"""
+    result = await db.execute(
+        update(PhotoRecord)
+        .where(_owned_by(photo_id, worker_id))
+        .values(
+            status=ProcessingStatus.COMPLETED,
+            upscaled_path=upscaled_path,
+            model_version=model_version,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount == 1:
+        await status_events.publish(db, photo_id, ProcessingStatus.COMPLETED)
+    await db.commit()
+    return result.rowcount == 1
+
+
+async def mark_failed(
+    db: AsyncSession, photo_id: str, worker_id: str, error_message: str
+) -> bool:
+    """PROCESSING → FAILED. 이미 다른 상태거나 점유를 잃었으면 False"""
+    result = await db.execute(
+        update(PhotoRecord)
+        .where(_owned_by(photo_id, worker_id))
+        .values(status=ProcessingStatus.FAILED, error_message=error_message)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount == 1:
+        await status_events.publish(db, photo_id, ProcessingStatus.FAILED, error_message)
+    await db.commit()
+    return result.rowcount == 1
+
+
+async def count_queued(db: AsyncSession) -> int:
+    """대기 중인 작업 수 (큐 깊이)"""
+    result = await db.execute(
+        select(func.count())
+        .select_from(PhotoRecord)
+        .where(PhotoRecord.status == ProcessingStatus.QUEUED)
+    )
+    return result.scalar_one()
@@ -0,0 +1,79 @@
+"""
+업스케일 모델 로드 (ModelManager 연결)
+
+DB를 import 하지 않으므로 모델 서버 프로세스(model_server.py)는 DATABASE_URL 없이 실행됩니다.
+torch/RealESRGAN 은 로컬 로드할 때만 import 합니다.
+"""
+
+from app.services.model_manager import ModelManager
+from app.services.model_server import (
+    INFERENCE_BACKEND,
+    MODEL_SERVER_SOCKET,
+    RemoteInferenceClient,
+)
+from app.services.tiling import TILE_SIZE
+
+device = None
+model = None
+
+
+def _load_local_engine():
+    """
+    이 프로세스 안에서 RealESRGAN 로드 → BatchInferenceEngine 반환 (실패 시 None)
+
+    torch/RealESRGAN은 여기서만 import 합니다.
+    (remote 모드 프로세스는 torch 런타임 메모리를 쓰지 않음)
+    """
+    global device, model
+    import torch
+
+    from app.services.inference_engine import BatchInferenceEngine
+
+    # RealESRGAN import (모듈 없으면 None)
+    try:
+        from RealESRGAN import RealESRGAN
+    except ImportError:
+        print("⚠️ Warning: RealESRGAN module not found. AI features will be disabled.")
+        return None
+
+    # GPU 가속 설정
+    device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+    try:
+        model = RealESRGAN(device, scale=4)
+        model.load_weights("weights/RealESRGAN_x4.pth", download=True)
+        print("✅ RealESRGAN model loaded successfully!")
+    except Exception as e:
+        # 가중치 없이 만들어진 네트워크로 추론하지 않도록 버림 (→ failed, 재시도 간격 후 다시 로드)
+        print(f"❌ Error loading RealESRGAN: {e}")
+        model = None
+        return None
+
+    # 동시에 처리 중인 작업들의 추론을 한 번의 forward로 묶어 실행
+    return BatchInferenceEngine(_forward_batch, scale=4)
+
+
+def _forward_batch(batch):
+    """배치 추론: (N, 3, H, W) → (N, 3, 4H, 4W), RRDBNet을 직접 호출"""
+    import torch
+
+    with torch.no_grad():
+        return model.model(batch.to(device)).clamp_(0, 1).cpu()
+
+
+def _create_engine():
+    # remote 모드에서는 모델 서버 프로세스가 모델을 소유하고,
+    # 여러 프로세스의 요청을 한 배치로 묶어 실행
+    if INFERENCE_BACKEND == "remote":
+        print(f"🔌 Using model server at {MODEL_SERVER_SOCKET}")
+        return RemoteInferenceClient(MODEL_SERVER_SOCKET, scale=4)
+    return _load_local_engine()
+
+
+# import 시점에는 로드하지 않음 (첫 사용 시 또는 MODEL_PRELOAD/워커 시작 시 로드)
+# 워밍업: local은 타일 크기 입력으로 실제 작업 크기만큼 할당,
+#         remote는 작은 입력으로 모델 서버 연결만 확인 (서버는 자체 워밍업)
+model_manager = ModelManager(
+    _create_engine,
+    warmup_size=32 if INFERENCE_BACKEND == "remote" else TILE_SIZE,
+    backend=INFERENCE_BACKEND,
+)
@@ -0,0 +1,152 @@
+"""
+모델 수명주기 관리 (지연 로드 + 워밍업 + 상태 보고)
+
+모듈 import 시점에 모델을 로드하면 앱 import가 막히고(가중치 다운로드 포함),
+테스트도 매번 느려집니다. ModelManager는 로드를 명시적인 단계로 분리합니다.
+
+    not_loaded → loading → ready
+                        ↘ failed (MODEL_LOAD_RETRY_SECONDS 후 다시 시도)
+
+- get(): 처음 호출될 때 로드 (지연 로드), 이미 로드 중이면 끝날 때까지 대기
+- start_background_load(): 백그라운드 스레드에서 미리 로드 (MODEL_PRELOAD)
+- 로드 직후 더미 입력으로 워밍업 추론 1회 → 첫 요청에서 메모리 할당/커널 선택 비용이 나가지 않음
+- status(): /health 에 노출할 상태 (state, load_seconds, warmup_ms, error)
+- 로드 시간은 /metrics 의 petcam_model_load_seconds 로도 기록
+
+설정 (환경변수):
+- MODEL_PRELOAD: 1이면 API 시작 시 백그라운드에서 모델 로드 (기본 0 = 첫 사용 시 로드)
+- MODEL_LOAD_RETRY_SECONDS: 로드 실패 후 다시 시도하기까지 대기 시간(초)
+"""
+
+import enum
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+from app.core.metrics import MODEL_LOAD_SECONDS
+
+logger = logging.getLogger(__name__)
+
+# ============ 설정 ============
+MODEL_PRELOAD = os.getenv("MODEL_PRELOAD", "0") == "1"
+MODEL_LOAD_RETRY_SECONDS = float(os.getenv("MODEL_LOAD_RETRY_SECONDS", "30"))
+
+
+class ModelState(str, enum.Enum):
+    NOT_LOADED = "not_loaded"
+    LOADING = "loading"
+    READY = "ready"
+    FAILED = "failed"
+
+
+class ModelManager:
+    """
+    추론 엔진 하나의 수명주기를 관리
+
+    Args:
+        loader: 엔진(infer_many를 가진 객체)을 만들어 반환하는 함수, 사용할 수 없으면 None
+        warmup_size: 워밍업 입력 크기(px), 0이면 워밍업 생략
+        backend: 상태 보고용 백엔드 이름 (local / remote)
+        retry_seconds: 실패 후 재시도까지 대기 시간
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], Any],
+        warmup_size: int = 64,
+        backend: str = "local",
+        retry_seconds: float = MODEL_LOAD_RETRY_SECONDS,
+    ):
+        self.loader = loader
+        self.warmup_size = warmup_size
+        self.backend = backend
+        self.retry_seconds = retry_seconds
+
+        self.state = ModelState.NOT_LOADED
+        self.load_seconds: Optional[float] = None
+        self.warmup_ms: Optional[float] = None
+        self.error: Optional[str] = None
+
+        self._engine = None
+        self._failed_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self.state == ModelState.READY
+
+    def get(self):
+        """엔진 반환 (필요하면 로드). 사용할 수 없으면 None"""
+        if self.state == ModelState.READY:
+            return self._engine
+        if self._recently_failed():
+            return None
+        return self.load()
+
+    def _recently_failed(self) -> bool:
+        return (
+            self.state == ModelState.FAILED
+            and time.monotonic() - self._failed_at < self.retry_seconds
+        )
+
+    def load(self, force: bool = False):
+        """
+        로드 + 워밍업 (동시에 호출되면 한 번만 실행하고 나머지는 대기)
+
+        force=True면 최근에 실패했어도 바로 다시 시도합니다.
+        """
+        with self._lock:
+            if self.state == ModelState.READY:
+                return self._engine
+            if not force and self._recently_failed():
+                # 대기하던 다른 호출이 방금 실패했으면 재시도하지 않음
+                return None
+
+            self.state = ModelState.LOADING
+            self.error = None
+            start = time.perf_counter()
+            try:
+                engine = self.loader()
+                if engine is None:
+                    raise RuntimeError("model is not available")
+                self.load_seconds = round(time.perf_counter() - start, 3)
+                MODEL_LOAD_SECONDS.labels(self.backend).set(self.load_seconds)
+
+                if self.warmup_size > 0:
+                    dummy = np.zeros((self.warmup_size, self.warmup_size, 3), np.uint8)
+                    start = time.perf_counter()
+                    engine.infer_many([dummy])
+                    self.warmup_ms = round((time.perf_counter() - start) * 1000, 1)
+            except Exception as e:
+                self.state = ModelState.FAILED
+                self.error = str(e)
+                self._failed_at = time.monotonic()
+                logger.error(f"❌ Model load failed ({self.backend}): {e}")
+                return None
+
+            self._engine = engine
+            self.state = ModelState.READY
+            logger.info(
+                f"✅ Model ready ({self.backend}): load {self.load_seconds}s, "
+                f"warm-up {self.warmup_ms}ms"
+            )
+            return engine
+
+    def start_background_load(self) -> threading.Thread:
+        """백그라운드 스레드에서 로드 시작 (이벤트 루프를 막지 않음)"""
+        thread = threading.Thread(target=self.load, name="model-loader", daemon=True)
+        thread.start()
+        return thread
+
+    def status(self) -> dict:
+        return {
+            "state": self.state.value,
+            "backend": self.backend,
+            "load_seconds": self.load_seconds,
+            "warmup_ms": self.warmup_ms,
+            "error": self.error,
+        }
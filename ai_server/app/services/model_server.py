@@ -0,0 +1,237 @@
+"""
+모델 서버 (호스트당 모델 1개를 여러 프로세스가 공유)
+
+gunicorn 워커나 업스케일 워커가 각자 RealESRGAN 가중치를 로드하면
+프로세스 수만큼 메모리를 쓰고 매번 로드 시간을 기다려야 합니다.
+모델 서버 모드에서는 한 프로세스만 모델을 소유하고,
+다른 프로세스는 로컬 Unix 소켓으로 추론을 요청합니다.
+
+- 서버: ModelServer (asyncio Unix 소켓 서버, 요청은 BatchInferenceEngine으로 배치 처리)
+- 클라이언트: RemoteInferenceClient (BatchInferenceEngine과 같은 infer_many/upscale 인터페이스)
+  torch를 import하지 않으므로 클라이언트 프로세스는 torch 런타임 메모리를 쓰지 않습니다.
+
+프로토콜 (요청/응답 공통 프레임):
+    [header 길이 4B][payload 길이 4B][header JSON][payload]
+    - infer 요청: {"op": "infer", "h": H, "w": W} + uint8 RGB (H*W*3)
+    - infer 응답: {"ok": true, "h": H*s, "w": W*s} + uint8 RGB
+    - ping 요청/응답: {"op": "ping"} / {"ok": true, "scale": s, "pid": ...}
+    한 연결에서 여러 요청을 연달아 보내면(pipelining) 응답은 요청 순서대로 돌아옵니다.
+
+설정 (환경변수):
+- INFERENCE_BACKEND: "local"(프로세스 안에서 모델 로드, 기본) 또는 "remote"(모델 서버 사용)
+- MODEL_SERVER_SOCKET: 모델 서버 Unix 소켓 경로
+"""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import struct
+import threading
+from typing import List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+# ============ 설정 ============
+INFERENCE_BACKEND = os.getenv("INFERENCE_BACKEND", "local")
+MODEL_SERVER_SOCKET = os.getenv("MODEL_SERVER_SOCKET", "/tmp/petcam-model.sock")
+MODEL_SERVER_TIMEOUT = float(os.getenv("MODEL_SERVER_TIMEOUT", "120"))
+# 클라이언트가 한 번에 보내는 타일 수 (inference_engine과 같은 설정을 torch import 없이 읽음)
+INFERENCE_BATCH_SIZE = int(os.getenv("INFERENCE_BATCH_SIZE", "4"))
+
+_FRAME = struct.Struct("!II")
+
+
+# ============ 프레임 인코딩 ============
+def _encode_frame(header: dict, payload: bytes = b"") -> bytes:
+    header_bytes = json.dumps(header).encode()
+    return _FRAME.pack(len(header_bytes), len(payload)) + header_bytes + payload
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        n = sock.recv_into(view[received:], size - received)
+        if n == 0:
+            raise ConnectionError("Model server closed the connection")
+        received += n
+    return bytes(buffer)
+
+
+def _recv_frame(sock: socket.socket) -> Tuple[dict, bytes]:
+    header_len, payload_len = _FRAME.unpack(_recv_exact(sock, _FRAME.size))
+    header = json.loads(_recv_exact(sock, header_len))
+    payload = _recv_exact(sock, payload_len) if payload_len else b""
+    return header, payload
+
+
+async def _read_frame(reader: asyncio.StreamReader) -> Tuple[dict, bytes]:
+    header_len, payload_len = _FRAME.unpack(await reader.readexactly(_FRAME.size))
+    header = json.loads(await reader.readexactly(header_len))
+    payload = await reader.readexactly(payload_len) if payload_len else b""
+    return header, payload
+
+
+# ============ 서버 ============
+class ModelServer:
+    """
+    모델을 소유하는 프로세스에서 실행되는 추론 서버
+
+    Args:
+        engine: 실제 추론을 수행하는 BatchInferenceEngine
+        socket_path: Unix 소켓 경로
+    """
+
+    def __init__(self, engine, socket_path: str = MODEL_SERVER_SOCKET):
+        self.engine = engine
+        self.socket_path = socket_path
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self):
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)  # 이전 프로세스가 남긴 소켓 파일
+        os.makedirs(os.path.dirname(self.socket_path) or ".", exist_ok=True)
+        self._server = await asyncio.start_unix_server(self._handle, path=self.socket_path)
+        logger.info(f"🧠 Model server listening on {self.socket_path}")
+
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        # 요청은 읽는 즉시 엔진에 제출(→ 다른 연결의 요청과 배치로 묶임),
+        # 응답은 요청 순서대로 전송
+        pending: asyncio.Queue = asyncio.Queue()
+
+        async def respond():
+            while True:
+                task = await pending.get()
+                if task is None:
+                    return
+                header, payload = await task
+                writer.write(_encode_frame(header, payload))
+                await writer.drain()
+
+        responder = asyncio.create_task(respond())
+        try:
+            while True:
+                try:
+                    header, payload = await _read_frame(reader)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                pending.put_nowait(asyncio.ensure_future(self._dispatch(header, payload)))
+        finally:
+            pending.put_nowait(None)
+            try:
+                await responder
+            except ConnectionError:
+                pass
+            writer.close()
+
+    async def _dispatch(self, header: dict, payload: bytes) -> Tuple[dict, bytes]:
+        op = header.get("op")
+        try:
+            if op == "ping":
+                return {"ok": True, "scale": self.engine.scale, "pid": os.getpid()}, b""
+            if op == "infer":
+                h, w = int(header["h"]), int(header["w"])
+                array = np.frombuffer(payload, dtype=np.uint8).reshape(h, w, 3)
+                result = await asyncio.wrap_future(self.engine.submit_array(array))
+                out = result.clamp(0, 1).mul(255.0).round().byte().permute(1, 2, 0)
+                out = np.ascontiguousarray(out.cpu().numpy())
+                return {"ok": True, "h": out.shape[0], "w": out.shape[1]}, out.tobytes()
+            return {"ok": False, "error": f"Unknown op: {op}"}, b""
+        except Exception as e:
+            logger.error(f"❌ Model server request failed: {e}")
+            return {"ok": False, "error": str(e)}, b""
+
+
+# ============ 클라이언트 ============
+class RemoteInferenceClient:
+    """
+    모델 서버에 추론을 요청하는 클라이언트 (BatchInferenceEngine 대체용)
+
+    스레드마다 연결을 하나씩 유지합니다. (process_image_sync는 executor 스레드에서 실행)
+    """
+
+    def __init__(
+        self,
+        socket_path: str = MODEL_SERVER_SOCKET,
+        scale: int = 4,
+        max_batch_size: int = INFERENCE_BATCH_SIZE,
+        timeout: float = MODEL_SERVER_TIMEOUT,
+    ):
+        self.socket_path = socket_path
+        self.scale = scale
+        self.max_batch_size = max_batch_size
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self) -> socket.socket:
+        sock = getattr(self._local, "sock", None)
+        if sock is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            sock.connect(self.socket_path)
+            self._local.sock = sock
+        return sock
+
+    def _reset(self):
+        sock = getattr(self._local, "sock", None)
+        if sock is not None:
+            sock.close()
+            self._local.sock = None
+
+    def ping(self) -> dict:
+        try:
+            sock = self._connection()
+            sock.sendall(_encode_frame({"op": "ping"}))
+            return _recv_frame(sock)[0]
+        except (OSError, ConnectionError):
+            self._reset()
+            raise
+
+    def infer_many(self, arrays: List[np.ndarray]) -> List[np.ndarray]:
+        """uint8 (H, W, 3) 목록 → float32 (H*s, W*s, 3) 목록 (0~255)"""
+        try:
+            sock = self._connection()
+            for array in arrays:
+                array = np.ascontiguousarray(array, dtype=np.uint8)
+                header = {"op": "infer", "h": array.shape[0], "w": array.shape[1]}
+                sock.sendall(_encode_frame(header, array.tobytes()))
+
+            results, error = [], None
+            for _ in arrays:
+                header, payload = _recv_frame(sock)
+                if not header.get("ok"):
+                    error = header.get("error", "Model server error")
+                    continue
+                out = np.frombuffer(payload, dtype=np.uint8)
+                results.append(out.reshape(header["h"], header["w"], 3).astype(np.float32))
+        except (OSError, ConnectionError):
+            self._reset()
+            raise
+
+        if error:
+            raise RuntimeError(error)
+        return results
+
+    def upscale(self, image: Image.Image) -> Image.Image:
+        out = self.infer_many([np.asarray(image.convert("RGB"))])[0]
+        return Image.fromarray(out.astype(np.uint8))
@@ -0,0 +1,64 @@
+"""
+GET /photos 키셋(커서) 페이지네이션
+
+OFFSET은 앞 페이지의 행을 모두 읽고 버리므로 뒤 페이지일수록 느려집니다.
+커서는 마지막으로 받은 행의 (created_at, id)를 담고, 다음 페이지는
+owner_id = 사용자 AND (created_at, id) < 커서 조건으로 ix_photos_owner_created_at 인덱스에서
+바로 이어서 읽습니다 (전체 행 수나 사용자 수와 무관하게 페이지 크기만큼만 읽음).
+
+- 커서는 불투명한 문자열 (base64url), 클라이언트는 받은 값을 그대로 다시 보냄
+- 정렬: created_at DESC, id DESC (같은 시각에 만든 행도 순서가 고정됨)
+"""
+
+import base64
+import datetime
+import uuid
+from typing import Optional, Tuple
+
+from sqlalchemy import tuple_
+from sqlalchemy.future import select
+from sqlalchemy.sql import Select
+
+from models import PhotoRecord
+
+
+def encode_cursor(created_at: datetime.datetime, photo_id: str) -> str:
+    raw = f"{created_at.isoformat()}|{photo_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime.datetime, str]:
+    """커서 → (created_at, id). 형식이 잘못되면 ValueError"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, photo_id = raw.split("|", 1)
+        return datetime.datetime.fromisoformat(created_at), photo_id
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
+def photos_page_query(
+    owner_id: uuid.UUID, cursor: Optional[str], skip: int, limit: int
+) -> Select:
+    """사용자의 사진 목록 한 페이지 조회 쿼리 (cursor가 있으면 키셋, 없으면 skip부터)"""
+    query = (
+        select(PhotoRecord)
+        .where(PhotoRecord.owner_id == owner_id)
+        .order_by(PhotoRecord.created_at.desc(), PhotoRecord.id.desc())
+    )
+    if cursor:
+        created_at, photo_id = decode_cursor(cursor)
+        query = query.where(
+            tuple_(PhotoRecord.created_at, PhotoRecord.id) < tuple_(created_at, photo_id)
+        )
+    elif skip:
+        query = query.offset(skip)
+    return query.limit(limit)
+
+
+def next_cursor(photos: list, limit: int) -> Optional[str]:
+    """페이지가 가득 찼으면 마지막 행의 커서 (더 없으면 None)"""
+    if len(photos) < limit:
+        return None
+    last = photos[-1]
+    return encode_cursor(last.created_at, last.id)
@@ -0,0 +1,110 @@
+"""
+인증된 사용자(principal) 캐시 (토큰 subject 기준)
+
+휴대폰마다 /photos 를 분당 최대 60번 폴링하고, 보호된 요청마다 get_current_user 가
+JWT 검증 후 users 테이블을 조회합니다. 같은 사용자를 짧은 시간 동안 다시 조회하지 않도록
+조회 결과(User)를 프로세스 메모리에 보관합니다.
+
+- 키: 토큰의 sub (username), 값: 조회한 User (세션에서 분리된 객체, 읽기 전용으로 사용)
+- TTL(PRINCIPAL_CACHE_TTL 초)이 지나면 다시 조회, 최대 PRINCIPAL_CACHE_SIZE 명 (LRU로 제거)
+- 사용자가 비활성화/삭제되면 그 사용자 항목을 즉시 제거 (ORM 업데이트/삭제 이벤트)
+  다른 프로세스(워커)의 캐시는 TTL 이 지나야 반영됨
+- 존재하지 않는 사용자는 캐시하지 않음
+- 적중/미스 횟수는 프로세스별 카운터로 /health 에 노출
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from sqlalchemy import event, inspect
+
+from app.models.user import User
+
+# ============ 설정 ============
+# 0이면 캐시 사용 안 함 (매 요청 DB 조회)
+PRINCIPAL_CACHE_TTL = float(os.getenv("PRINCIPAL_CACHE_TTL", "60"))
+PRINCIPAL_CACHE_SIZE = int(os.getenv("PRINCIPAL_CACHE_SIZE", "1024"))
+
+
+class PrincipalCache:
+    """크기 제한 LRU + TTL 캐시 (스레드 안전)"""
+
+    def __init__(self, ttl: float, maxsize: int):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.maxsize > 0
+
+    def get(self, username: str) -> Optional[User]:
+        """캐시된 사용자 (없거나 만료됐으면 None, 미스로 기록)"""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(username)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(username)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[username]
+            self.misses += 1
+            return None
+
+    def put(self, username: str, user: User):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[username] = (time.monotonic() + self.ttl, user)
+            self._entries.move_to_end(username)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, username: str):
+        with self._lock:
+            if self._entries.pop(username, None) is not None:
+                self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "ttl_seconds": self.ttl,
+                "size": len(self._entries),
+                "max_size": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            }
+
+
+principals = PrincipalCache(PRINCIPAL_CACHE_TTL, PRINCIPAL_CACHE_SIZE)
+
+
+# ============ 무효화 ============
+@event.listens_for(User, "after_update")
+def _invalidate_on_update(mapper, connection, target: User):
+    # 비활성화, username 변경 모두 이전 키로 캐시된 항목을 제거
+    state = inspect(target)
+    for key in state.attrs.username.history.deleted or ():
+        principals.invalidate(key)
+    principals.invalidate(target.username)
+
+
+@event.listens_for(User, "after_delete")
+def _invalidate_on_delete(mapper, connection, target: User):
+    principals.invalidate(target.username)
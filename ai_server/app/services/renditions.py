@@ -0,0 +1,136 @@
+"""
+갤러리용 렌디션 (썸네일 / 중간 크기 / 전체)
+
+목록 화면에서 4배 업스케일 결과 전체를 받지 않도록 작은 버전을 만들어 둡니다.
+
+- thumb: 긴 변 RENDITION_THUMB_SIZE (기본 256px), 그리드 타일용
+- medium: 긴 변 RENDITION_MEDIUM_SIZE (기본 1280px), 상세 미리보기용
+- full: 원래 파일 (jpeg 이외 형식을 요청하면 같은 크기로 변환)
+- 형식: jpeg(기본), webp, avif (Pillow가 지원하는 경우만)
+
+워커가 업스케일 직후 메모리에 있는 결과로 RENDITION_PREGENERATE 형식의 thumb/medium을 만들고,
+그 외 조합이나 파일이 없을 때는 요청 시 만들어서 저장해 둡니다 (다음 요청부터 파일 그대로 전송).
+렌디션은 원본 파일 경로 기준이므로 결과 캐시로 공유된 파일도 한 번만 만듭니다.
+
+설정 (환경변수):
+- RENDITION_THUMB_SIZE, RENDITION_MEDIUM_SIZE: 긴 변 크기(px)
+- RENDITION_PREGENERATE: 업스케일 직후 미리 만들 형식 (쉼표 구분, 기본 jpeg, 비우면 안 만듦)
+"""
+
+import asyncio
+import glob
+import os
+import uuid
+from typing import Dict, Optional
+
+from PIL import Image, ImageOps, features
+
+# ============ 설정 ============
+RENDITIONS_DIR = "storage/renditions"
+RENDITION_SIZES: Dict[str, Optional[int]] = {
+    "thumb": int(os.getenv("RENDITION_THUMB_SIZE", "256")),
+    "medium": int(os.getenv("RENDITION_MEDIUM_SIZE", "1280")),
+    "full": None,
+}
+RENDITION_PREGENERATE = [
+    fmt.strip() for fmt in os.getenv("RENDITION_PREGENERATE", "jpeg").split(",") if fmt.strip()
+]
+
+# 형식 → (Pillow 형식, 확장자, MIME, 저장 옵션)
+FORMATS = {
+    "jpeg": ("JPEG", "jpg", "image/jpeg", {"quality": 85, "progressive": True}),
+    "webp": ("WEBP", "webp", "image/webp", {"quality": 80, "method": 4}),
+    "avif": ("AVIF", "avif", "image/avif", {"quality": 60, "speed": 8}),
+}
+
+# 같은 렌디션을 동시에 요청하면 한 번만 생성 (프로세스 단위)
+_pending: Dict[str, asyncio.Future] = {}
+
+
+def is_supported(fmt: str) -> bool:
+    if fmt not in FORMATS:
+        return False
+    return fmt == "jpeg" or features.check(fmt)
+
+
+def media_type(fmt: str) -> str:
+    return FORMATS[fmt][2]
+
+
+def _prefix(source_path: str) -> str:
+    parent = os.path.basename(os.path.dirname(source_path))
+    stem = os.path.splitext(os.path.basename(source_path))[0]
+    return os.path.join(RENDITIONS_DIR, parent, stem)
+
+
+def rendition_path(source_path: str, size: str, fmt: str) -> str:
+    """storage/results/<id>.jpg → storage/renditions/results/<id>.thumb.jpg"""
+    return f"{_prefix(source_path)}.{size}.{FORMATS[fmt][1]}"
+
+
+def _save(image: Image.Image, source_path: str, size: str, fmt: str) -> str:
+    """image를 size 렌디션으로 저장 (임시 파일 → rename). 저장한 경로 반환"""
+    pil_format, _, _, options = FORMATS[fmt]
+    limit = RENDITION_SIZES[size]
+
+    rendition = image
+    if limit and max(image.size) > limit:
+        rendition = image.copy()
+        # reducing_gap: 먼저 정수배로 빠르게 줄인 뒤 LANCZOS (큰 결과 이미지에서 훨씬 빠름)
+        rendition.thumbnail((limit, limit), Image.LANCZOS, reducing_gap=3.0)
+    if rendition.mode not in ("RGB", "L"):
+        rendition = rendition.convert("RGB")
+
+    path = rendition_path(source_path, size, fmt)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{uuid.uuid4().hex}.part"
+    try:
+        rendition.save(tmp_path, format=pil_format, **options)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return path
+
+
+def generate_sync(source_path: str, size: str, fmt: str) -> str:
+    """원본 파일에서 렌디션 하나 생성 (동기, 별도 스레드에서 실행)"""
+    with Image.open(source_path) as image:
+        limit = RENDITION_SIZES[size]
+        if limit:
+            # JPEG는 디코딩 단계에서 1/2, 1/4, 1/8로 축소 (전체 해상도로 풀지 않음)
+            image.draft("RGB", (limit, limit))
+        image.load()
+        # 휴대폰 원본은 EXIF 회전 정보가 있을 수 있음 (렌디션에는 메타데이터를 남기지 않으므로 적용)
+        return _save(ImageOps.exif_transpose(image), source_path, size, fmt)
+
+
+def pregenerate(image: Image.Image, source_path: str):
+    """업스케일 직후 메모리에 있는 결과로 thumb/medium 생성 (워커에서 호출)"""
+    for fmt in RENDITION_PREGENERATE:
+        if not is_supported(fmt):
+            continue
+        for size in ("medium", "thumb"):
+            _save(image, source_path, size, fmt)
+
+
+async def get_rendition(source_path: str, size: str, fmt: str) -> str:
+    """렌디션 경로 반환 (없으면 생성해서 저장)"""
+    path = rendition_path(source_path, size, fmt)
+    loop = asyncio.get_running_loop()
+    if await loop.run_in_executor(None, os.path.exists, path):
+        return path
+
+    future = _pending.get(path)
+    if future is None:
+        future = loop.run_in_executor(None, generate_sync, source_path, size, fmt)
+        _pending[path] = future
+        future.add_done_callback(lambda _: _pending.pop(path, None))
+    return await asyncio.shield(future)
+
+
+def remove_renditions(source_path: str):
+    """source_path로 만든 렌디션 파일 모두 삭제"""
+    for path in glob.glob(f"{_prefix(source_path)}.*"):
+        os.remove(path)
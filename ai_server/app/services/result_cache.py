@@ -0,0 +1,150 @@
+"""
+업스케일 결과 캐시 (원본 내용 해시 기준)
+
+휴대폰은 업로드를 재시도하므로 같은 사진이 /upscale, /bestcut 으로 여러 번 들어옵니다.
+원본의 SHA-256(content_hash)과 모델 버전(model_version)이 같은 COMPLETED 레코드가 있으면
+새 레코드가 그 원본/결과 파일을 그대로 가리키고, RealESRGAN을 다시 실행하지 않습니다.
+
+- 업로드 시: 완료된 결과가 있으면 새 원본을 저장하지 않고 바로 COMPLETED
+- 워커 처리 시: 그 사이에 같은 내용이 먼저 완료됐으면 추론을 건너뜀
+- 파일 공유는 참조 카운트로 관리: 같은 경로를 가리키는 레코드가 모두 지워질 때 파일 삭제
+  (카운트는 별도 컬럼 없이 photos 테이블을 조회해서 계산)
+- 재사용과 삭제는 같은 content_hash 행 잠금(PostgreSQL SELECT ... FOR UPDATE)으로 직렬화:
+  재사용하는 쪽은 찾은 행을 새 레코드를 커밋할 때까지 잠그고, 삭제하는 쪽은 먼저 같은 행들을 잠금
+  → 삭제가 참조를 세는 시점에는 재사용한 새 레코드가 이미 보이거나, 재사용하는 쪽이 지워진 행을 고르지 않음
+- 적중/미스 횟수는 프로세스별 카운터로 /health 에 노출
+"""
+
+import asyncio
+import os
+import threading
+from typing import List, Optional
+
+from sqlalchemy import or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from models import PhotoRecord, ProcessingStatus
+
+# ============ 설정 ============
+# 가중치나 추론 방식이 바뀌면 이 값을 바꿔서 이전 결과를 재사용하지 않도록 함
+MODEL_VERSION = os.getenv("MODEL_VERSION", "RealESRGAN_x4")
+# 모델 없이 리사이즈로 대신한 결과 (캐시 적중 대상이 아님)
+FALLBACK_VERSION = "fallback-bicubic-x4"
+
+
+class CacheStats:
+    """캐시 적중/미스 카운터 (프로세스 단위)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def record(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "model_version": MODEL_VERSION,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            }
+
+
+stats = CacheStats()
+
+
+def _first_with_files(records: List[PhotoRecord]) -> Optional[PhotoRecord]:
+    """원본/결과 파일이 둘 다 남아 있는 첫 레코드 (같은 파일 쌍은 한 번만 확인)"""
+    checked = set()
+    for record in records:
+        paths = (record.original_path, record.upscaled_path)
+        if paths in checked:
+            continue
+        checked.add(paths)
+        if all(os.path.exists(path) for path in paths):
+            return record
+    return None
+
+
+async def find_result(
+    db: AsyncSession, content_hash: Optional[str], model_version: str = MODEL_VERSION
+) -> Optional[PhotoRecord]:
+    """
+    같은 내용 + 같은 모델 버전으로 완료된 레코드 (파일이 남아 있는 것 중 가장 오래된 것)
+
+    파일이 지워진 레코드가 있어도 다음 후보를 확인합니다. (파일 확인은 스레드에서)
+    PostgreSQL에서는 후보 행을 트랜잭션이 끝날 때까지 잠급니다. 결과를 가리키는 레코드는
+    같은 트랜잭션에서 커밋해야 합니다.
+    """
+    if not content_hash:
+        return None
+    query = (
+        select(PhotoRecord)
+        .where(
+            PhotoRecord.content_hash == content_hash,
+            PhotoRecord.model_version == model_version,
+            PhotoRecord.status == ProcessingStatus.COMPLETED,
+            PhotoRecord.upscaled_path.is_not(None),
+        )
+        .order_by(PhotoRecord.created_at)
+    )
+    if db.bind.dialect.name == "postgresql":
+        query = query.with_for_update()
+    records = (await db.execute(query)).scalars().all()
+    if not records:
+        return None
+    return await asyncio.get_running_loop().run_in_executor(None, _first_with_files, records)
+
+
+async def lookup(db: AsyncSession, content_hash: Optional[str]) -> Optional[PhotoRecord]:
+    """find_result + 적중/미스 기록"""
+    record = await find_result(db, content_hash)
+    stats.record(record is not None)
+    return record
+
+
+async def lock_shared(db: AsyncSession, content_hash: Optional[str]):
+    """
+    같은 내용의 레코드 행을 잠금 (레코드를 지우기 전에 호출, PostgreSQL만)
+
+    그 결과를 재사용하는 중인 업로드가 있으면 새 레코드가 커밋될 때까지 기다립니다.
+    """
+    if not content_hash or db.bind.dialect.name != "postgresql":
+        return
+    await db.execute(
+        select(PhotoRecord.id)
+        .where(PhotoRecord.content_hash == content_hash)
+        .order_by(PhotoRecord.created_at)
+        .with_for_update()
+    )
+
+
+async def unreferenced_paths(db: AsyncSession, paths: List[Optional[str]]) -> List[str]:
+    """
+    어떤 레코드도 가리키지 않는 경로만 반환 (삭제해도 되는 파일)
+
+    레코드를 지우고 flush/commit 한 뒤에 호출합니다.
+    """
+    paths = [p for p in dict.fromkeys(paths) if p]
+    if not paths:
+        return []
+    result = await db.execute(
+        select(PhotoRecord.original_path, PhotoRecord.upscaled_path).where(
+            or_(
+                PhotoRecord.original_path.in_(paths),
+                PhotoRecord.upscaled_path.in_(paths),
+            )
+        )
+    )
+    referenced = {p for row in result.all() for p in row}
+    return [p for p in paths if p not in referenced]
+
@@ -0,0 +1,222 @@
+"""
+사진 처리 상태 이벤트 (GET /photos/events 로 푸시)
+
+클라이언트가 GET /photos 를 폴링하지 않아도 QUEUED → PROCESSING → COMPLETED/FAILED 변화를
+바로 받을 수 있도록, 상태를 바꾸는 쪽(워커/API)이 이벤트를 발행하고 API 프로세스가 구독자에게 전달합니다.
+
+- 발행: publish(db, photo_id, status) 를 상태 UPDATE 와 같은 트랜잭션에서 호출 → 커밋될 때 전달
+  (롤백되면 전달되지 않음)
+- 백엔드 (STATUS_EVENTS_BACKEND):
+    postgres: pg_notify / LISTEN (워커 프로세스와 여러 gunicorn 워커 사이 전달, PostgreSQL 기본값)
+    memory: 같은 프로세스 안에서만 전달 (테스트/SQLite 개발용 기본값)
+- 구독: subscribe(photo_ids) → 이 프로세스의 구독자 큐 (postgres 는 프로세스당 LISTEN 커넥션 하나)
+"""
+
+import abc
+import asyncio
+import json
+import logging
+import os
+import weakref
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import DATABASE_URL
+
+logger = logging.getLogger(__name__)
+
+# ============ 설정 ============
+CHANNEL = "photo_status"
+_is_postgresql = make_url(DATABASE_URL).get_backend_name() == "postgresql"
+STATUS_EVENTS_BACKEND = os.getenv(
+    "STATUS_EVENTS_BACKEND", "postgres" if _is_postgresql else "memory"
+)
+# 연결 유지용 주석 전송 주기(초), 프록시의 유휴 연결 종료 방지
+STATUS_EVENTS_KEEPALIVE_SECONDS = float(os.getenv("STATUS_EVENTS_KEEPALIVE_SECONDS", "15"))
+# 이벤트에 싣는 error_message 최대 글자 수 (전체 메시지는 photos 테이블에 남음)
+# PostgreSQL NOTIFY payload 는 8000 바이트 미만이어야 함 → JSON 이스케이프(\uXXXX, 글자당 최대 12바이트)를
+# 고려해도 넘지 않는 길이. 넘으면 상태 UPDATE 트랜잭션까지 롤백됨
+STATUS_EVENT_ERROR_MAX_CHARS = 500
+
+
+class Subscription:
+    """photo_ids 에 대한 이벤트 큐 (async with 로 사용)"""
+
+    def __init__(self, broker: "Broker", photo_ids: Iterable[str]):
+        self.broker = broker
+        self.photo_ids = set(photo_ids)
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.closed = False  # 백엔드 연결이 끊김 → 클라이언트가 다시 구독해야 함
+
+    async def __aenter__(self):
+        await self.broker._add(self)
+        return self
+
+    async def __aexit__(self, *exc):
+        self.broker._remove(self)
+
+    def close(self):
+        self.closed = True
+        self.queue.put_nowait(None)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[dict]:
+        """다음 이벤트 (timeout 이 지나거나 닫히면 None)"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class Broker(abc.ABC):
+    """이 프로세스의 구독자에게 이벤트를 나눠주는 부분 (백엔드 공통, 백엔드는 publish 구현)"""
+
+    def __init__(self):
+        # 약한 참조: 응답 스트림이 시작되기 전에 끊겨 정리 코드가 돌지 않아도 구독이 남지 않음
+        self._subscribers: Dict[str, weakref.WeakSet] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def subscribe(self, photo_ids: Iterable[str]) -> Subscription:
+        return Subscription(self, photo_ids)
+
+    async def _add(self, subscription: Subscription):
+        self._loop = asyncio.get_running_loop()
+        for photo_id in subscription.photo_ids:
+            self._subscribers.setdefault(photo_id, weakref.WeakSet()).add(subscription)
+
+    def _remove(self, subscription: Subscription):
+        for photo_id in subscription.photo_ids:
+            subscribers = self._subscribers.get(photo_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[photo_id]
+
+    def _close_all(self):
+        for subscription in {s for subs in self._subscribers.values() for s in subs}:
+            subscription.close()
+
+    def _dispatch(self, payload: dict):
+        for subscription in list(self._subscribers.get(payload.get("id"), ())):
+            subscription.queue.put_nowait(payload)
+
+    def _dispatch_threadsafe(self, payload: dict):
+        # 커밋이 다른 스레드/루프에서 일어날 수 있으므로 구독자 루프에서 전달
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._dispatch(payload)
+        else:
+            loop.call_soon_threadsafe(self._dispatch, payload)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len({s for subs in self._subscribers.values() for s in subs})
+
+    @abc.abstractmethod
+    async def publish(self, db: AsyncSession, payload: dict):
+        """payload 를 db 의 현재 트랜잭션이 커밋될 때 전달되도록 발행"""
+
+    async def close(self):
+        pass
+
+
+class MemoryBroker(Broker):
+    """같은 프로세스 안에서만 전달 (세션 커밋 후, 롤백되면 버림)"""
+
+    async def publish(self, db: AsyncSession, payload: dict):
+        # 트랜잭션을 시작해 둠 (없으면 rollback() 이 after_rollback 없이 지나가 다음 커밋에 섞임)
+        await db.connection()
+        session = db.sync_session
+        pending = session.info.get("status_events")
+        if pending is None:
+            pending = session.info["status_events"] = []
+            event.listen(session, "after_commit", self._on_commit)
+            event.listen(session, "after_rollback", self._on_rollback)
+        pending.append(payload)
+
+    def _on_commit(self, session):
+        for payload in session.info.pop("status_events", []):
+            self._dispatch_threadsafe(payload)
+        session.info["status_events"] = []
+
+    def _on_rollback(self, session):
+        session.info["status_events"] = []
+
+
+class PostgresBroker(Broker):
+    """pg_notify 로 발행, 프로세스당 LISTEN 커넥션 하나로 받아서 구독자에게 전달"""
+
+    def __init__(self, dsn: str):
+        super().__init__()
+        self._dsn = dsn
+        self._conn = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def publish(self, db: AsyncSession, payload: dict):
+        # NOTIFY 는 트랜잭션이 커밋될 때 전달됨
+        await db.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": CHANNEL, "payload": json.dumps(payload)},
+        )
+
+    async def _add(self, subscription: Subscription):
+        await self._ensure_listening()
+        await super()._add(subscription)
+
+    async def _ensure_listening(self):
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._conn is not None and not self._conn.is_closed():
+                return
+            import asyncpg
+
+            self._conn = await asyncpg.connect(self._dsn)
+            await self._conn.add_listener(CHANNEL, self._on_notify)
+            self._conn.add_termination_listener(self._on_terminated)
+            logger.info("📡 Listening for photo status events")
+
+    def _on_notify(self, connection, pid, channel, payload: str):
+        try:
+            self._dispatch(json.loads(payload))
+        except ValueError:
+            logger.warning(f"Invalid status event payload: {payload!r}")
+
+    def _on_terminated(self, connection):
+        # 지금 구독자는 스트림을 끝내서 다시 구독하게 함 (구독 시 현재 상태부터 보내므로 놓치는 변경 없음)
+        logger.warning("📡 Status event connection lost")
+        self._conn = None
+        self._close_all()
+
+    async def close(self):
+        if self._conn is not None:
+            await self._conn.close()
+            self._conn = None
+
+
+def _create_broker() -> Broker:
+    if STATUS_EVENTS_BACKEND == "postgres":
+        dsn = make_url(DATABASE_URL).set(drivername="postgresql")
+        return PostgresBroker(dsn.render_as_string(hide_password=False))
+    return MemoryBroker()
+
+
+broker = _create_broker()
+
+
+async def publish(db: AsyncSession, photo_id: str, status, error_message: Optional[str] = None):
+    """상태 변경 이벤트 발행 (db 트랜잭션이 커밋될 때 전달, 긴 error_message 는 잘라서 보냄)"""
+    payload = {"id": photo_id, "status": getattr(status, "value", status)}
+    if error_message:
+        if len(error_message) > STATUS_EVENT_ERROR_MAX_CHARS:
+            error_message = error_message[: STATUS_EVENT_ERROR_MAX_CHARS - 1] + "…"
+        payload["error_message"] = error_message
+    await broker.publish(db, payload)
@@ -0,0 +1,181 @@
+"""
+타일 기반 업스케일 (메모리 사용량을 타일 크기로 제한)
+
+이미지를 겹치는(overlap) 타일로 나눠 하나씩(또는 배치로) 업스케일하고,
+겹치는 부분은 선형 가중치(feathering)로 섞어서 이음새가 보이지 않게 합니다.
+
+- 타일은 래스터 순서(왼쪽→오른쪽, 위→아래)로 결과 이미지에 합성
+- 새 타일의 왼쪽/위쪽 overlap 구간만 이미 그려진 결과와 알파 블렌딩
+- 추론 중 float 버퍼는 타일 크기만큼만 필요 → 이미지가 커져도 피크 메모리는 거의 일정
+  (uint8 결과 이미지 자체는 제외)
+
+설정 (환경변수):
+- TILE_SIZE: 입력 기준 타일 크기(px), 1 이상 (전체 이미지를 한 번에 추론하는 모드는 없음)
+- TILE_OVERLAP: 이웃 타일과 겹치는 폭(px)
+- UPSCALE_MAX_INPUT_SIZE: 입력 최대 변 길이(px), 0이면 제한 없음 (기본 1600 = 카메라 UXGA 원본 유지)
+- UPSCALE_DRAFT_DECODE: 1이면 큰 JPEG를 DCT 단계에서 1/2, 1/4, 1/8로 줄여서 디코딩 (기본 1)
+- UPSCALE_RESAMPLE: 최대 크기로 줄일 때 필터, lanczos(기본) 또는 area(BOX 평균, 더 빠름)
+"""
+
+import os
+from typing import Callable, List, Tuple
+
+import numpy as np
+from PIL import Image
+
+# ============ 설정 ============
+TILE_SIZE = int(os.getenv("TILE_SIZE", "256"))
+if TILE_SIZE <= 0:
+    # 타일링 없이 1600px 전체를 한 번에 추론하면 피크 메모리가 타일 크기가 아니라 이미지 크기를 따라감
+    raise ValueError(f"TILE_SIZE must be a positive number of pixels, got {TILE_SIZE}")
+TILE_OVERLAP = int(os.getenv("TILE_OVERLAP", "16"))
+UPSCALE_MAX_INPUT_SIZE = int(os.getenv("UPSCALE_MAX_INPUT_SIZE", "1600"))
+UPSCALE_DRAFT_DECODE = os.getenv("UPSCALE_DRAFT_DECODE", "1") == "1"
+RESAMPLE_FILTERS = {"lanczos": Image.LANCZOS, "area": Image.BOX}
+UPSCALE_RESAMPLE = os.getenv("UPSCALE_RESAMPLE", "lanczos")
+if UPSCALE_RESAMPLE not in RESAMPLE_FILTERS:
+    # 첫 업로드에서 KeyError 로 모든 작업이 FAILED 되기 전에 시작 시점에 알림
+    raise ValueError(
+        f"UPSCALE_RESAMPLE must be one of {', '.join(RESAMPLE_FILTERS)}, "
+        f"got {UPSCALE_RESAMPLE!r}"
+    )
+
+# uint8 타일 목록 → float32 (0~255) 업스케일 결과 목록
+TileInferFn = Callable[[List[np.ndarray]], List[np.ndarray]]
+
+
+def limit_input_size(
+    image: Image.Image,
+    max_size: int = UPSCALE_MAX_INPUT_SIZE,
+    resample: str = UPSCALE_RESAMPLE,
+):
+    """입력이 max_size보다 크면 비율을 유지해서 축소 (제자리 변경)"""
+    if max_size and (image.width > max_size or image.height > max_size):
+        image.thumbnail((max_size, max_size), RESAMPLE_FILTERS[resample])
+    return image
+
+
+def _fitted_size(size: Tuple[int, int], max_size: int) -> Tuple[int, int]:
+    width, height = size
+    ratio = max_size / max(width, height)
+    return max(1, int(width * ratio)), max(1, int(height * ratio))
+
+
+def load_input(
+    source,
+    max_size: int = UPSCALE_MAX_INPUT_SIZE,
+    resample: str = UPSCALE_RESAMPLE,
+    draft: bool = UPSCALE_DRAFT_DECODE,
+) -> Image.Image:
+    """
+    업로드 원본(경로 또는 파일 객체) → 업스케일 입력 RGB 이미지 (긴 변 최대 max_size)
+
+    JPEG는 디코딩 전에 draft() 로 libjpeg 축소 배율(1/2, 1/4, 1/8)을 지정해서
+    결과가 max_size 이상인 범위에서 가장 작게 디코딩합니다.
+    12MP 원본을 UXGA로 줄일 때 전체 해상도 래스터를 만들지 않으므로 디코딩 시간과 메모리가 줄고,
+    남은 축소(2배 미만)만 resample 필터로 처리합니다.
+    """
+    with Image.open(source) as image:
+        if draft and max_size and image.format == "JPEG" and max(image.size) > max_size:
+            # 배율은 두 변 모두 요청 크기 이상이 되도록 고르므로 비율에 맞춘 크기를 넘김
+            image.draft("RGB", _fitted_size(image.size, max_size))
+        image = image.convert("RGB")
+    return limit_input_size(image, max_size, resample)
+
+
+def tile_starts(length: int, tile: int, overlap: int) -> List[int]:
+    """한 축의 타일 시작 좌표 목록 (마지막 타일은 끝에 맞춤)"""
+    if length <= tile:
+        return [0]
+    step = tile - overlap
+    starts = list(range(0, length - tile, step))
+    starts.append(length - tile)
+    return starts
+
+
+def plan_tiles(
+    width: int, height: int, tile: int, overlap: int
+) -> List[Tuple[int, int, int, int]]:
+    """(y, x, h, w) 타일 목록을 래스터 순서로 반환"""
+    return [
+        (y, x, min(tile, height - y), min(tile, width - x))
+        for y in tile_starts(height, tile, overlap)
+        for x in tile_starts(width, tile, overlap)
+    ]
+
+
+def _ramp(length: int) -> np.ndarray:
+    # 0과 1을 포함하지 않는 선형 가중치 (양쪽 타일 모두 기여)
+    return ((np.arange(length, dtype=np.float32) + 0.5) / length).astype(np.float32)
+
+
+def _composite(
+    out: np.ndarray,
+    tile_out: np.ndarray,
+    y: int,
+    x: int,
+    blend_left: bool,
+    blend_top: bool,
+    ramp: int,
+):
+    """업스케일된 타일을 결과 이미지에 합성 (왼쪽/위쪽 overlap은 알파 블렌딩)"""
+    h, w = tile_out.shape[:2]
+    region = out[y : y + h, x : x + w]
+
+    if not (blend_left or blend_top) or ramp <= 0:
+        region[...] = np.clip(tile_out + 0.5, 0, 255)
+        return
+
+    alpha = np.ones((h, w, 1), dtype=np.float32)
+    if blend_left:
+        r = min(ramp, w)
+        alpha[:, :r, 0] *= _ramp(r)[None, :]
+    if blend_top:
+        r = min(ramp, h)
+        alpha[:r, :, 0] *= _ramp(r)[:, None]
+
+    blended = tile_out * alpha + region.astype(np.float32) * (1.0 - alpha)
+    region[...] = np.clip(blended + 0.5, 0, 255)
+
+
+def upscale_tiled(
+    image: Image.Image,
+    infer_tiles: TileInferFn,
+    scale: int,
+    tile_size: int = TILE_SIZE,
+    overlap: int = TILE_OVERLAP,
+    batch_size: int = 4,
+) -> Image.Image:
+    """
+    타일 단위 업스케일
+
+    Args:
+        image: RGB 입력 이미지
+        infer_tiles: uint8 (h, w, 3) 타일 목록을 받아
+                     float32 (h*scale, w*scale, 3) 결과 목록을 돌려주는 함수
+        scale: 업스케일 배율
+        tile_size: 입력 기준 타일 크기
+        overlap: 이웃 타일과 겹치는 폭
+        batch_size: infer_tiles 한 번에 넘길 타일 수 (동시에 메모리에 올라가는 타일 수)
+    """
+    overlap = max(0, min(overlap, tile_size // 2))
+    src = np.asarray(image.convert("RGB"))
+    height, width = src.shape[:2]
+    out = np.empty((height * scale, width * scale, 3), dtype=np.uint8)
+
+    tiles = plan_tiles(width, height, tile_size, overlap)
+    for i in range(0, len(tiles), max(1, batch_size)):
+        chunk = tiles[i : i + batch_size]
+        results = infer_tiles([src[y : y + h, x : x + w] for y, x, h, w in chunk])
+        for (y, x, _, _), tile_out in zip(chunk, results):
+            _composite(
+                out,
+                tile_out,
+                y * scale,
+                x * scale,
+                blend_left=x > 0,
+                blend_top=y > 0,
+                ramp=overlap * scale,
+            )
+
+    return Image.fromarray(out)
@@ -0,0 +1,168 @@
+"""
+업스케일 워커
+
+API 프로세스는 업로드만 받고 QUEUED 레코드를 남깁니다.
+워커 프로세스는 모델을 프로세스당 한 번만 로드하고, 작업 큐에서 작업을 점유해 처리합니다.
+처리량은 워커 프로세스(또는 컨테이너)를 늘려서 확장합니다.
+
+설정 (환경변수):
+- WORKER_CONCURRENCY: 워커 하나가 동시에 처리할 작업 수 (기본 1)
+- WORKER_POLL_INTERVAL: 큐가 비었을 때 다시 조회하기까지 대기 시간(초)
+- JOB_VISIBILITY_TIMEOUT_SECONDS: 작업 lease 시간 (app/services/job_queue.py)
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Optional, Set
+
+from database import SessionLocal
+from app.core import tracing
+from app.core.metrics import JOBS_IN_FLIGHT
+from app.services import job_queue
+from app.services.ai_service import model_manager, process_image_task
+from app.services.model_server import INFERENCE_BACKEND
+
+logger = logging.getLogger(__name__)
+
+WORKER_CONCURRENCY = int(os.getenv("WORKER_CONCURRENCY", "1"))
+WORKER_POLL_INTERVAL = float(os.getenv("WORKER_POLL_INTERVAL", "1.0"))
+
+
+class UpscaleWorker:
+    """작업 큐를 폴링하며 업스케일 작업을 처리하는 워커"""
+
+    def __init__(
+        self,
+        concurrency: int = WORKER_CONCURRENCY,
+        poll_interval: float = WORKER_POLL_INTERVAL,
+        visibility_timeout: int = job_queue.JOB_VISIBILITY_TIMEOUT_SECONDS,
+        session_factory=SessionLocal,
+        worker_id: Optional[str] = None,
+    ):
+        self.concurrency = max(1, concurrency)
+        self.poll_interval = poll_interval
+        self.visibility_timeout = visibility_timeout
+        self.session_factory = session_factory
+        self.worker_id = worker_id or (
+            f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        )
+        self._tasks: Set[asyncio.Task] = set()
+        self._stopping = asyncio.Event()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._tasks)
+
+    async def run_once(self) -> int:
+        """빈 슬롯만큼 작업을 점유하고 처리 태스크를 시작. 점유한 작업 수 반환"""
+        free_slots = self.concurrency - self.in_flight
+        if free_slots <= 0:
+            return 0
+
+        async with self.session_factory() as db:
+            await job_queue.fail_exhausted_jobs(db)
+            records = await job_queue.claim_jobs(
+                db,
+                self.worker_id,
+                limit=free_slots,
+                visibility_timeout=self.visibility_timeout,
+            )
+
+        for record in records:
+            task = asyncio.create_task(self._process(record))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        return len(records)
+
+    async def _process(self, record):
+        photo_id = record.id
+        heartbeat = asyncio.create_task(self._heartbeat(photo_id))
+        try:
+            # 업로드 요청의 trace 를 이어서 (queue.wait, decode, inference, ...)
+            with JOBS_IN_FLIGHT.track_inprogress(), tracing.job_span(
+                photo_id,
+                request_id=record.request_id,
+                traceparent=record.traceparent,
+                queued_at=record.created_at,
+                attempt=record.attempts,
+            ):
+                await process_image_task(photo_id, record.original_path, self.worker_id)
+        finally:
+            heartbeat.cancel()
+
+    async def _heartbeat(self, photo_id: str):
+        """처리 중 lease 연장 (timeout의 1/3 주기)"""
+        interval = max(1.0, self.visibility_timeout / 3)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                async with self.session_factory() as db:
+                    if not await job_queue.extend_lease(
+                        db, photo_id, self.worker_id, self.visibility_timeout
+                    ):
+                        return
+            except Exception as e:
+                logger.warning(f"Lease heartbeat failed for {photo_id}: {e}")
+
+    async def run(self):
+        """stop()이 호출될 때까지 큐를 폴링"""
+        logger.info(
+            f"🚀 Worker {self.worker_id} started (concurrency={self.concurrency})"
+        )
+        while not self._stopping.is_set():
+            try:
+                claimed = await self.run_once()
+            except Exception as e:
+                logger.error(f"❌ Worker poll failed: {e}")
+                claimed = 0
+
+            if claimed == 0:
+                try:
+                    await asyncio.wait_for(
+                        self._stopping.wait(), timeout=self.poll_interval
+                    )
+                except asyncio.TimeoutError:
+                    pass
+
+        await self.shutdown()
+
+    async def shutdown(self):
+        """진행 중인 작업을 취소하고 점유를 반납"""
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        async with self.session_factory() as db:
+            released = await job_queue.release_jobs(db, self.worker_id)
+        logger.info(f"👋 Worker {self.worker_id} stopped (released {released} jobs)")
+
+    def stop(self):
+        self._stopping.set()
+
+
+async def run_worker(concurrency: int = WORKER_CONCURRENCY):
+    """워커 프로세스 메인 루프 (SIGTERM/SIGINT 시 정상 종료)"""
+    import signal
+
+    loop = asyncio.get_running_loop()
+    # 추론은 process_image_task가 기본 executor에서 실행 → 동시성만큼 스레드
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=concurrency))
+
+    # 모델 로드 + 워밍업이 끝난 뒤에 작업을 점유 (로드 중에 lease가 만료되지 않도록)
+    await loop.run_in_executor(None, model_manager.load)
+    if INFERENCE_BACKEND == "remote" and not model_manager.ready:
+        # 모델 서버가 아직 로드 중이면 준비될 때까지 대기 (fallback 결과를 만들지 않도록)
+        logger.warning(f"⏳ Waiting for model server: {model_manager.error}")
+        while not model_manager.ready:
+            await asyncio.sleep(max(WORKER_POLL_INTERVAL, 5.0))
+            await loop.run_in_executor(None, partial(model_manager.load, force=True))
+
+    worker = UpscaleWorker(concurrency=concurrency)
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, worker.stop)
+    await worker.run()
@@ -0,0 +1,123 @@
+"""
+인증 사용자 캐시 벤치마크 (인증된 GET /photos: DB 쿼리 수 / 지연 시간)
+
+앱을 프로세스 안에서(ASGI) 호출해 같은 토큰으로 GET /photos 를 반복하고,
+요청당 실행된 SQL 수(그중 users 조회 수)와 p50 / p99 지연 시간을 비교합니다.
+db_pool 은 같은 구간의 요청당 커넥션 checkout 수 / 동시 보유 수 / 대기 시간입니다.
+
+- no_cache: PRINCIPAL_CACHE_TTL=0 과 같음 (매 요청 users 조회, 이전 동작)
+- cache: 기본 설정 (TTL 안에서는 users 조회 없음)
+- DB는 임시 SQLite 파일, 요청 한도는 RATE_LIMIT_ENABLED=0 으로 끔
+  운영 DB(PostgreSQL)는 네트워크 왕복이 더해지므로 쿼리 하나를 줄인 효과가 더 큽니다.
+
+실행:
+    python -m benchmarks.bench_auth_cache
+    python -m benchmarks.bench_auth_cache --requests 2000
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import tempfile
+import time
+
+WORKDIR = tempfile.mkdtemp(prefix="petcam-bench-")
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{WORKDIR}/bench.db")
+os.environ.setdefault("SECRET_KEY", "bench-secret-key")
+os.environ["RATE_LIMIT_ENABLED"] = "0"
+
+import httpx  # noqa: E402
+from sqlalchemy import event  # noqa: E402
+
+from database import Base, SessionLocal, engine  # noqa: E402
+from main import app  # noqa: E402
+from app.auth import create_access_token, get_password_hash  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.core.db_stats import pool_stats  # noqa: E402
+from app.services.principal_cache import PRINCIPAL_CACHE_TTL, principals  # noqa: E402
+
+
+class QueryCounter:
+    def __init__(self):
+        self.total = 0
+        self.users = 0
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.total += 1
+        if "FROM users" in statement:
+            self.users += 1
+
+
+async def _setup() -> str:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with SessionLocal() as db:
+        db.add(User(username="bench", hashed_password=get_password_hash("benchpass")))
+        await db.commit()
+    return create_access_token(data={"sub": "bench"})
+
+
+async def _run(client: httpx.AsyncClient, counter: QueryCounter, requests: int) -> dict:
+    # 첫 요청(캐시 채우기, 커넥션 생성)은 측정에서 제외
+    assert (await client.get("/photos")).status_code == 200
+    counter.total = counter.users = 0
+    pool_stats.reset()
+    timings = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = await client.get("/photos")
+        timings.append((time.perf_counter() - start) * 1000)
+        assert response.status_code == 200, response.text
+    timings.sort()
+    return {
+        "queries_per_request": round(counter.total / requests, 2),
+        "user_queries_per_request": round(counter.users / requests, 2),
+        "p50_ms": round(statistics.median(timings), 3),
+        "p99_ms": round(timings[int(len(timings) * 0.99) - 1], 3),
+        "db_pool": pool_stats.snapshot(),
+    }
+
+
+async def _main(args):
+    logging.getLogger("httpx").setLevel(logging.WARNING)  # 요청마다 찍히는 로그 끄기
+    token = await _setup()
+    counter = QueryCounter()
+    event.listen(engine.sync_engine, "before_cursor_execute", counter)
+
+    results = []
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://bench",
+        headers={"Authorization": f"Bearer {token}"},
+    ) as client:
+        for mode, ttl in (("no_cache", 0), ("cache", PRINCIPAL_CACHE_TTL or 60)):
+            principals.clear()
+            principals.ttl = ttl
+            results.append({"mode": mode, **await _run(client, counter, args.requests)})
+
+    await engine.dispose()
+    print(
+        json.dumps(
+            {
+                "benchmark": "auth_cache",
+                "requests": args.requests,
+                "principal_cache": principals.snapshot(),
+                "results": results,
+            },
+            indent=2,
+        )
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(_main(args))
+
+
+if __name__ == "__main__":
+    main()
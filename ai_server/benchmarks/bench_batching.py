@@ -0,0 +1,84 @@
+"""
+배치 추론 처리량 벤치마크 (batch size 1 / 2 / 4 / 8)
+
+동시에 업로드된 작업 여러 개가 BatchInferenceEngine에 이미지를 넣는 상황을 재현하고,
+max_batch_size별 처리량(images/sec)을 측정합니다.
+
+- RealESRGAN 가중치(weights/RealESRGAN_x4.pth)가 있으면 실제 RRDBNet 사용
+- 없으면 비슷한 구조의 작은 x4 SR 네트워크로 대체 (호출당 오버헤드 비교용)
+
+실행:
+    python -m benchmarks.bench_batching
+    python -m benchmarks.bench_batching --images 64 --size 160x120 --clients 8
+"""
+
+import argparse
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import torch
+
+from app.services.inference_engine import BatchInferenceEngine
+from benchmarks._common import load_network
+
+
+def run(batch_size: int, network, images, clients: int, wait_ms: float) -> dict:
+    def forward(batch):
+        with torch.no_grad():
+            return network(batch).clamp_(0, 1)
+
+    engine = BatchInferenceEngine(
+        forward, scale=4, max_batch_size=batch_size, max_wait_ms=wait_ms
+    )
+    engine.infer(images[0])  # 워밍업
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        list(pool.map(engine.infer, images))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "batch_size": batch_size,
+        "images": len(images),
+        "seconds": round(elapsed, 3),
+        "images_per_sec": round(len(images) / elapsed, 2),
+        "avg_batch": round((engine.images_run - 1) / max(1, engine.batches_run - 1), 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--images", type=int, default=32)
+    parser.add_argument("--size", default="128x96", help="WxH of each input")
+    parser.add_argument("--clients", type=int, default=8, help="concurrent jobs")
+    parser.add_argument("--wait-ms", type=float, default=10.0)
+    parser.add_argument("--batch-sizes", default="1,2,4,8")
+    args = parser.parse_args()
+
+    width, height = (int(v) for v in args.size.split("x"))
+    torch.manual_seed(0)
+    images = [torch.rand(3, height, width) for _ in range(args.images)]
+    network, name = load_network()
+
+    results = [
+        run(int(b), network, images, args.clients, args.wait_ms)
+        for b in args.batch_sizes.split(",")
+    ]
+    print(
+        json.dumps(
+            {
+                "benchmark": "batching",
+                "network": name,
+                "input": args.size,
+                "clients": args.clients,
+                "torch_threads": torch.get_num_threads(),
+                "results": results,
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
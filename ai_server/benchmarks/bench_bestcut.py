@@ -0,0 +1,167 @@
+"""
+/bestcut 연사 선택 지연 시간 벤치마크 (10장 / 30장)
+
+POST /bestcut 요청 한 번의 end-to-end 시간을 측정합니다 (multipart 수신 → 채점 → 저장 → DB 기록).
+
+- before: 이전 방식 (프레임마다 .part 파일로 저장 → cv2.imread 전체 해상도로 다시 읽어 한 장씩 채점),
+  비교용으로 벤치마크 앱에만 추가
+- after: 현재 /bestcut (메모리로 받아 1/2 해상도 디코딩, 프로세스 풀에서 병렬 채점, 한 장만 저장)
+- 앱은 같은 프로세스에서 ASGI로 직접 호출 (네트워크 제외), DB는 임시 SQLite 파일
+
+실행:
+    python -m benchmarks.bench_bestcut
+    python -m benchmarks.bench_bestcut --bursts 10,30 --repeat 5 --width 1600 --height 1200
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import os
+import statistics
+import tempfile
+import time
+
+import numpy as np
+from PIL import Image
+
+LEGACY_PATH = "/bench/bestcut-legacy"
+
+
+def _burst(count: int, width: int, height: int) -> list:
+    """흔들림 정도가 다른 연사 프레임 (그라디언트 + 노이즈 + 블러)"""
+    import cv2
+
+    rng = np.random.default_rng(7)
+    yy, xx = np.mgrid[0:height, 0:width].astype(np.float32)
+    base = np.stack([xx / width * 255, yy / height * 255, (xx + yy) / (width + height) * 255], -1)
+    scene = np.clip(base + rng.normal(0, 25, base.shape), 0, 255).astype(np.uint8)
+
+    frames = []
+    for i in range(count):
+        sigma = 0.5 + (i * 7919 % count) / count * 3  # 섞인 순서
+        frame = cv2.GaussianBlur(scene, (0, 0), sigma)
+        buffer = io.BytesIO()
+        Image.fromarray(frame).save(buffer, format="JPEG", quality=90)
+        frames.append(buffer.getvalue())
+    return frames
+
+
+def _add_legacy_endpoint(app):
+    """이전 /bestcut 처리 방식 (디스크에 모두 저장 후 한 장씩 채점)"""
+    import uuid
+
+    from fastapi import Depends, Request
+
+    from models import PhotoRecord, ProcessingStatus
+    from app.auth import get_current_user
+    from app.core.deps import get_db
+    from app.services.ai_service import get_blur_score_sync
+    from app.services.ingest import (
+        MAX_UPLOAD_FILES,
+        ORIGINALS_DIR,
+        commit_upload,
+        discard_uploads,
+        receive_uploads,
+    )
+
+    @app.post(LEGACY_PATH)
+    async def legacy_bestcut(
+        request: Request,
+        db=Depends(get_db),
+        current_user=Depends(get_current_user),
+    ):
+        loop = asyncio.get_running_loop()
+        uploads = await receive_uploads(request, "files", max_files=MAX_UPLOAD_FILES)
+        best_score, best_upload = -1.0, None
+        for upload in uploads:
+            score = await loop.run_in_executor(None, get_blur_score_sync, upload.path)
+            if score > best_score:
+                best_score, best_upload = score, upload
+        photo_id = str(uuid.uuid4())
+        final_path = f"{ORIGINALS_DIR}/{photo_id}.jpg"
+        await commit_upload(best_upload, final_path)
+        discard_uploads([u for u in uploads if u is not best_upload])
+        db.add(PhotoRecord(id=photo_id, original_path=final_path, status=ProcessingStatus.QUEUED))
+        await db.commit()
+        return {"id": photo_id, "score": best_score}
+
+
+async def _run(args) -> list:
+    import httpx
+
+    from main import app
+    from database import Base, engine
+    from app.services.blur import shutdown_score_pool, start_score_pool
+
+    _add_legacy_endpoint(app)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    start_score_pool()  # 첫 요청 이후와 같이 프로세스를 미리 띄움 (시작 비용 제외)
+
+    transport = httpx.ASGITransport(app=app)
+    results = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=300) as client:
+        credentials = {"username": "benchuser", "password": "benchpassword"}
+        await client.post("/register", json=credentials)
+        token = (await client.post("/token", data=credentials)).json()["access_token"]
+        auth = {"Authorization": f"Bearer {token}"}
+
+        for count in [int(n) for n in args.bursts.split(",")]:
+            frames = _burst(count, args.width, args.height)
+            files = [("files", (f"{i}.jpg", data, "image/jpeg")) for i, data in enumerate(frames)]
+            for mode, path in (("before", LEGACY_PATH), ("after", "/bestcut")):
+                timings, winner = [], None
+                for _ in range(args.repeat + 1):  # 첫 회는 워밍업
+                    start = time.perf_counter()
+                    response = await client.post(path, files=files, headers=auth)
+                    timings.append((time.perf_counter() - start) * 1000)
+                    response.raise_for_status()
+                    winner = response.json()["id"]
+                with open(f"storage/originals/{winner}.jpg", "rb") as f:
+                    kept = frames.index(f.read())
+                timings = timings[1:]
+                results.append(
+                    {
+                        "frames": count,
+                        "mode": mode,
+                        "burst_mb": round(sum(map(len, frames)) / 1024 / 1024, 1),
+                        "median_ms": round(statistics.median(timings), 1),
+                        "min_ms": round(min(timings), 1),
+                        "kept_frame": kept,
+                    }
+                )
+
+    shutdown_score_pool()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--bursts", default="10,30")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--width", type=int, default=1600)
+    parser.add_argument("--height", type=int, default=1200)
+    args = parser.parse_args()
+
+    # 앱 import 전에 환경 설정 (임시 DB / 저장소, 요청 한도 해제)
+    workdir = tempfile.mkdtemp(prefix="petcam-bench-")
+    os.makedirs(os.path.join(workdir, "storage", "originals"))
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{workdir}/bench.db"
+    os.environ.setdefault("SECRET_KEY", "bench-secret-key-0123456789abcdef")
+    os.environ["RATE_LIMIT_ENABLED"] = "0"
+    os.environ["MODEL_PRELOAD"] = "0"
+    os.environ["MAX_UPLOAD_FILES"] = str(max(int(n) for n in args.bursts.split(",")))
+    os.chdir(workdir)
+
+    results = asyncio.run(_run(args))
+    print(
+        json.dumps(
+            {"benchmark": "bestcut", "cpu_count": os.cpu_count(), "results": results},
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
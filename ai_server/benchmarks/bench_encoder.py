@@ -0,0 +1,108 @@
+"""
+결과 JPEG 인코딩 벤치마크 (인코딩 시간 vs 파일 크기)
+
+업스케일 결과 크기(입력 x4)의 이미지를 품질 / progressive / optimize / 백엔드 조합별로
+인코딩해서 중앙값 시간과 결과 크기(bytes, bits per pixel)를 비교합니다.
+double_encode 는 이전 v1 경로처럼 같은 결과를 파일용/응답용으로 두 번 인코딩한 시간입니다.
+
+- 입력: 시드 고정 합성 사진을 BICUBIC 으로 4배 확대 (SR 결과처럼 고주파가 적은 이미지)
+- turbojpeg 백엔드는 PyTurboJPEG + libturbojpeg 가 있을 때만 측정
+
+실행:
+    python -m benchmarks.bench_encoder
+    python -m benchmarks.bench_encoder --sizes 640x480,1600x1200 --qualities 75,85 --repeat 5
+"""
+
+import argparse
+import json
+import statistics
+import time
+
+from PIL import Image
+
+from app.services import encoder
+from benchmarks._common import synthetic_photo
+
+
+def _median_ms(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return round(statistics.median(timings), 1)
+
+
+def run(size, qualities, backends, repeat: int) -> list:
+    source = synthetic_photo(size, seed=0)
+    image = source.resize((size[0] * 4, size[1] * 4), Image.BICUBIC)
+    pixels = image.width * image.height
+
+    results = []
+    for backend in backends:
+        for quality in qualities:
+            for progressive in (False, True):
+                for optimize in (False, True):
+                    if backend == "turbojpeg" and optimize:
+                        continue  # 지원하지 않는 옵션
+
+                    def encode():
+                        return encoder.encode_jpeg(
+                            image, quality, progressive, optimize, backend=backend
+                        )
+
+                    data = encode()  # 워밍업 + 크기
+                    results.append(
+                        {
+                            "input": f"{size[0]}x{size[1]}",
+                            "output": f"{image.width}x{image.height}",
+                            "backend": backend,
+                            "quality": quality,
+                            "progressive": progressive,
+                            "optimize": optimize,
+                            "encode_ms": _median_ms(encode, repeat),
+                            "bytes": len(data),
+                            "bits_per_pixel": round(len(data) * 8 / pixels, 3),
+                        }
+                    )
+
+    def double_encode():
+        encoder.encode_jpeg(image)
+        encoder.encode_jpeg(image)
+
+    results.append(
+        {
+            "input": f"{size[0]}x{size[1]}",
+            "output": f"{image.width}x{image.height}",
+            "backend": encoder.active_backend(),
+            "mode": "double_encode",
+            "encode_ms": _median_ms(double_encode, repeat),
+            "single_encode_ms": _median_ms(lambda: encoder.encode_jpeg(image), repeat),
+        }
+    )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="640x480,1600x1200", help="input sizes (x4 encoded)")
+    parser.add_argument("--qualities", default="60,75,85,95")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    sizes = [tuple(int(v) for v in s.split("x")) for s in args.sizes.split(",")]
+    qualities = [int(q) for q in args.qualities.split(",")]
+    backends = ["pil"]
+    if encoder.active_backend("turbojpeg") == "turbojpeg":
+        backends.append("turbojpeg")
+
+    results = [r for size in sizes for r in run(size, qualities, backends, args.repeat)]
+    print(
+        json.dumps(
+            {"benchmark": "encoder", "backends": backends, "results": results}, indent=2
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+"""
+업스케일 작업의 DB 사용량 벤치마크 (상태 변경 방식 비교)
+
+워커가 점유한 작업 N개를 동시성 C로 process_image_task 에 넘기고, 추론은 --inference-ms 동안
+sleep 하는 가짜 함수로 바꿔서 작업당
+- statements: 실행한 SQL 수
+- commits: 커밋 수
+- held_ms: 커넥션을 잡고 있던 시간 (풀 점유 시간)
+과 전체 처리 시간, 최대 동시 사용 커넥션 수를 비교합니다.
+
+- legacy: 이전 방식 (레코드 SELECT → 수정 → 커밋, 추론 동안 세션 유지), 비교용으로 여기에만 남김
+- current: job_queue 의 조건부 UPDATE 한 문장씩, 추론 동안 세션 없음
+- 풀이 작을수록(--pool-size) 추론 동안 커넥션을 잡는 legacy 는 동시성이 풀 크기로 제한됩니다.
+- DB는 임시 SQLite 파일
+
+실행:
+    python -m benchmarks.bench_job_transitions
+    python -m benchmarks.bench_job_transitions --jobs 40 --concurrency 8 --pool-size 2
+"""
+
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import tempfile
+import time
+import uuid
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jobs", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--pool-size", type=int, default=2)
+    parser.add_argument("--inference-ms", type=float, default=200)
+    return parser.parse_args()
+
+
+ARGS = _parse_args() if __name__ == "__main__" else None
+WORKDIR = tempfile.mkdtemp(prefix="petcam-bench-")
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{WORKDIR}/bench.db")
+if ARGS:
+    os.environ["DB_POOL_SIZE"] = str(ARGS.pool_size)
+    os.environ["DB_MAX_OVERFLOW"] = "0"
+    os.environ["DB_POOL_TIMEOUT"] = "600"
+
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy.future import select  # noqa: E402
+
+from database import Base, SessionLocal, engine  # noqa: E402
+from models import PhotoRecord, ProcessingStatus  # noqa: E402
+from app.core.db_stats import pool_stats  # noqa: E402
+from app.services import ai_service, result_cache  # noqa: E402
+
+WORKER_ID = "bench-worker"
+
+
+async def legacy_process_image_task(photo_id: str, original_path: str, worker_id: str):
+    """이전 process_image_task 의 DB 사용 방식 (출력만 제거, worker_id 는 쓰지 않음)"""
+    try:
+        async with SessionLocal() as db:
+            result = await db.execute(select(PhotoRecord).filter(PhotoRecord.id == photo_id))
+            record = result.scalar_one_or_none()
+            if record:
+                record.status = ProcessingStatus.PROCESSING
+                await db.commit()
+
+            cached = await result_cache.lookup(db, record.content_hash if record else None)
+            if cached:
+                record.upscaled_path = cached.upscaled_path
+                record.model_version = cached.model_version
+                record.status = ProcessingStatus.COMPLETED
+                await db.commit()
+                return
+
+            res_path = f"storage/results/{photo_id}.jpg"
+            version = await asyncio.get_running_loop().run_in_executor(
+                None, ai_service.process_image_sync, original_path, res_path
+            )
+
+            result = await db.execute(select(PhotoRecord).filter(PhotoRecord.id == photo_id))
+            record = result.scalar_one_or_none()
+            if record:
+                record.upscaled_path = res_path
+                record.model_version = version
+                record.status = ProcessingStatus.COMPLETED
+                await db.commit()
+    except Exception as e:
+        async with SessionLocal() as db:
+            result = await db.execute(select(PhotoRecord).filter(PhotoRecord.id == photo_id))
+            record = result.scalar_one_or_none()
+            if record:
+                record.status = ProcessingStatus.FAILED
+                record.error_message = str(e)
+                await db.commit()
+
+
+class DBCounter:
+    """SQL 실행 / 커밋 수, 커넥션 보유 시간"""
+
+    def __init__(self):
+        self.statements = self.commits = 0
+        self.held_seconds = 0.0
+        sync_engine = engine.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", self._on_execute)
+        event.listen(sync_engine, "commit", self._on_commit)
+        event.listen(sync_engine.pool, "checkout", self._on_checkout)
+        event.listen(sync_engine.pool, "checkin", self._on_checkin)
+
+    def reset(self):
+        self.statements = self.commits = 0
+        self.held_seconds = 0.0
+
+    def _on_execute(self, *args):
+        self.statements += 1
+
+    def _on_commit(self, conn):
+        self.commits += 1
+
+    def _on_checkout(self, dbapi_connection, record, proxy):
+        record.info["bench_checkout_at"] = time.perf_counter()
+
+    def _on_checkin(self, dbapi_connection, record):
+        started = record.info.pop("bench_checkout_at", None)
+        if started is not None:
+            self.held_seconds += time.perf_counter() - started
+
+
+async def _add_jobs(count: int) -> list:
+    ids = []
+    async with SessionLocal() as db:
+        for i in range(count):
+            photo_id = str(uuid.uuid4())
+            db.add(
+                PhotoRecord(
+                    id=photo_id,
+                    original_path=f"storage/originals/{photo_id}.jpg",
+                    # claim_jobs 가 점유한 상태 (process_image_task 는 점유한 워커만 기록)
+                    status=ProcessingStatus.PROCESSING,
+                    locked_by=WORKER_ID,
+                    locked_until=datetime.datetime.utcnow() + datetime.timedelta(hours=1),
+                    attempts=1,
+                    content_hash=uuid.uuid4().hex * 2,  # 결과 캐시 미스
+                    created_at=datetime.datetime.utcnow(),
+                )
+            )
+            ids.append(photo_id)
+        await db.commit()
+    return ids
+
+
+async def _run(task, args, counter: DBCounter) -> dict:
+    ids = await _add_jobs(args.jobs)
+    counter.reset()
+    pool_stats.reset()
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def run_one(photo_id):
+        async with semaphore:
+            await task(photo_id, "unused.jpg", WORKER_ID)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[run_one(photo_id) for photo_id in ids])
+    elapsed = time.perf_counter() - start
+
+    async with SessionLocal() as db:
+        completed = (
+            await db.execute(
+                select(PhotoRecord.id).where(
+                    PhotoRecord.id.in_(ids), PhotoRecord.status == ProcessingStatus.COMPLETED
+                )
+            )
+        ).all()
+    return {
+        "completed": len(completed),
+        "statements_per_job": round(counter.statements / args.jobs, 2),
+        "commits_per_job": round(counter.commits / args.jobs, 2),
+        "held_ms_per_job": round(counter.held_seconds * 1000 / args.jobs, 1),
+        "peak_checked_out": pool_stats.snapshot()["peak_checked_out"],
+        "wall_seconds": round(elapsed, 2),
+        "jobs_per_second": round(args.jobs / elapsed, 2),
+    }
+
+
+async def _main(args):
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    def fake_inference(original_path, res_path):
+        time.sleep(args.inference_ms / 1000)
+        return result_cache.MODEL_VERSION
+
+    ai_service.process_image_sync = fake_inference
+    # 추론 스레드가 동시성만큼 있어야 DB 차이만 보임
+    from concurrent.futures import ThreadPoolExecutor
+
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(args.concurrency))
+
+    counter = DBCounter()
+    results = []
+    for mode, task in (
+        ("legacy", legacy_process_image_task),
+        ("current", ai_service.process_image_task),
+    ):
+        results.append({"mode": mode, **await _run(task, args, counter)})
+    await engine.dispose()
+    return results
+
+
+def main():
+    import contextlib
+    import io
+
+    # process_image_task 의 작업별 출력은 숨김
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = asyncio.run(_main(ARGS))
+    print(
+        json.dumps(
+            {
+                "benchmark": "job_transitions",
+                "jobs": ARGS.jobs,
+                "concurrency": ARGS.concurrency,
+                "pool_size": ARGS.pool_size,
+                "inference_ms": ARGS.inference_ms,
+                "results": results,
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
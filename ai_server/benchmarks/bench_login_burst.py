@@ -0,0 +1,175 @@
+"""
+로그인 폭주 중 API 지연 시간 벤치마크 (/health, /photos p50 / p99)
+
+uvicorn(워커 1개)을 띄우고, 로그인(POST /token) N개가 동시에 들어오는 동안
+GET /health, GET /photos 지연 시간을 측정합니다. bcrypt가 이벤트 루프를 막지 않으면
+로그인이 없을 때(idle)와 지연 시간이 크게 달라지지 않아야 합니다.
+
+- blocking: 이전 방식 (이벤트 루프에서 bcrypt 실행), 비교용으로 벤치마크 앱에서만 바꿔 끼움
+- executor: 현재 방식 (PASSWORD_HASH_WORKERS 스레드에서 실행)
+- 로그인이 모두 처리되도록 PASSWORD_HASH_MAX_PENDING 은 --max-pending 으로 설정 (기본 64)
+- DB는 임시 SQLite 파일, 요청 한도는 RATE_LIMIT_ENABLED=0 으로 끔
+
+실행:
+    python -m benchmarks.bench_login_burst
+    python -m benchmarks.bench_login_burst --logins 50 --modes executor
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+AI_SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CREDENTIALS = {"username": "benchuser", "password": "benchpassword"}
+
+
+def create_app():
+    """벤치마크용 앱: BENCH_HASH_MODE=blocking 이면 해싱을 이벤트 루프에서 실행 (uvicorn --factory)"""
+    from main import app
+    from app import auth
+
+    if os.environ.get("BENCH_HASH_MODE") == "blocking":
+
+        async def run_inline(fn, *args):
+            return fn(*args)
+
+        auth._run_in_hash_pool = run_inline
+
+    return app
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _percentile(values, p: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))]
+
+
+def _summary(latencies: list) -> dict:
+    return {
+        "requests": len(latencies),
+        "p50_ms": round(statistics.median(latencies), 2),
+        "p99_ms": round(_percentile(latencies, 99), 2),
+        "max_ms": round(max(latencies), 2),
+    }
+
+
+async def _probe(client: httpx.AsyncClient, auth: dict, stop: asyncio.Event) -> dict:
+    """stop 될 때까지 /health, /photos 를 번갈아 요청"""
+    latencies = {"/health": [], "/photos": []}
+    while not stop.is_set():
+        for path in latencies:
+            start = time.perf_counter()
+            response = await client.get(path, headers=auth)
+            latencies[path].append((time.perf_counter() - start) * 1000)
+            response.raise_for_status()
+        await asyncio.sleep(0.01)
+    return {path: _summary(values) for path, values in latencies.items()}
+
+
+async def _run(base_url: str, logins: int, idle_seconds: float) -> dict:
+    async with httpx.AsyncClient(base_url=base_url, timeout=300) as client:
+        await client.post("/register", json=CREDENTIALS)
+        token = (await client.post("/token", data=CREDENTIALS)).json()["access_token"]
+        auth = {"Authorization": f"Bearer {token}"}
+
+        stop = asyncio.Event()
+        probe = asyncio.create_task(_probe(client, auth, stop))
+        await asyncio.sleep(idle_seconds)
+        stop.set()
+        idle = await probe
+
+        stop = asyncio.Event()
+        probe = asyncio.create_task(_probe(client, auth, stop))
+        start = time.perf_counter()
+        responses = await asyncio.gather(
+            *[client.post("/token", data=CREDENTIALS) for _ in range(logins)]
+        )
+        burst_seconds = time.perf_counter() - start
+        stop.set()
+        during = await probe
+
+    codes = [r.status_code for r in responses]
+    return {
+        "logins": logins,
+        "logins_ok": codes.count(200),
+        "logins_503": codes.count(503),
+        "burst_seconds": round(burst_seconds, 2),
+        "idle": idle,
+        "during_burst": during,
+    }
+
+
+def _run_server(mode: str, args) -> dict:
+    """모드마다 새 서버 (깨끗한 DB)"""
+    workdir = tempfile.mkdtemp(prefix="petcam-bench-")
+    port = _free_port()
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite+aiosqlite:///{workdir}/bench.db",
+        "SECRET_KEY": "bench-secret-key-0123456789abcdef",
+        "RATE_LIMIT_ENABLED": "0",
+        "PASSWORD_HASH_MAX_PENDING": str(args.max_pending),
+        "BENCH_HASH_MODE": mode,
+        "PYTHONPATH": AI_SERVER_DIR,
+    }
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "benchmarks.bench_login_burst:create_app",
+            "--factory", "--port", str(port), "--log-level", "warning", "--no-access-log",
+        ],
+        cwd=workdir,
+        env=env,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + 60
+        while True:
+            try:
+                httpx.get(f"{base_url}/health", timeout=1).raise_for_status()
+                break
+            except httpx.HTTPError:
+                if time.monotonic() > deadline or server.poll() is not None:
+                    raise RuntimeError("server did not start")
+                time.sleep(0.2)
+
+        return {"mode": mode, **asyncio.run(_run(base_url, args.logins, args.idle_seconds))}
+    finally:
+        server.terminate()
+        server.wait()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--logins", type=int, default=50, help="concurrent logins")
+    parser.add_argument("--max-pending", type=int, default=64)
+    parser.add_argument("--idle-seconds", type=float, default=3.0)
+    parser.add_argument("--modes", default="blocking,executor")
+    args = parser.parse_args()
+
+    results = [_run_server(mode, args) for mode in args.modes.split(",")]
+    print(
+        json.dumps(
+            {"benchmark": "login_burst", "cpu_count": os.cpu_count(), "results": results},
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
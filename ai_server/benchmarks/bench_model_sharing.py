@@ -0,0 +1,180 @@
+"""
+모델 공유 벤치마크 (프로세스마다 로드 vs 모델 서버 1개)
+
+N개의 프로세스(gunicorn 워커 / 업스케일 워커 역할)를 띄우고 두 가지 구성을 비교합니다.
+
+- local: 프로세스마다 네트워크를 로드하고 직접 추론 (기존 방식)
+- remote: 모델 서버 프로세스 1개가 로드, 나머지는 Unix 소켓으로 추론 요청
+
+측정 항목:
+- ready_seconds: 프로세스 시작 → 첫 추론 가능까지 걸린 시간
+- total_pss_mb: 모든 프로세스의 PSS 합계 (공유 라이브러리 페이지는 나눠서 계산 → 호스트 실사용량)
+- total_rss_mb: 모든 프로세스의 RSS 합계 (공유 페이지 중복 포함, 참고용)
+
+PSS는 Linux의 /proc/<pid>/smaps_rollup 에서 읽습니다.
+가중치가 없으면 RRDBNet(약 16.7M 파라미터)과 파라미터 수가 비슷한 대체 네트워크를 사용합니다.
+
+실행:
+    python -m benchmarks.bench_model_sharing
+    python -m benchmarks.bench_model_sharing --processes 4 --modes local,remote
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+# RRDBNet x4 와 비슷한 파라미터 수 (64ch 3x3 conv 약 450개 ≈ 16.6M)
+STAND_IN_FEATURES = 64
+STAND_IN_BLOCKS = 450
+
+
+def _tile(size: int) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 256, (size, size, 3), dtype=np.uint8)
+
+
+def _local_engine():
+    # torch는 모델을 로드하는 프로세스에서만 import (클라이언트 메모리에 포함되지 않도록)
+    import torch
+
+    from app.services.inference_engine import BatchInferenceEngine
+    from benchmarks._common import load_network
+
+    network, name = load_network(STAND_IN_FEATURES, STAND_IN_BLOCKS)
+
+    def forward(batch):
+        with torch.no_grad():
+            return network(batch).clamp_(0, 1)
+
+    return BatchInferenceEngine(forward, scale=4, max_wait_ms=0), name
+
+
+def _wait_for_parent():
+    # 부모가 측정을 끝내고 stdin을 닫을 때까지 대기
+    sys.stdin.read()
+
+
+def run_role(role: str, socket_path: str, tile: int):
+    """서브프로세스 안에서 실행: local / server / client"""
+    start = time.perf_counter()
+    name = None
+
+    if role == "server":
+        import asyncio
+
+        from app.services.model_server import ModelServer
+
+        engine, name = _local_engine()
+        server = ModelServer(engine, socket_path)
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(server.start())
+        threading.Thread(target=loop.run_forever, daemon=True).start()
+        engine.infer_many([_tile(tile)])  # 워밍업
+    elif role == "client":
+        from app.services.model_server import RemoteInferenceClient
+
+        client = RemoteInferenceClient(socket_path)
+        client.infer_many([_tile(tile)])
+    else:
+        engine, name = _local_engine()
+        engine.infer_many([_tile(tile)])
+
+    ready = {"ready_seconds": round(time.perf_counter() - start, 2), "network": name}
+    print(json.dumps(ready), flush=True)
+    _wait_for_parent()
+
+
+def _memory_mb(pid: int) -> dict:
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            key, _, rest = line.partition(":")
+            if key in ("Rss", "Pss"):
+                values[key.lower()] = int(rest.split()[0]) / 1024
+    return values
+
+
+def _spawn(role: str, socket_path: str, tile: int) -> subprocess.Popen:
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "benchmarks.bench_model_sharing",
+            "--role", role, "--socket", socket_path, "--tile", str(tile),
+        ],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+
+
+def _ready(proc: subprocess.Popen) -> dict:
+    line = proc.stdout.readline()
+    if not line:
+        raise RuntimeError(f"process {proc.pid} exited before becoming ready")
+    return json.loads(line)
+
+
+def run(mode: str, processes: int, tile: int) -> dict:
+    socket_path = os.path.join(tempfile.mkdtemp(), "model.sock")
+    procs, ready = [], []
+    try:
+        if mode == "remote":
+            server = _spawn("server", socket_path, tile)
+            procs.append(server)
+            ready.append(_ready(server))
+            role = "client"
+        else:
+            role = "local"
+
+        # 워커 프로세스는 동시에 시작 (배포/재시작 상황)
+        workers = [_spawn(role, socket_path, tile) for _ in range(processes)]
+        procs += workers
+        ready += [_ready(p) for p in workers]
+
+        memory = [_memory_mb(p.pid) for p in procs]
+        return {
+            "mode": mode,
+            "processes": processes,
+            "network": next((r["network"] for r in ready if r["network"]), None),
+            "server_ready_seconds": ready[0]["ready_seconds"] if mode == "remote" else None,
+            "worker_ready_seconds_max": max(r["ready_seconds"] for r in ready[-processes:]),
+            "total_pss_mb": round(sum(m["pss"] for m in memory), 1),
+            "total_rss_mb": round(sum(m["rss"] for m in memory), 1),
+        }
+    finally:
+        for p in procs:
+            p.stdin.close()
+        for p in procs:
+            p.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--modes", default="local,remote")
+    parser.add_argument("--tile", type=int, default=16, help="warm-up tile size (px)")
+    parser.add_argument("--role", help=argparse.SUPPRESS)
+    parser.add_argument("--socket", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.role:
+        run_role(args.role, args.socket, args.tile)
+        return
+
+    results = [run(mode, args.processes, args.tile) for mode in args.modes.split(",")]
+    print(
+        json.dumps(
+            {"benchmark": "model_sharing", "tile": args.tile, "results": results},
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+GET /photos 페이지네이션 벤치마크 (OFFSET vs 키셋, 100만 행)
+
+임시 SQLite 파일에 여러 사용자의 합성 사진 행을 넣고, 한 사용자의 목록
+1 / 100 / 10,000 페이지(limit 20)의 조회 시간을 비교합니다.
+
+- offset_no_index: OFFSET 쿼리 (owner_id = 사용자 ORDER BY created_at DESC OFFSET n), 인덱스 없음
+- offset: 같은 OFFSET 쿼리, ix_photos_owner_created_at 인덱스 있음
+- keyset: 현재 쿼리 (커서 → (created_at, id) < 커서), 인덱스 있음
+
+쿼리는 app.services.pagination 의 photos_page_query 를 그대로 사용합니다.
+운영 DB(PostgreSQL)와 절대값은 다르지만 페이지가 깊어질 때의 증가 양상은 같습니다.
+
+실행:
+    python -m benchmarks.bench_pagination
+    python -m benchmarks.bench_pagination --rows 200000 --users 2 --pages 1,100,5000
+"""
+
+import argparse
+import datetime
+import json
+import os
+import sqlite3
+import statistics
+import tempfile
+import time
+import uuid
+
+from sqlalchemy import create_engine
+from sqlalchemy.future import select
+from sqlalchemy.orm import Session
+
+# models → database 는 DATABASE_URL을 요구 (이 벤치마크는 자체 동기 엔진을 사용)
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite://")
+
+from models import PhotoRecord  # noqa: E402
+from app.services.pagination import encode_cursor, photos_page_query  # noqa: E402
+
+INDEX_NAME = "ix_photos_owner_created_at"
+
+
+def _populate(path: str, rows: int, owners: list):
+    """합성 행 삽입 (사용자별로 번갈아 배정, 같은 초에 여러 장 → created_at 중복 포함)"""
+    engine = create_engine(f"sqlite:///{path}")
+    PhotoRecord.__table__.create(engine)
+    engine.dispose()
+
+    base = datetime.datetime(2025, 1, 1)
+    conn = sqlite3.connect(path)
+    conn.executemany(
+        "INSERT INTO photos (id, owner_id, original_path, status, created_at, attempts) "
+        "VALUES (?, ?, ?, 'COMPLETED', ?, 0)",
+        (
+            (
+                f"{i:08d}",
+                owners[i % len(owners)].hex,
+                f"storage/originals/{i:08d}.jpg",
+                (base + datetime.timedelta(seconds=i // 3)).isoformat(sep=" "),
+            )
+            for i in range(rows)
+        ),
+    )
+    # 이전 스키마처럼 목록용 인덱스 없이 시작 (측정 중간에 생성)
+    conn.execute(f"DROP INDEX {INDEX_NAME}")
+    conn.commit()
+    conn.close()
+
+
+def _time_query(session: Session, query, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        session.execute(query).scalars().all()
+        timings.append((time.perf_counter() - start) * 1000)
+    return round(statistics.median(timings), 2)
+
+
+def _cursor_before(session: Session, owner_id: uuid.UUID, offset: int):
+    """offset 번째 행 직전 행의 커서 (측정 밖에서 준비)"""
+    if offset == 0:
+        return None
+    row = session.execute(
+        select(PhotoRecord)
+        .where(PhotoRecord.owner_id == owner_id)
+        .order_by(PhotoRecord.created_at.desc(), PhotoRecord.id.desc())
+        .offset(offset - 1)
+        .limit(1)
+    ).scalar_one()
+    return encode_cursor(row.created_at, row.id)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=4)
+    parser.add_argument("--pages", default="1,100,10000")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="petcam-bench-")
+    path = os.path.join(workdir, "bench.db")
+    owners = [uuid.uuid4() for _ in range(args.users)]
+    owner_id = owners[0]
+    start = time.perf_counter()
+    _populate(path, args.rows, owners)
+    populate_seconds = round(time.perf_counter() - start, 1)
+
+    engine = create_engine(f"sqlite:///{path}")
+    pages = [int(p) for p in args.pages.split(",")]
+    results = {page: {"page": page, "offset_rows": (page - 1) * args.limit} for page in pages}
+
+    with Session(engine) as session:
+        # 목록용 인덱스 없음
+        for page in pages:
+            query = photos_page_query(owner_id, None, (page - 1) * args.limit, args.limit)
+            results[page]["offset_no_index_ms"] = _time_query(session, query, args.repeat)
+
+    conn = sqlite3.connect(path)
+    conn.execute(f"CREATE INDEX {INDEX_NAME} ON photos (owner_id, created_at, id)")
+    conn.execute("ANALYZE")
+    conn.close()
+
+    with Session(engine) as session:
+        for page in pages:
+            offset = (page - 1) * args.limit
+            results[page]["offset_ms"] = _time_query(
+                session, photos_page_query(owner_id, None, offset, args.limit), args.repeat
+            )
+            cursor = _cursor_before(session, owner_id, offset)
+            results[page]["keyset_ms"] = _time_query(
+                session, photos_page_query(owner_id, cursor, 0, args.limit), args.repeat
+            )
+
+    print(
+        json.dumps(
+            {
+                "benchmark": "pagination",
+                "rows": args.rows,
+                "users": args.users,
+                "limit": args.limit,
+                "populate_seconds": populate_seconds,
+                "results": list(results.values()),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+업스케일 입력 전처리 벤치마크 (축소 디코딩 + 리샘플 필터: 시간 / 피크 RSS / PSNR)
+
+휴대폰 원본 크기의 JPEG를 업스케일 입력 크기(UPSCALE_MAX_INPUT_SIZE)로 읽어들이는 방식별로
+디코딩 + 축소 시간, 피크 RSS 증가량, 이전 방식 결과 대비 PSNR을 비교합니다.
+ru_maxrss는 프로세스 단위 최댓값이므로 각 케이스는 별도 서브프로세스에서 실행합니다.
+
+- full_lanczos: 이전 방식 (전체 해상도 디코딩 → LANCZOS), PSNR 기준
+- draft_lanczos: 현재 기본값 (DCT 단계 축소 디코딩 → LANCZOS)
+- draft_area: UPSCALE_RESAMPLE=area (축소 디코딩 → BOX 평균)
+- full_area: 축소 디코딩 없이 BOX 평균
+- 입력은 시드 고정 합성 사진 (quality 92 JPEG), psnr_db 가 null 이면 기준과 같은 결과
+
+실행:
+    python -m benchmarks.bench_preprocess
+    python -m benchmarks.bench_preprocess --sizes 12MP --max-size 1080 --repeat 10
+"""
+
+import argparse
+import io
+import json
+import os
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+from PIL import Image
+
+from app.services.tiling import UPSCALE_MAX_INPUT_SIZE, _fitted_size, load_input
+
+SIZES = {
+    "2MP": (1600, 1200),  # 카메라 UXGA
+    "8MP": (3264, 2448),
+    "12MP": (4000, 3000),
+}
+MODES = {
+    "full_lanczos": ("lanczos", False),
+    "draft_lanczos": ("lanczos", True),
+    "draft_area": ("area", True),
+    "full_area": ("area", False),
+}
+
+
+def _peak_rss_mb() -> float:
+    """
+    이 프로세스의 최대 RSS (MB)
+
+    ru_maxrss 는 exec 후에도 부모(합성 사진을 만든 프로세스)의 최댓값을 이어받으므로
+    Linux 에서는 주소 공간별 최댓값인 /proc/self/status 의 VmHWM 을 씀.
+    benchmarks._common 은 torch 를 import 해서 기준 RSS가 커지므로 케이스 프로세스에서는 쓰지 않음
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / 1024 if sys.platform != "darwin" else peak / 1024 / 1024, 1)
+
+
+def _decoded_size(data: bytes, max_size: int, draft: bool):
+    """디코더가 실제로 만드는 래스터 크기 (축소 디코딩 배율 적용 후)"""
+    with Image.open(io.BytesIO(data)) as image:
+        if draft and max(image.size) > max_size:
+            image.draft("RGB", _fitted_size(image.size, max_size))
+        return image.size
+
+
+def _psnr(a: np.ndarray, b: np.ndarray):
+    """PSNR (dB), 완전히 같으면 None"""
+    mse = np.mean((a.astype(np.float64) - b.astype(np.float64)) ** 2)
+    return round(float(10 * np.log10(255.0**2 / mse)), 2) if mse else None
+
+
+def run_case(path: str, size: str, mode: str, max_size: int, repeat: int) -> dict:
+    """서브프로세스 안에서 실행되는 단일 케이스 (입력 JPEG는 부모 프로세스가 만듦)"""
+    with open(path, "rb") as f:
+        data = f.read()
+    resample, draft = MODES[mode]
+    baseline_rss = _peak_rss_mb()
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        image = load_input(io.BytesIO(data), max_size, resample, draft)
+        timings.append((time.perf_counter() - start) * 1000)
+    peak_rss = _peak_rss_mb()
+    decoded = _decoded_size(data, max_size, draft)
+
+    # 측정이 끝난 뒤에 기준(이전 방식) 결과를 만듦 (피크 RSS에 섞이지 않도록)
+    reference = load_input(io.BytesIO(data), max_size, *MODES["full_lanczos"])
+    return {
+        "size": size,
+        "mode": mode,
+        "input": "x".join(map(str, SIZES[size])),
+        "decoded": f"{decoded[0]}x{decoded[1]}",
+        "decoded_mb": round(decoded[0] * decoded[1] * 3 / 2**20, 1),
+        "output": f"{image.width}x{image.height}",
+        "median_ms": round(statistics.median(timings), 1),
+        "delta_rss_mb": round(peak_rss - baseline_rss, 1),
+        "psnr_db": _psnr(np.asarray(image), np.asarray(reference)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="2MP,8MP,12MP")
+    parser.add_argument("--modes", default=",".join(MODES))
+    parser.add_argument("--max-size", type=int, default=UPSCALE_MAX_INPUT_SIZE or 1600)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--case", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        path, size, mode = args.case.split(":")
+        print(json.dumps(run_case(path, size, mode, args.max_size, args.repeat)))
+        return
+
+    from benchmarks._common import synthetic_photo
+
+    workdir = tempfile.mkdtemp(prefix="petcam-bench-")
+    results = []
+    try:
+        for size in args.sizes.split(","):
+            path = os.path.join(workdir, f"{size}.jpg")
+            synthetic_photo(SIZES[size], seed=0).save(path, format="JPEG", quality=92)
+            for mode in args.modes.split(","):
+                proc = subprocess.run(
+                    [
+                        sys.executable, "-m", "benchmarks.bench_preprocess",
+                        "--case", f"{path}:{size}:{mode}",
+                        "--max-size", str(args.max_size), "--repeat", str(args.repeat),
+                    ],
+                    capture_output=True,
+                    text=True,
+                )
+                if proc.returncode == 0:
+                    results.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+                else:
+                    error = (proc.stderr.strip().splitlines() or ["killed"])[-1]
+                    results.append({"size": size, "mode": mode, "error": error})
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print(
+        json.dumps(
+            {"benchmark": "preprocess", "max_size": args.max_size, "results": results},
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+렌디션 전송량 / 디코딩 시간 벤치마크
+
+UXGA(1600x1200) 사진의 4배 업스케일 결과(6400x4800)를 기준으로,
+렌디션(thumb / medium / full) x 형식(jpeg / webp / avif)별로
+- bytes: 응답 크기 (갤러리 타일 하나의 전송량)
+- generate_ms: 원본 파일에서 렌디션을 만드는 시간 (요청 시 생성 경로, draft 축소 디코딩 포함)
+- decode_ms: 클라이언트가 받은 파일을 디코딩하는 시간 (PIL 기준)
+을 측정합니다.
+
+실행:
+    python -m benchmarks.bench_renditions
+    python -m benchmarks.bench_renditions --formats jpeg,webp --repeat 5
+"""
+
+import argparse
+import io
+import json
+import os
+import statistics
+import tempfile
+import time
+
+import numpy as np
+from PIL import Image
+
+from app.services import renditions
+
+
+def _upscaled_result(width: int, height: int) -> Image.Image:
+    """그라디언트 + 노이즈 사진을 4배 키운 결과 (업스케일 결과와 비슷한 부드러운 디테일)"""
+    rng = np.random.default_rng(42)
+    yy, xx = np.mgrid[0:height, 0:width].astype(np.float32)
+    base = np.stack(
+        [xx * 255 / width, yy * 255 / height, (xx + yy) * 127 / (width + height)], -1
+    )
+    noise = rng.normal(0, 12, (height, width, 3)).astype(np.float32)
+    photo = Image.fromarray(np.clip(base + noise, 0, 255).astype(np.uint8))
+    return photo.resize((width * 4, height * 4), Image.BICUBIC)
+
+
+def _median_ms(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return round(statistics.median(timings), 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--formats", default="jpeg,webp,avif")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="petcam-bench-")
+    os.chdir(workdir)
+    os.makedirs("storage/results")
+    source_path = "storage/results/bench.jpg"
+    _upscaled_result(1600, 1200).save(source_path, format="JPEG")
+
+    results = []
+    for fmt in args.formats.split(","):
+        if not renditions.is_supported(fmt):
+            results.append({"format": fmt, "error": "not supported by Pillow"})
+            continue
+        for size in ("thumb", "medium", "full"):
+            if size == "full" and fmt == "jpeg":
+                path = source_path  # 변환 없이 결과 파일 그대로 전송
+                generate_ms = 0.0
+            else:
+                generate_ms = _median_ms(
+                    lambda: renditions.generate_sync(source_path, size, fmt), args.repeat
+                )
+                path = renditions.rendition_path(source_path, size, fmt)
+            with open(path, "rb") as f:
+                data = f.read()
+            decode_ms = _median_ms(lambda: Image.open(io.BytesIO(data)).load(), args.repeat)
+            with Image.open(io.BytesIO(data)) as image:
+                dimensions = f"{image.width}x{image.height}"
+            results.append(
+                {
+                    "size": size,
+                    "format": fmt,
+                    "dimensions": dimensions,
+                    "bytes": len(data),
+                    "generate_ms": generate_ms,
+                    "decode_ms": decode_ms,
+                }
+            )
+
+    print(json.dumps({"benchmark": "renditions", "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
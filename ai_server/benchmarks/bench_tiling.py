@@ -0,0 +1,129 @@
+"""
+타일 업스케일 메모리/시간 벤치마크 (2MP / 8MP / 12MP)
+
+입력 크기별로 타일 모드와 전체 이미지 모드의 피크 RSS와 소요 시간을 측정합니다.
+ru_maxrss는 프로세스 단위 최댓값이므로 각 케이스는 별도 서브프로세스에서 실행합니다.
+
+- RealESRGAN 가중치가 있으면 실제 RRDBNet, 없으면 작은 대체 네트워크 사용
+- 전체 이미지 모드는 큰 입력에서 메모리 부족으로 실패할 수 있으며, 그 경우 error로 기록
+
+실행:
+    python -m benchmarks.bench_tiling
+    python -m benchmarks.bench_tiling --sizes 2MP --modes tiled --tile 192 --overlap 16
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+
+import numpy as np
+import torch
+from PIL import Image
+
+from app.services.inference_engine import BatchInferenceEngine
+from app.services.tiling import upscale_tiled
+from benchmarks._common import load_network, peak_rss_mb
+
+SIZES = {
+    "2MP": (1600, 1200),  # 카메라 UXGA
+    "8MP": (3264, 2448),
+    "12MP": (4000, 3000),
+}
+
+
+def _synthetic_photo(width: int, height: int) -> Image.Image:
+    """그라디언트 + 노이즈로 만든 고정 입력 (재현 가능)"""
+    rng = np.random.default_rng(42)
+    yy, xx = np.mgrid[0:height, 0:width].astype(np.float32)
+    base = np.stack(
+        [xx * 255 / width, yy * 255 / height, (xx + yy) * 127 / (width + height)], -1
+    )
+    noise = rng.normal(0, 12, (height, width, 3)).astype(np.float32)
+    return Image.fromarray(np.clip(base + noise, 0, 255).astype(np.uint8))
+
+
+def run_case(size: str, mode: str, tile: int, overlap: int) -> dict:
+    """서브프로세스 안에서 실행되는 단일 케이스"""
+    network, name = load_network(features=16, blocks=2)
+
+    def forward(batch):
+        with torch.no_grad():
+            return network(batch).clamp_(0, 1)
+
+    engine = BatchInferenceEngine(forward, scale=4, max_batch_size=4, max_wait_ms=0)
+    image = _synthetic_photo(*SIZES[size])
+    baseline_rss = peak_rss_mb()
+
+    start = time.perf_counter()
+    if mode == "tiled":
+        result = upscale_tiled(
+            image, engine.infer_many, scale=4, tile_size=tile, overlap=overlap
+        )
+    else:
+        result = engine.upscale(image)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "size": size,
+        "mode": mode,
+        "network": name,
+        "input": f"{image.width}x{image.height}",
+        "output": f"{result.width}x{result.height}",
+        "seconds": round(elapsed, 2),
+        "baseline_rss_mb": baseline_rss,
+        "peak_rss_mb": peak_rss_mb(),
+        "delta_rss_mb": round(peak_rss_mb() - baseline_rss, 1),
+        # uint8 결과 이미지 자체가 차지하는 메모리 (모드와 무관하게 필요)
+        "output_buffer_mb": round(result.width * result.height * 3 / 2**20, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", default="2MP,8MP,12MP")
+    parser.add_argument("--modes", default="tiled,whole")
+    parser.add_argument("--tile", type=int, default=256)
+    parser.add_argument("--overlap", type=int, default=16)
+    parser.add_argument("--case", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        size, mode = args.case.split(":")
+        print(json.dumps(run_case(size, mode, args.tile, args.overlap)))
+        return
+
+    results = []
+    for size in args.sizes.split(","):
+        for mode in args.modes.split(","):
+            proc = subprocess.run(
+                [
+                    sys.executable, "-m", "benchmarks.bench_tiling",
+                    "--case", f"{size}:{mode}",
+                    "--tile", str(args.tile), "--overlap", str(args.overlap),
+                ],
+                capture_output=True,
+                text=True,
+            )
+            if proc.returncode == 0:
+                results.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+            else:
+                error = (proc.stderr.strip().splitlines() or ["killed"])[-1]
+                results.append({"size": size, "mode": mode, "error": error})
+
+    print(
+        json.dumps(
+            {
+                "benchmark": "tiling",
+                "tile": args.tile,
+                "overlap": args.overlap,
+                "results": results,
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+"""
+업로드 중 API 지연 시간 벤치마크 (/photos p50 / p99)
+
+uvicorn(워커 1개)을 띄우고, 업로드 N개가 계속 진행 중인 상태에서
+GET /photos 지연 시간을 측정합니다. 업로드가 이벤트 루프를 막지 않으면
+업로드가 없을 때(idle)와 p99가 크게 달라지지 않아야 합니다.
+
+- streaming: 현재 /upscale (스트리밍 저장, 스레드에서 기록)
+- legacy: 이전 방식 (UploadFile + 이벤트 루프에서 shutil.copyfileobj), 비교용으로 벤치마크 앱에만 추가
+- 업로드는 별도 프로세스에서 모바일 클라이언트처럼 청크를 나눠 보냄 (동시에 N개가 in-flight)
+- DB는 임시 SQLite 파일, 저장소는 임시 디렉터리 (작업 트리를 건드리지 않음)
+- 요청 한도는 RATE_LIMIT_ENABLED=0 으로 끔
+
+실행:
+    python -m benchmarks.bench_upload_latency
+    python -m benchmarks.bench_upload_latency --uploads 20 --size-mb 4 --requests 300
+    python -m benchmarks.bench_upload_latency --modes streaming
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import multiprocessing
+import os
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+import numpy as np
+from PIL import Image
+
+AI_SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+UPLOAD_PATHS = {"streaming": "/upscale", "legacy": "/bench/upscale-legacy"}
+
+
+def create_app():
+    """벤치마크용 앱: main.app + 이전 방식 업로드 엔드포인트 (uvicorn --factory)"""
+    import uuid
+
+    from fastapi import Depends, File, UploadFile
+
+    from main import app
+    from models import PhotoRecord, ProcessingStatus
+    from app.auth import get_current_user
+    from app.core.deps import get_db
+
+    @app.post(UPLOAD_PATHS["legacy"])
+    async def legacy_upload(
+        file: UploadFile = File(...),
+        db=Depends(get_db),
+        current_user=Depends(get_current_user),
+    ):
+        photo_id = str(uuid.uuid4())
+        orig_path = f"storage/originals/{photo_id}.jpg"
+        with open(orig_path, "wb") as buffer:
+            shutil.copyfileobj(file.file, buffer)
+        db.add(PhotoRecord(id=photo_id, original_path=orig_path, status=ProcessingStatus.QUEUED))
+        await db.commit()
+        return {"id": photo_id}
+
+    return app
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _jpeg_payload(size_mb: float) -> bytes:
+    """size_mb 정도 크기의 JPEG (노이즈 이미지 → 압축이 잘 안 됨)"""
+    side = int((size_mb * 1024 * 1024 / 3) ** 0.5 * 1.55)
+    rng = np.random.default_rng(0)
+    buffer = io.BytesIO()
+    Image.fromarray(rng.integers(0, 256, (side, side, 3), dtype=np.uint8)).save(
+        buffer, format="JPEG", quality=95
+    )
+    return buffer.getvalue()
+
+
+def _multipart(data: bytes, chunk: int, delay: float):
+    boundary = "petcambench"
+
+    async def body():
+        yield f"--{boundary}\r\n".encode()
+        yield b'Content-Disposition: form-data; name="file"; filename="bench.jpg"\r\n'
+        yield b"Content-Type: image/jpeg\r\n\r\n"
+        for i in range(0, len(data), chunk):
+            yield data[i : i + chunk]
+            await asyncio.sleep(delay)
+        yield f"\r\n--{boundary}--\r\n".encode()
+
+    headers = {"Content-Type": f"multipart/form-data; boundary={boundary}"}
+    return body, headers
+
+
+def _percentile(values, p: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))]
+
+
+async def _measure(client: httpx.AsyncClient, headers: dict, n: int) -> dict:
+    latencies = []
+    for _ in range(n):
+        start = time.perf_counter()
+        response = await client.get("/photos", headers=headers, params={"limit": 20})
+        latencies.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+        await asyncio.sleep(0.005)
+    return {
+        "requests": n,
+        "p50_ms": round(statistics.median(latencies), 2),
+        "p99_ms": round(_percentile(latencies, 99), 2),
+        "max_ms": round(max(latencies), 2),
+    }
+
+
+
+def _upload_loop(base_url, path, auth, data, uploads, chunk, stop, results):
+    """별도 프로세스에서 업로드 N개를 계속 in-flight 상태로 유지"""
+
+    async def uploader(client):
+        while not stop.is_set():
+            body, headers = _multipart(data, chunk, delay=0.002)
+            try:
+                response = await client.post(path, content=body(), headers={**auth, **headers})
+                results.append(response.status_code)
+            except httpx.HTTPError:
+                results.append(0)
+
+    async def upload_all():
+        limits = httpx.Limits(max_connections=uploads)
+        async with httpx.AsyncClient(base_url=base_url, timeout=300, limits=limits) as client:
+            await asyncio.gather(*[uploader(client) for _ in range(uploads)])
+
+    asyncio.run(upload_all())
+
+
+def run(base_url: str, mode: str, uploads: int, data: bytes, requests: int, chunk_kb: int) -> dict:
+    credentials = {"username": "benchuser", "password": "benchpassword"}
+    httpx.post(f"{base_url}/register", json=credentials)
+    token = httpx.post(f"{base_url}/token", data=credentials).json()["access_token"]
+    auth = {"Authorization": f"Bearer {token}"}
+
+    async def measure(n):
+        async with httpx.AsyncClient(base_url=base_url, timeout=120) as client:
+            return await _measure(client, auth, n)
+
+    idle = asyncio.run(measure(requests))
+
+    manager = multiprocessing.Manager()
+    stop, results = manager.Event(), manager.list()
+    proc = multiprocessing.Process(
+        target=_upload_loop,
+        args=(base_url, UPLOAD_PATHS[mode], auth, data, uploads, chunk_kb * 1024, stop, results),
+    )
+    proc.start()
+    time.sleep(1.0)  # 업로드가 모두 진행 중인 상태가 되도록
+    loaded = asyncio.run(measure(requests))
+    stop.set()
+    proc.join()
+
+    return {
+        "mode": mode,
+        "uploads_in_flight": uploads,
+        "uploads_completed": len(results),
+        "upload_errors": sum(1 for c in results if c != 200),
+        "idle": idle,
+        "under_upload": loaded,
+    }
+
+
+def _run_server(mode: str, args, data: bytes) -> dict:
+    """모드마다 새 서버 (깨끗한 DB/저장소)"""
+    workdir = tempfile.mkdtemp(prefix="petcam-bench-")
+    os.makedirs(os.path.join(workdir, "storage", "originals"))
+    port = _free_port()
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite+aiosqlite:///{workdir}/bench.db",
+        "SECRET_KEY": "bench-secret-key-0123456789abcdef",
+        "RATE_LIMIT_ENABLED": "0",
+        "MAX_UPLOAD_SIZE": str(len(data) + 1024 * 1024),
+        "PYTHONPATH": AI_SERVER_DIR,
+        "LOG_LEVEL": "warning",
+    }
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "benchmarks.bench_upload_latency:create_app",
+            "--factory", "--port", str(port), "--log-level", "warning", "--no-access-log",
+        ],
+        cwd=workdir,
+        env=env,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + 60
+        while True:
+            try:
+                httpx.get(f"{base_url}/health", timeout=1).raise_for_status()
+                break
+            except httpx.HTTPError:
+                if time.monotonic() > deadline or server.poll() is not None:
+                    raise RuntimeError("server did not start")
+                time.sleep(0.2)
+
+        return run(base_url, mode, args.uploads, data, args.requests, args.chunk_kb)
+    finally:
+        server.terminate()
+        server.wait()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--uploads", type=int, default=20, help="uploads in flight")
+    parser.add_argument("--size-mb", type=float, default=4.0)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--chunk-kb", type=int, default=64)
+    parser.add_argument("--modes", default="legacy,streaming")
+    args = parser.parse_args()
+
+    data = _jpeg_payload(args.size_mb)
+    results = [_run_server(mode, args, data) for mode in args.modes.split(",")]
+    print(
+        json.dumps(
+            {
+                "benchmark": "upload_latency",
+                "upload_bytes": len(data),
+                "cpu_count": os.cpu_count(),
+                "results": results,
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+이미지 처리 단계 마이크로벤치마크 설정 (pytest-benchmark)
+
+- 코퍼스: 해상도별 JPEG (기본은 시드 고정 합성 사진, BENCH_CORPUS_DIR 를 주면 그 폴더의 첫 사진을
+  각 해상도로 잘라서 사용) → 실행마다 같은 입력
+- 기준선: benchmarks/.baselines (--benchmark-save=<이름> 으로 저장, --benchmark-compare 로 비교)
+- 회귀 기준: --benchmark-compare 만 주면 STAGE_BENCH_FAIL (기본 "median:20%") 을 넘을 때 실패
+  (--benchmark-compare-fail 을 직접 주면 그 값 사용)
+"""
+
+import io
+import os
+from dataclasses import dataclass
+
+import pytest
+from PIL import Image, ImageOps
+
+from benchmarks._common import synthetic_photo
+
+# ============ 설정 ============
+BENCH_CORPUS_DIR = os.getenv("BENCH_CORPUS_DIR")
+STAGE_BENCH_FAIL = os.getenv("STAGE_BENCH_FAIL", "median:20%")
+BASELINES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".baselines")
+
+# 휴대폰 업로드에서 흔한 크기 (UXGA 는 타일 업스케일 입력 상한)
+RESOLUTIONS = {
+    "vga": (640, 480),
+    "hd": (1280, 720),
+    "uxga": (1600, 1200),
+}
+SCALE = 4
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    # pytest-benchmark 가 저장소를 열기 전에 기본값만 바꿈 (명령줄에서 준 값은 그대로)
+    if not hasattr(config.option, "benchmark_storage"):
+        return
+    if config.option.benchmark_storage == "file://./.benchmarks":
+        config.option.benchmark_storage = f"file://{BASELINES_DIR}"
+    if config.option.benchmark_compare and not config.option.benchmark_compare_fail:
+        from pytest_benchmark.utils import parse_compare_fail
+
+        config.option.benchmark_compare_fail = [
+            parse_compare_fail(expr) for expr in STAGE_BENCH_FAIL.split()
+        ]
+
+
+def _corpus_photo(size) -> Image.Image:
+    """BENCH_CORPUS_DIR 의 첫 사진을 size 비율로 가운데 자르고 축소"""
+    names = sorted(
+        n for n in os.listdir(BENCH_CORPUS_DIR) if n.lower().endswith((".jpg", ".jpeg"))
+    )
+    if not names:
+        raise FileNotFoundError(f"No JPEG files in {BENCH_CORPUS_DIR}")
+    with Image.open(os.path.join(BENCH_CORPUS_DIR, names[0])) as source:
+        return ImageOps.fit(ImageOps.exif_transpose(source).convert("RGB"), size, Image.LANCZOS)
+
+
+@dataclass
+class Photo:
+    """코퍼스 사진 하나와 단계별 입력"""
+
+    name: str
+    path: str  # 업로드 원본 (JPEG 파일)
+    data: bytes  # 같은 JPEG 바이트 (ImageService.upscale_image 입력)
+    image: Image.Image  # 디코딩된 RGB
+    upscaled: Image.Image  # 추론 결과 크기 (x4), 썸네일/인코딩 단계 입력
+
+
+@pytest.fixture(scope="session", params=list(RESOLUTIONS))
+def photo(request, tmp_path_factory) -> Photo:
+    name = request.param
+    size = RESOLUTIONS[name]
+    image = _corpus_photo(size) if BENCH_CORPUS_DIR else synthetic_photo(size, seed=0)
+
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=92)
+    path = tmp_path_factory.mktemp("corpus") / f"{name}.jpg"
+    path.write_bytes(buffer.getvalue())
+
+    decoded = Image.open(path).convert("RGB")
+    upscaled = decoded.resize((size[0] * SCALE, size[1] * SCALE), Image.NEAREST)
+    return Photo(name, str(path), buffer.getvalue(), decoded, upscaled)
@@ -0,0 +1,379 @@
+"""
+부하 테스트 (혼합 워크로드, 고정 도착률: 처리량 / p50 / p95 / p99 / 오류율)
+
+앱과 업스케일 워커를 프로세스 안에서(ASGI) 띄우고, 실제 추론 대신 결정적인 가짜 엔진
+(호출마다 --latency-ms 대기 + --cpu-ms 연산)을 써서 모델/GPU 없이도 같은 조건으로 반복합니다.
+커밋마다 실행해서 JSON 결과를 비교하는 용도입니다.
+
+워크로드 (각각 초당 고정 개수로 요청, 0이면 끔):
+- upscale: POST /upscale (요청마다 다른 이미지 → 결과 캐시에 걸리지 않음)
+- bestcut: POST /bestcut (--frames 장 연사)
+- photos: GET /photos?limit=20
+- file: GET /photos/{id} (미리 처리해 둔 사진의 full / medium / thumb 을 번갈아)
+
+- 열린 루프(open loop): 앞 요청이 끝나기를 기다리지 않고 예정 시각에 보냄.
+  지연 시간은 예정 시각부터 재므로 서버가 밀리면 대기 시간까지 그대로 드러남
+- 오류: 예외 또는 4xx/5xx 응답
+- jobs: 부하 구간에 올라온 업스케일 작업이 모두 끝날 때까지의 시간, 업로드 → 완료 시간
+  (워커의 upscale.job / queue.wait span 으로 계산)
+- DB는 임시 SQLite 파일, 저장소는 임시 디렉터리, 요청 한도는 RATE_LIMIT_ENABLED=0 으로 끔
+- 처리 로그는 stderr, 결과 JSON 만 stdout
+
+실행:
+    python -m benchmarks.loadtest
+    python -m benchmarks.loadtest --duration 60 --upscale-rps 4 --photos-rps 20
+    python -m benchmarks.loadtest --latency-ms 500 --cpu-ms 50 --worker-concurrency 4
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import logging
+import math
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+WORKDIR = tempfile.mkdtemp(prefix="petcam-loadtest-")
+# 이미 DATABASE_URL 이 있어도(컨테이너/개발 셸) 항상 임시 DB 사용
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{WORKDIR}/bench.db"
+os.environ.setdefault("SECRET_KEY", "bench-secret-key")
+os.environ["RATE_LIMIT_ENABLED"] = "0"
+# 작업별 업로드 → 완료 시간을 span 으로 계산
+os.environ["TRACING_EXPORTER"] = "memory"
+os.environ.setdefault("TRACING_MEMORY_SPANS", "200000")
+
+import httpx  # noqa: E402
+import numpy as np  # noqa: E402
+from PIL import Image  # noqa: E402
+from sqlalchemy import func, select  # noqa: E402
+
+from database import SessionLocal, engine  # noqa: E402
+from main import app, shutdown_event, startup_event  # noqa: E402
+from models import PhotoRecord, ProcessingStatus  # noqa: E402
+from app.core import tracing  # noqa: E402
+from app.core.db_stats import pool_stats  # noqa: E402
+from app.services.ai_service import model_manager  # noqa: E402
+from app.worker import UpscaleWorker  # noqa: E402
+
+AI_SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WORKLOADS = ("upscale", "bestcut", "photos", "file")
+FILE_SIZES = ("full", "medium", "thumb")
+_PENDING = (ProcessingStatus.QUEUED, ProcessingStatus.PROCESSING)
+
+
+class FakeInferenceEngine:
+    """
+    결정적인 가짜 추론 엔진 (ModelManager 에 넣어서 process_image_sync 를 그대로 사용)
+
+    infer_many 호출마다 latency_ms 만큼 기다리고 cpu_ms 동안 행렬 곱을 반복한 뒤
+    최근접 확대 결과를 돌려줍니다. 기본 이미지 크기는 타일 하나보다 작아서 작업당 한 번 호출됩니다.
+    행렬 곱은 실제 추론처럼 대부분 GIL 밖에서 돌아 이벤트 루프를 막지 않습니다.
+    """
+
+    scale = 4
+    max_batch_size = 1
+
+    def __init__(self, latency_ms: float, cpu_ms: float):
+        self.latency = latency_ms / 1000
+        self.cpu = cpu_ms / 1000
+        self._matrix = np.ones((128, 128), np.float32)
+        self.calls = 0
+
+    def _burn(self):
+        deadline = time.perf_counter() + self.cpu
+        while time.perf_counter() < deadline:
+            self._matrix @ self._matrix
+
+    def infer_many(self, arrays):
+        self.calls += 1
+        self._burn()
+        time.sleep(self.latency)
+        return [
+            np.repeat(np.repeat(a.astype(np.float32), self.scale, 0), self.scale, 1)
+            for a in arrays
+        ]
+
+    def upscale(self, image: Image.Image) -> Image.Image:
+        (result,) = self.infer_many([np.asarray(image)])
+        return Image.fromarray(result.astype(np.uint8))
+
+
+def _jpeg(rng: np.random.Generator, size: int) -> bytes:
+    buffer = io.BytesIO()
+    Image.fromarray(rng.integers(0, 256, (size, size, 3), dtype=np.uint8)).save(
+        buffer, format="JPEG", quality=90
+    )
+    return buffer.getvalue()
+
+
+def _percentile(values, p: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))]
+
+
+def _latency_summary(values) -> dict:
+    if not values:
+        return {"p50_ms": None, "p95_ms": None, "p99_ms": None, "max_ms": None}
+    return {
+        "p50_ms": round(_percentile(values, 50), 2),
+        "p95_ms": round(_percentile(values, 95), 2),
+        "p99_ms": round(_percentile(values, 99), 2),
+        "max_ms": round(max(values), 2),
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=AI_SERVER_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def _login(client: httpx.AsyncClient):
+    credentials = {"username": "loadtest", "password": "loadtest-password"}
+    await client.post("/register", json=credentials)
+    response = await client.post("/token", data=credentials)
+    response.raise_for_status()
+    client.headers["Authorization"] = f"Bearer {response.json()['access_token']}"
+
+
+async def _status_counts() -> dict:
+    async with SessionLocal() as db:
+        rows = await db.execute(
+            select(PhotoRecord.status, func.count()).group_by(PhotoRecord.status)
+        )
+        return {status.value: count for status, count in rows}
+
+
+async def _wait_for_jobs(timeout: float) -> float:
+    """QUEUED / PROCESSING 작업이 없어질 때까지 대기, 걸린 시간(초) 반환"""
+    start = time.perf_counter()
+    while time.perf_counter() - start < timeout:
+        counts = await _status_counts()
+        if not any(counts.get(status.value) for status in _PENDING):
+            break
+        await asyncio.sleep(0.05)
+    return time.perf_counter() - start
+
+
+class Workload:
+    """요청 하나를 보내는 함수 + 결과 (예정 시각 기준 지연 시간, 상태 코드)"""
+
+    def __init__(self, name: str, rate: float, send):
+        self.name = name
+        self.rate = rate
+        self.send = send
+        self.latencies = []
+        self.statuses = {}
+        self.errors = 0
+        self.elapsed = 0.0
+
+    async def _one(self, i: int, scheduled: float):
+        try:
+            response = await self.send(i)
+            status = response.status_code
+        except Exception:
+            status = 0
+        self.latencies.append((time.perf_counter() - scheduled) * 1000)
+        self.statuses[str(status)] = self.statuses.get(str(status), 0) + 1
+        if status == 0 or status >= 400:
+            self.errors += 1
+
+    async def run(self, duration: float):
+        start = time.perf_counter()
+        tasks = []
+        for i in range(int(self.rate * duration)):
+            scheduled = start + i / self.rate
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(self._one(i, scheduled)))
+        await asyncio.gather(*tasks)
+        self.elapsed = time.perf_counter() - start
+
+    def summary(self) -> dict:
+        requests = len(self.latencies)
+        return {
+            "rate_rps": self.rate,
+            "requests": requests,
+            "errors": self.errors,
+            "error_rate": round(self.errors / requests, 4) if requests else 0.0,
+            "throughput_rps": round((requests - self.errors) / self.elapsed, 2)
+            if self.elapsed
+            else 0.0,
+            **_latency_summary(self.latencies),
+            "status_codes": self.statuses,
+        }
+
+
+def _workloads(client: httpx.AsyncClient, args, file_ids) -> list:
+    rng = np.random.default_rng(args.seed)
+
+    def payloads(rate: float, per_request: int):
+        return [
+            [_jpeg(rng, args.image_size) for _ in range(per_request)]
+            for _ in range(math.ceil(rate * args.duration))
+        ]
+
+    # 이미지는 미리 만들어 둠 (인코딩 시간이 요청 간격에 섞이지 않도록)
+    upscale_images = payloads(args.upscale_rps, 1)
+    bestcut_frames = payloads(args.bestcut_rps, args.frames)
+
+    async def upscale(i):
+        files = {"file": (f"upscale-{i}.jpg", upscale_images[i][0], "image/jpeg")}
+        return await client.post("/upscale", files=files)
+
+    async def bestcut(i):
+        files = [
+            ("files", (f"frame-{i}-{n}.jpg", frame, "image/jpeg"))
+            for n, frame in enumerate(bestcut_frames[i])
+        ]
+        return await client.post("/bestcut", files=files)
+
+    async def photos(i):
+        return await client.get("/photos", params={"limit": 20})
+
+    async def file(i):
+        photo_id = file_ids[i % len(file_ids)]
+        size = FILE_SIZES[i // len(file_ids) % len(FILE_SIZES)]
+        return await client.get(f"/photos/{photo_id}", params={"size": size})
+
+    sends = {"upscale": upscale, "bestcut": bestcut, "photos": photos, "file": file}
+    return [
+        Workload(name, getattr(args, f"{name}_rps"), sends[name])
+        for name in WORKLOADS
+        if getattr(args, f"{name}_rps") > 0
+    ]
+
+
+async def _seed_photos(client: httpx.AsyncClient, args) -> list:
+    """file 워크로드용: 처리가 끝난 사진 몇 장 (렌디션도 생성됨)"""
+    rng = np.random.default_rng(args.seed + 1)
+    ids = []
+    for i in range(args.seed_photos):
+        files = {"file": (f"seed-{i}.jpg", _jpeg(rng, args.image_size), "image/jpeg")}
+        response = await client.post("/upscale", files=files)
+        response.raise_for_status()
+        ids.append(response.json()["id"])
+    await _wait_for_jobs(args.drain_timeout)
+    return ids
+
+
+def _job_summary(drain_seconds: float, counts: dict) -> dict:
+    spans = tracing.recent_spans()
+
+    def durations(name):
+        return [
+            (span.end_time - span.start_time) / 1e6 for span in spans if span.name == name
+        ]
+
+    return {
+        "completed": counts.get(ProcessingStatus.COMPLETED.value, 0),
+        "failed": counts.get(ProcessingStatus.FAILED.value, 0),
+        "pending": sum(counts.get(status.value, 0) for status in _PENDING),
+        "drain_seconds": round(drain_seconds, 2),
+        "end_to_end": _latency_summary(durations("upscale.job")),
+        "queue_wait": _latency_summary(durations("queue.wait")),
+    }
+
+
+async def _main(args) -> dict:
+    logging.getLogger("httpx").setLevel(logging.WARNING)  # 요청마다 찍히는 로그 끄기
+    os.chdir(WORKDIR)
+    for name in ("originals", "results"):
+        os.makedirs(os.path.join("storage", name), exist_ok=True)
+
+    fake = FakeInferenceEngine(args.latency_ms, args.cpu_ms)
+    model_manager.loader = lambda: fake
+    loop = asyncio.get_running_loop()
+    # 워커 프로세스와 같게: 추론 스레드는 동시 처리 수만큼
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=args.worker_concurrency))
+    await loop.run_in_executor(None, model_manager.load)
+    await startup_event()
+
+    worker = UpscaleWorker(concurrency=args.worker_concurrency, poll_interval=0.05)
+    worker_task = asyncio.create_task(worker.run())
+    try:
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://loadtest", timeout=300
+        ) as client:
+            await _login(client)
+            file_ids = await _seed_photos(client, args)
+
+            # 측정 구간만 집계
+            tracing.memory_exporter.clear()
+            pool_stats.reset()
+            fake.calls = 0
+            workloads = _workloads(client, args, file_ids)
+            start = time.perf_counter()
+            await asyncio.gather(*[w.run(args.duration) for w in workloads])
+            load_seconds = time.perf_counter() - start
+            drain_seconds = await _wait_for_jobs(args.drain_timeout)
+            counts = await _status_counts()
+            db_pool = pool_stats.snapshot()
+    finally:
+        worker.stop()
+        await worker_task
+        await shutdown_event()
+        await engine.dispose()
+
+    # 미리 처리한 사진은 jobs 집계에서 뺌
+    counts[ProcessingStatus.COMPLETED.value] = (
+        counts.get(ProcessingStatus.COMPLETED.value, 0) - len(file_ids)
+    )
+    return {
+        "benchmark": "loadtest",
+        "commit": _git_commit(),
+        "cpu_count": os.cpu_count(),
+        "config": vars(args),
+        "load_seconds": round(load_seconds, 2),
+        "results": {w.name: w.summary() for w in workloads},
+        "jobs": _job_summary(drain_seconds, counts),
+        "inference_calls": fake.calls,
+        "db_pool": db_pool,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--duration", type=float, default=20, help="seconds of load")
+    parser.add_argument("--upscale-rps", type=float, default=2)
+    parser.add_argument("--bestcut-rps", type=float, default=0.5)
+    parser.add_argument("--photos-rps", type=float, default=10)
+    parser.add_argument("--file-rps", type=float, default=5)
+    parser.add_argument("--frames", type=int, default=5, help="frames per /bestcut")
+    parser.add_argument("--image-size", type=int, default=96, help="upload width/height (px)")
+    parser.add_argument("--latency-ms", type=float, default=200, help="fake inference wait")
+    parser.add_argument("--cpu-ms", type=float, default=20, help="fake inference CPU burn")
+    parser.add_argument("--worker-concurrency", type=int, default=2)
+    parser.add_argument("--seed-photos", type=int, default=5)
+    parser.add_argument("--drain-timeout", type=float, default=120)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    if args.file_rps > 0 and args.seed_photos < 1:
+        parser.error("--file-rps needs --seed-photos >= 1 (or set --file-rps 0)")
+
+    # 처리 로그(print)는 stderr 로 → stdout 에는 결과 JSON 만
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            result = asyncio.run(_main(args))
+    finally:
+        shutil.rmtree(WORKDIR, ignore_errors=True)
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
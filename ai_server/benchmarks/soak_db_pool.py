@@ -0,0 +1,122 @@
+"""
+DB 커넥션 풀 포화 소크 테스트 (워커 프로세스 하나 기준)
+
+동시 작업 수를 단계적으로 늘리면서, 각 작업이 커넥션을 꺼내 쿼리 후 --hold-ms 동안 잡고 있다가
+돌려주는 일을 --seconds 동안 반복합니다. 동시 작업 수가 pool_size + max_overflow 를 넘으면
+나머지는 풀에서 기다리고(wait), pool_timeout 을 넘기면 시간 초과가 납니다.
+
+단계마다 처리량(ops/s), 커넥션 대기 시간 p50 / p99 / 최대, 대기 시간 히스토그램,
+시간 초과 수, 최대 동시 사용 커넥션 수를 출력합니다 (app/core/db_stats 의 계측 그대로).
+
+- DB: DATABASE_URL 이 있으면 그 DB (예: 운영과 같은 PostgreSQL), 없으면 임시 SQLite 파일
+- 풀 설정은 --pool-size / --max-overflow / --pool-timeout 으로 (DB_POOL_* 환경 변수와 같음)
+
+실행:
+    python -m benchmarks.soak_db_pool
+    python -m benchmarks.soak_db_pool --pool-size 5 --max-overflow 10 --concurrency 5,15,30,60
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import tempfile
+import time
+
+
+def _percentile(values, p: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))]
+
+
+async def _step(concurrency: int, seconds: float, hold: float) -> dict:
+    from sqlalchemy import text
+    from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+    from database import SessionLocal, pool_status
+    from app.core.db_stats import pool_stats
+
+    pool_stats.reset()
+    waits, ops, timeouts = [], 0, 0
+    deadline = time.monotonic() + seconds
+
+    async def worker():
+        nonlocal ops, timeouts
+        while time.monotonic() < deadline:
+            start = time.perf_counter()
+            try:
+                async with SessionLocal() as session:
+                    await session.connection()
+                    waits.append((time.perf_counter() - start) * 1000)
+                    await session.execute(text("SELECT 1"))
+                    await asyncio.sleep(hold)  # 요청 처리 중 커넥션을 잡고 있는 시간
+            except PoolTimeoutError:
+                timeouts += 1
+                continue
+            ops += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    elapsed = time.perf_counter() - started
+    stats = pool_stats.snapshot()
+    return {
+        "concurrency": concurrency,
+        "ops": ops,
+        "ops_per_second": round(ops / elapsed, 1),
+        "timeouts": timeouts,
+        "wait_p50_ms": round(statistics.median(waits), 2) if waits else None,
+        "wait_p99_ms": round(_percentile(waits, 99), 2) if waits else None,
+        "wait_max_ms": stats["wait_ms_max"],
+        "wait_ms_histogram": stats["wait_ms_histogram"],
+        "peak_checked_out": stats["peak_checked_out"],
+        "pool": pool_status(),
+    }
+
+
+async def _main(args) -> list:
+    from database import engine
+
+    results = []
+    for concurrency in (int(c) for c in args.concurrency.split(",")):
+        results.append(await _step(concurrency, args.seconds, args.hold_ms / 1000))
+    await engine.dispose()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pool-size", type=int, default=5)
+    parser.add_argument("--max-overflow", type=int, default=10)
+    parser.add_argument("--pool-timeout", type=float, default=2.0)
+    parser.add_argument("--hold-ms", type=float, default=50)
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--concurrency", default="5,15,30,60,120")
+    args = parser.parse_args()
+
+    # database 는 import 시 환경 변수로 엔진을 만듦
+    os.environ.setdefault(
+        "DATABASE_URL", f"sqlite+aiosqlite:///{tempfile.mkdtemp(prefix='petcam-bench-')}/soak.db"
+    )
+    os.environ["DB_POOL_SIZE"] = str(args.pool_size)
+    os.environ["DB_MAX_OVERFLOW"] = str(args.max_overflow)
+    os.environ["DB_POOL_TIMEOUT"] = str(args.pool_timeout)
+
+    results = asyncio.run(_main(args))
+    print(
+        json.dumps(
+            {
+                "benchmark": "soak_db_pool",
+                "pool_size": args.pool_size,
+                "max_overflow": args.max_overflow,
+                "pool_timeout": args.pool_timeout,
+                "hold_ms": args.hold_ms,
+                "results": results,
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+이미지 처리 단계별 마이크로벤치마크 (process_image_sync / ImageService.upscale_image)
+
+업로드 하나가 거치는 단계를 해상도(VGA / HD / UXGA)별로 따로 잽니다.
+핫 패스를 바꿀 때 어느 단계가 얼마나 빨라졌는지(또는 느려졌는지)를 기준선과 비교합니다.
+
+    decode      load_input (Image.open → 큰 JPEG는 축소 디코딩 → convert("RGB"))
+    to_tensor   PIL → (3, H, W) float 텐서 (BatchInferenceEngine 입력)
+    predict     SR 네트워크 forward, 타일 하나 (TILE_SIZE, 사진 하나는 타일 여러 개)
+    from_tensor x4 결과 텐서 → PIL
+    thumbnail   x4 결과에서 thumb / medium 렌디션 크기로 LANCZOS 축소
+    encode      x4 결과 JPEG 인코딩 (encoder.encode_jpeg, RESULT_JPEG_* 설정)
+
+pytest 테스트(`tests/`)와 달리 기본 실행에 포함되지 않으며, pytest-benchmark 가 필요합니다.
+
+실행 (ai_server/ 에서):
+    python -m pytest benchmarks/test_stages.py                                # 측정만
+    python -m pytest benchmarks/test_stages.py --benchmark-save=baseline      # 기준선 저장
+    python -m pytest benchmarks/test_stages.py --benchmark-compare            # 마지막 기준선과 비교
+    STAGE_BENCH_FAIL="median:10%" python -m pytest benchmarks/test_stages.py --benchmark-compare
+    python -m pytest benchmarks/test_stages.py -k uxga --benchmark-json=stages.json
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+import torch  # noqa: E402
+from PIL import Image  # noqa: E402
+
+from app.services import encoder, renditions  # noqa: E402
+from app.services.inference_engine import image_to_tensor, tensor_to_image  # noqa: E402
+from app.services.tiling import TILE_SIZE, load_input  # noqa: E402
+from benchmarks._common import load_network  # noqa: E402
+
+
+@pytest.mark.benchmark(group="decode")
+def test_decode(benchmark, photo):
+    result = benchmark(load_input, photo.path)
+    assert result.size == photo.image.size
+
+
+@pytest.mark.benchmark(group="to_tensor")
+def test_to_tensor(benchmark, photo):
+    tensor = benchmark(image_to_tensor, photo.image)
+    assert tensor.shape == (3, photo.image.height, photo.image.width)
+
+
+@pytest.mark.benchmark(group="predict")
+def test_predict(benchmark):
+    network, name = load_network()
+    tile = TILE_SIZE
+    batch = torch.rand(1, 3, tile, tile, generator=torch.Generator().manual_seed(0))
+    benchmark.extra_info["network"] = name
+    benchmark.extra_info["tile"] = tile
+
+    def predict():
+        with torch.no_grad():
+            return network(batch)
+
+    result = benchmark(predict)
+    assert result.shape[-1] == tile * 4
+
+
+@pytest.mark.benchmark(group="from_tensor")
+def test_from_tensor(benchmark, photo):
+    tensor = image_to_tensor(photo.upscaled)
+    image = benchmark(tensor_to_image, tensor)
+    assert image.size == photo.upscaled.size
+
+
+@pytest.mark.benchmark(group="thumbnail")
+@pytest.mark.parametrize("size", ["thumb", "medium"])
+def test_thumbnail(benchmark, photo, size):
+    limit = renditions.RENDITION_SIZES[size]
+
+    def thumbnail():
+        # renditions._save 와 같은 축소
+        rendition = photo.upscaled.copy()
+        rendition.thumbnail((limit, limit), Image.LANCZOS, reducing_gap=3.0)
+        return rendition
+
+    result = benchmark(thumbnail)
+    assert max(result.size) == limit
+
+
+@pytest.mark.benchmark(group="encode")
+def test_encode(benchmark, photo):
+    benchmark.extra_info["backend"] = encoder.active_backend()
+    benchmark.extra_info["bytes"] = len(benchmark(encoder.encode_jpeg, photo.upscaled))
@@ -1,6 +1,13 @@
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 import os
+import time
+
+from app.core.db_stats import pool_stats, record_wait
+from app.core.metrics import DB_POOL_OVERFLOW
 
 # DB 접속 규격 (Linker string)
 # Docker 내부에서는 'db' 호스트네임을 사용, 로컬 개발 시에는 'localhost' 사용
@@ -12,7 +19,62 @@ if not DATABASE_URL:
 if DATABASE_URL.startswith("postgresql://"):
     DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
 
-engine = create_async_engine(DATABASE_URL, echo=False)
+# ============ 커넥션 풀 설정 (워커 프로세스당) ============
+# 전체 최대 커넥션 = 워커 수(GUNICORN_WORKERS) x (DB_POOL_SIZE + DB_MAX_OVERFLOW)
+#   + 업스케일 워커, PostgreSQL max_connections(기본 100)보다 작게 유지할 것
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+# 풀이 가득 찼을 때 커넥션을 기다리는 최대 시간(초), 넘으면 TimeoutError
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+# 이 시간(초)보다 오래된 커넥션은 다시 연결 (DB/프록시의 유휴 연결 종료 대비), -1이면 사용 안 함
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+# 꺼낼 때마다 연결이 살아있는지 확인 (DB 재시작 후 첫 요청 실패 방지)
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "1") == "1"
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """
+    커넥션을 얻기까지 걸린 시간(풀이 비었을 때의 대기 포함)을 db_stats 에 기록
+    overflow 수는 커넥션을 꺼내고 돌려줄 때마다 petcam_db_pool_overflow 게이지에 반영
+    """
+
+    def _do_get(self):
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_OVERFLOW.set(self.overflow())
+
+    def _do_return_conn(self, record):
+        try:
+            super()._do_return_conn(record)
+        finally:
+            DB_POOL_OVERFLOW.set(self.overflow())
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            pool_stats.record_timeout()
+            raise
+        finally:
+            record_wait(time.perf_counter() - start)
+
+
+_engine_options = {}
+_url = make_url(DATABASE_URL)
+# 메모리 SQLite는 커넥션마다 DB가 따로 생기므로 기본 풀(StaticPool 계열)을 그대로 사용
+if not (_url.get_backend_name() == "sqlite" and _url.database in (None, "", ":memory:")):
+    _engine_options.update(
+        poolclass=TimedQueuePool,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
+    )
+
+engine = create_async_engine(DATABASE_URL, echo=False, **_engine_options)
 SessionLocal = sessionmaker(
     bind=engine,
     class_=AsyncSession,
@@ -21,3 +83,18 @@ SessionLocal = sessionmaker(
     expire_on_commit=False,
 )
 Base = declarative_base()  # 테이블 설계를 위한 기본 클래스
+
+
+def pool_status() -> dict:
+    """현재 풀 상태 (이 프로세스 기준, 큐 풀이 아니면 빈 dict)"""
+    pool = engine.sync_engine.pool
+    if not isinstance(pool, QueuePool):
+        return {}
+    return {
+        "size": pool.size(),
+        "max_overflow": DB_MAX_OVERFLOW,
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        # 음수면 아직 pool_size 만큼도 연결하지 않은 상태
+        "overflow": pool.overflow(),
+    }
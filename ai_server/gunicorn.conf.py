@@ -0,0 +1,26 @@
+"""
+gunicorn 설정 (작업 디렉터리의 gunicorn.conf.py 를 gunicorn 이 자동으로 읽음)
+
+워커 수, bind 등은 docker-compose.prod.yml / Dockerfile 의 명령줄 옵션으로 지정하고,
+여기서는 Prometheus 멀티 프로세스 모드(app/core/metrics.py)에 필요한 설정만 합니다.
+
+- PROMETHEUS_MULTIPROC_DIR: 워커들이 앱을 import 하기 전에 설정되어 있어야 함 (없으면 기본 경로)
+- on_starting: 이 호스트가 이전 실행에서 남긴 메트릭 파일 삭제 (재시작 시 값이 이어지지 않도록)
+- child_exit: 종료된 워커의 live* 게이지(처리 중 작업 수 등) 파일 삭제
+"""
+
+import os
+
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/petcam-metrics")
+
+
+def on_starting(server):
+    from app.core import metrics
+
+    metrics.clear_host_files()
+
+
+def child_exit(server, worker):
+    from app.core import metrics
+
+    metrics.mark_process_dead(worker.pid)
@@ -2,7 +2,7 @@
 PetCam AI Server - 메인 진입점
 
 라우터:
-- /health: 헬스체크
+- /health, /health/ready: 헬스체크 / 준비 상태 (모델 로드 상태 포함)
 - /register, /token: 인증
 - /upscale, /bestcut, /photos: 사진 처리
 """
@@ -20,8 +20,16 @@ from database import Base, engine
 # 라우터 import
 from app.api.auth import router as auth_router
 from app.api.health import router as health_router
+from app.api.metrics import router as metrics_router
 from app.api.photos import router as photos_router
+from app.core.db_stats import DBStatsMiddleware
 from app.core.deps import limiter
+from app.core.metrics import MetricsMiddleware
+from app.core.tracing import TracingMiddleware
+from app.services.ai_service import model_manager
+from app.services import status_events
+from app.services.blur import shutdown_score_pool
+from app.services.model_manager import MODEL_PRELOAD
 
 # 로깅 설정
 log_level = os.getenv("LOG_LEVEL", "info").upper()
@@ -77,11 +85,21 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["Authorization", "Content-Type", "X-Request-ID"],
+    # 브라우저 클라이언트가 읽을 수 있도록 (GET /photos 다음 페이지 커서, 요청 ID)
+    expose_headers=["X-Next-Cursor", "X-Request-ID"],
 )
 
+# 요청별 DB 커넥션 사용량 계측 (pool_stats, /metrics 의 petcam_db_pool_*)
+app.add_middleware(DBStatsMiddleware)
+# 라우트별 요청 처리 시간 (/metrics)
+app.add_middleware(MetricsMiddleware)
+# X-Request-ID + 요청 span (가장 바깥: 안쪽의 DB/처리 span 이 이 요청의 자식이 됨)
+app.add_middleware(TracingMiddleware)
+
 
 # 라우터 등록
 app.include_router(health_router)
+app.include_router(metrics_router)
 app.include_router(auth_router)
 app.include_router(photos_router)
 
@@ -92,6 +110,16 @@ async def startup_event():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
+    # 모델은 백그라운드에서 로드 (시작을 막지 않음, 준비 상태는 /health/ready)
+    if MODEL_PRELOAD:
+        model_manager.start_background_load()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    shutdown_score_pool()
+    await status_events.broker.close()
+
 
 if __name__ == "__main__":
     import uvicorn
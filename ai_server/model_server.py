@@ -0,0 +1,44 @@
+"""
+PetCam AI Server - 모델 서버 진입점
+
+RealESRGAN 모델을 호스트당 한 번만 로드하고, Unix 소켓으로 추론 요청을 받습니다.
+API 서버(gunicorn 워커들)와 업스케일 워커는 INFERENCE_BACKEND=remote 로 실행하면
+모델을 직접 로드하지 않고 이 프로세스를 공유합니다.
+
+실행:
+    python model_server.py
+    MODEL_SERVER_SOCKET=/run/petcam/model.sock python model_server.py
+"""
+
+import os
+import sys
+import asyncio
+import logging
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# 이 프로세스가 모델을 소유 (remote로 설정되어 있어도 로컬 로드)
+os.environ["INFERENCE_BACKEND"] = "local"
+
+# 로깅 설정
+log_level = os.getenv("LOG_LEVEL", "info").upper()
+logging.basicConfig(
+    level=getattr(logging, log_level, logging.INFO),
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
+from app.core.metrics import clear_host_files  # noqa: E402
+from app.services.model_loader import model_manager  # noqa: E402
+from app.services.model_server import ModelServer, MODEL_SERVER_SOCKET  # noqa: E402
+
+
+if __name__ == "__main__":
+    # 이 컨테이너의 이전 실행이 남긴 메트릭 파일 정리 (PROMETHEUS_MULTIPROC_DIR 사용 시)
+    clear_host_files()
+    # 로드 + 워밍업이 끝난 뒤에 소켓을 열어서 클라이언트는 준비된 서버에만 연결
+    engine = model_manager.load()
+    if engine is None:
+        sys.exit(f"❌ Model server not started: {model_manager.error}")
+    asyncio.run(ModelServer(engine, MODEL_SERVER_SOCKET).serve_forever())
@@ -1,5 +1,7 @@
-from sqlalchemy import Column, String, DateTime, Float, Enum
+from sqlalchemy import Column, String, DateTime, Float, Enum, Integer, Index, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
 from database import Base
+from app.models.user import User  # noqa: F401 (owner_id 외래 키 대상 테이블 등록)
 import datetime
 import enum
 
@@ -17,6 +19,10 @@ class ProcessingStatus(str, enum.Enum):
 class PhotoRecord(Base):
     __tablename__ = "photos"
     id = Column(String, primary_key=True, index=True)
+    # 업로드한 사용자 (목록/조회/삭제는 본인 사진만)
+    owner_id = Column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=True
+    )
     original_path = Column(String)
     upscaled_path = Column(String, nullable=True)
 
@@ -27,3 +33,25 @@ class PhotoRecord(Base):
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
     latitude = Column(Float, nullable=True)  # 📍 위도 추가
     longitude = Column(Float, nullable=True)  # 📍 경도 추가
+
+    # 작업 큐 점유 정보 (워커 lease)
+    locked_by = Column(String, nullable=True)  # 점유한 워커 ID
+    locked_until = Column(DateTime, nullable=True)  # visibility timeout 만료 시각
+    attempts = Column(Integer, default=0, server_default="0", nullable=False)
+
+    # 결과 캐시 (app/services/result_cache.py): 원본 SHA-256 + 결과를 만든 모델 버전
+    content_hash = Column(String(64), nullable=True)
+    model_version = Column(String, nullable=True)
+
+    # 업로드 요청 추적 (app/core/tracing.py): 워커가 같은 trace 로 이어서 기록
+    request_id = Column(String(64), nullable=True)
+    traceparent = Column(String(55), nullable=True)  # W3C traceparent
+
+    __table_args__ = (
+        # 워커의 QUEUED 작업 조회용 (status + 생성순)
+        Index("ix_photos_status_created_at", "status", "created_at"),
+        # GET /photos 사용자별 최신순 목록 (키셋 페이지네이션: created_at DESC, id DESC)
+        Index("ix_photos_owner_created_at", "owner_id", "created_at", "id"),
+        # 같은 내용의 완료된 결과 조회용
+        Index("ix_photos_content_hash_model_version", "content_hash", "model_version"),
+    )
@@ -144,8 +144,17 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield db_session
     
     # 원래 DB 대신 테스트 DB를 사용하도록 교체
-    from app.auth import get_db
+    # (인증과 라우터가 같은 app.core.deps.get_db 를 쓰므로 하나만 바꾸면 됨)
+    from app.core.deps import get_db
     app.dependency_overrides[get_db] = override_get_db
+
+    # 요청 한도(예: /upscale 10/minute)는 테스트마다 초기화
+    from app.core.deps import limiter
+    limiter.reset()
+
+    # 사용자 캐시도 초기화 (테스트마다 같은 username으로 새 사용자를 만듦)
+    from app.services.principal_cache import principals
+    principals.clear()
     
     # 테스트 클라이언트 생성
     async with AsyncClient(
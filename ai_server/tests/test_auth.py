@@ -13,15 +13,20 @@ PetCam AI Server - 인증 API 테스트
     3. 너무 짧은 비밀번호는 거부되는지
     4. 로그인이 정상적으로 되는지
     5. 잘못된 비밀번호로 로그인하면 거부되는지
+    6. 비밀번호 해싱이 이벤트 루프 밖에서 실행되고, 대기열이 가득 차면 503인지
     
 실행 방법:
     pytest tests/test_auth.py -v
 =============================================================================
 """
 
+import threading
+
 import pytest
 from httpx import AsyncClient
 
+from app import auth
+
 
 # =============================================================================
 # 회원가입 테스트
@@ -361,3 +366,51 @@ class TestLogin:
         # 401 = 인증 실패
         assert response.status_code == 401, \
             "가짜 토큰이 인증을 통과했습니다 (심각한 보안 문제!)"
+
+
+# =============================================================================
+# 비밀번호 해싱 실행 위치 테스트
+# =============================================================================
+
+class TestPasswordHashing:
+    """
+    bcrypt 해싱은 전용 스레드 풀에서 실행됩니다.
+
+    왜 중요한가요?
+        해싱 한 번에 수백 ms가 걸려서, 이벤트 루프에서 실행하면
+        로그인이 몰릴 때 다른 모든 요청이 함께 멈춥니다.
+    """
+
+    @pytest.mark.asyncio
+    async def test_login_hashes_off_event_loop(
+        self, client: AsyncClient, test_user, monkeypatch
+    ):
+        """로그인 시 비밀번호 확인이 bcrypt 스레드에서 실행되는지 확인합니다."""
+        threads = []
+        verify = auth.verify_password
+
+        def recording_verify(plain, hashed):
+            threads.append(threading.current_thread().name)
+            return verify(plain, hashed)
+
+        monkeypatch.setattr(auth, "verify_password", recording_verify)
+        response = await client.post(
+            "/token", data={"username": "testuser", "password": "testpassword123"}
+        )
+
+        assert response.status_code == 200
+        assert threads and threads[0].startswith("bcrypt")
+
+    @pytest.mark.asyncio
+    async def test_full_hash_queue_fails_fast(
+        self, client: AsyncClient, test_user, monkeypatch
+    ):
+        """대기열이 가득 차 있으면 기다리지 않고 503 + Retry-After를 반환합니다."""
+        monkeypatch.setattr(auth, "PASSWORD_HASH_MAX_PENDING", 0)
+
+        response = await client.post(
+            "/token", data={"username": "testuser", "password": "testpassword123"}
+        )
+
+        assert response.status_code == 503
+        assert response.headers["retry-after"] == "1"
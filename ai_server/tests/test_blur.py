@@ -0,0 +1,90 @@
+"""
+=============================================================================
+PetCam AI Server - 블러 점수 테스트
+=============================================================================
+
+테스트 대상:
+    app/services/blur.py - get_blur_score_bytes, score_frames
+
+이 테스트들이 확인하는 것:
+    1. 1/2 해상도 디코딩으로도 선명한 프레임이 더 높은 점수를 받는지
+    2. 디코딩할 수 없는 바이트는 0점인지
+    3. 프로세스 풀 채점 결과가 입력 순서대로 돌아오는지
+    4. 프로세스 풀은 서버 시작이 아니라 첫 채점 때 만들어지는지
+
+실행 방법:
+    pytest tests/test_blur.py -v
+=============================================================================
+"""
+
+import asyncio
+import io
+
+import cv2
+import numpy as np
+import pytest
+from PIL import Image
+
+from app.services import blur
+
+
+def _jpeg(array: np.ndarray) -> bytes:
+    buffer = io.BytesIO()
+    Image.fromarray(array).save(buffer, format="JPEG", quality=95)
+    return buffer.getvalue()
+
+
+def _frames():
+    """선명도가 점점 떨어지는 연사 프레임 (같은 장면을 점점 더 흐리게)"""
+    rng = np.random.default_rng(0)
+    scene = rng.integers(0, 256, (240, 320, 3), dtype=np.uint8)
+    return [_jpeg(scene)] + [
+        _jpeg(cv2.GaussianBlur(scene, (0, 0), sigma)) for sigma in (1.0, 2.0, 4.0)
+    ]
+
+
+@pytest.fixture
+def score_pool():
+    yield
+    blur.shutdown_score_pool()
+
+
+class TestBlurScore:
+    """get_blur_score_bytes"""
+
+    def test_sharper_frame_scores_higher(self):
+        """흐릴수록 점수가 낮아집니다 (축소 디코딩에서도 순위 유지)."""
+        scores = [blur.get_blur_score_bytes(frame) for frame in _frames()]
+
+        assert scores == sorted(scores, reverse=True)
+        assert scores[0] > scores[-1] * 10
+
+    def test_undecodable_bytes_score_zero(self):
+        """이미지가 아니면 예외 없이 0점입니다."""
+        assert blur.get_blur_score_bytes(b"\xff\xd8\xffnot a jpeg") == 0.0
+
+
+class TestScoreFrames:
+    """score_frames (프로세스 풀)"""
+
+    @pytest.mark.asyncio
+    async def test_scores_follow_input_order(self, score_pool):
+        """풀에서 병렬로 계산해도 결과는 입력 순서와 같습니다."""
+        frames = _frames()[::-1]
+
+        scores = await blur.score_frames(frames)
+
+        assert scores == [blur.get_blur_score_bytes(frame) for frame in frames]
+
+    @pytest.mark.asyncio
+    async def test_pool_starts_on_first_request(self, score_pool):
+        """서버 시작 시에는 채점 프로세스를 띄우지 않고, 첫 채점 때 풀을 만듭니다."""
+        from main import startup_event
+
+        blur.shutdown_score_pool()
+        await startup_event()
+        await asyncio.sleep(0.5)  # 백그라운드로 풀을 띄웠다면 이미 만들어졌을 시간
+        assert blur._pool is None
+
+        await blur.score_frames(_frames()[:1])
+        assert blur._pool is not None
@@ -0,0 +1,112 @@
+"""
+=============================================================================
+PetCam AI Server - 요청당 DB 세션 / 커넥션 계측 테스트
+=============================================================================
+
+테스트 대상:
+    app/core/deps.py (get_db), app/core/db_stats.py (pool_stats, /metrics 의 petcam_db_pool_*)
+
+이 테스트들이 확인하는 것:
+    1. 인증이 필요한 요청에서 DB 세션을 한 번만 만드는지 (인증 + 라우터 공유)
+    2. 요청 하나가 커넥션을 동시에 두 개 이상 잡지 않는지
+    3. 풀이 가득 차면 대기 시간이 히스토그램에 쌓이고, 시간 초과가 집계되는지
+    4. 같은 값이 Prometheus 지표(/metrics)로도 나가는지
+
+실행 방법:
+    pytest tests/test_db_stats.py -v
+=============================================================================
+"""
+
+import pytest
+from httpx import AsyncClient
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from main import app
+from database import TimedQueuePool
+from app.core.db_stats import pool_stats
+from app.core.deps import get_db
+
+
+def _sample(name: str) -> float:
+    return REGISTRY.get_sample_value(name) or 0.0
+
+
+class TestRequestSession:
+    """인증 + 라우터가 같은 세션 사용"""
+
+    @pytest.mark.asyncio
+    async def test_authenticated_request_opens_one_session(
+        self, authenticated_client: AsyncClient, db_session: AsyncSession
+    ):
+        """GET /photos 한 번에 get_db 가 한 번만 실행됩니다."""
+        calls = []
+
+        async def counting_get_db():
+            calls.append(1)
+            yield db_session
+
+        app.dependency_overrides[get_db] = counting_get_db
+
+        response = await authenticated_client.get("/photos")
+
+        assert response.status_code == 200
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_request_holds_at_most_one_connection(
+        self, authenticated_client: AsyncClient
+    ):
+        """요청별 계측: 커넥션을 꺼내 쓰지만 동시에 두 개를 잡지는 않습니다."""
+        pool_stats.reset()
+
+        assert (await authenticated_client.get("/photos")).status_code == 200
+        stats = pool_stats.snapshot()
+
+        assert stats["requests"] == 1
+        assert stats["max_checkouts_per_request"] >= 1
+        assert stats["max_held_per_request"] == 1
+
+
+class TestPoolSaturation:
+    """풀 크기를 넘는 동시 사용"""
+
+    @pytest.mark.asyncio
+    async def test_wait_histogram_and_timeouts(self, tmp_path):
+        """커넥션 1개짜리 풀에서 두 번째 요청은 기다리다가 시간 초과됩니다."""
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path}/pool.db",
+            poolclass=TimedQueuePool,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.2,
+        )
+        pool_stats.reset()
+        timeouts_before = _sample("petcam_db_pool_timeouts_total")
+        waits_before = _sample("petcam_db_pool_checkout_wait_seconds_count")
+        checked_out_before = _sample("petcam_db_pool_checked_out")
+        try:
+            async with engine.connect() as held:
+                await held.execute(text("SELECT 1"))
+                with pytest.raises(PoolTimeoutError):
+                    async with engine.connect() as conn:
+                        await conn.execute(text("SELECT 1"))
+                stats = pool_stats.snapshot()
+                checked_out = _sample("petcam_db_pool_checked_out") - checked_out_before
+                overflow = _sample("petcam_db_pool_overflow")
+        finally:
+            await engine.dispose()
+
+        assert stats["timeouts"] == 1
+        assert stats["peak_checked_out"] == 1
+        histogram = stats["wait_ms_histogram"]
+        assert histogram["+Inf"] == 2
+        assert histogram["100"] == 1  # 바로 얻은 첫 커넥션만
+
+        # 같은 값이 Prometheus 지표로도 나감
+        assert _sample("petcam_db_pool_timeouts_total") - timeouts_before == 1
+        assert _sample("petcam_db_pool_checkout_wait_seconds_count") - waits_before == 2
+        assert checked_out == 1
+        assert overflow == 0  # pool_size 1 을 다 씀 (overflow 없음)
@@ -0,0 +1,70 @@
+"""
+=============================================================================
+PetCam AI Server - 결과 JPEG 인코딩 테스트
+=============================================================================
+
+테스트 대상:
+    app/services/encoder.py (encode_jpeg, save_jpeg)
+
+이 테스트들이 확인하는 것:
+    1. 품질 / progressive 설정이 결과 JPEG에 반영되는지
+    2. save_jpeg 가 파일에 쓴 바이트와 반환한 바이트가 같은지 (한 번만 인코딩)
+    3. turbojpeg 백엔드를 쓸 수 없으면 Pillow 로 인코딩하는지
+
+실행 방법:
+    pytest tests/test_encoder.py -v
+=============================================================================
+"""
+
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from app.services import encoder
+
+
+@pytest.fixture
+def image():
+    rng = np.random.default_rng(0)
+    return Image.fromarray(rng.integers(0, 256, (64, 96, 3), dtype=np.uint8))
+
+
+class TestEncodeJpeg:
+    """encode_jpeg 옵션"""
+
+    def test_quality_and_progressive(self, image):
+        low = encoder.encode_jpeg(image, quality=40)
+        high = encoder.encode_jpeg(image, quality=90)
+        progressive = encoder.encode_jpeg(image, progressive=True)
+
+        assert len(low) < len(high)
+        assert Image.open(io.BytesIO(progressive)).info.get("progressive")
+        assert not Image.open(io.BytesIO(low)).info.get("progressive")
+        assert Image.open(io.BytesIO(high)).size == image.size
+
+    def test_default_matches_previous_output(self, image):
+        """기본 설정은 이전의 image.save(path, format="JPEG") 와 같은 바이트"""
+        buffer = io.BytesIO()
+        image.save(buffer, format="JPEG")
+
+        assert encoder.encode_jpeg(image) == buffer.getvalue()
+
+    def test_turbojpeg_falls_back_to_pillow(self, image, monkeypatch):
+        monkeypatch.setattr(encoder, "_turbojpeg", False)  # 로드 실패 상태
+
+        assert encoder.active_backend("turbojpeg") == "pil"
+        assert encoder.encode_jpeg(image, backend="turbojpeg") == encoder.encode_jpeg(image)
+
+
+class TestSaveJpeg:
+    """save_jpeg: 한 번 인코딩해서 저장 + 반환"""
+
+    def test_written_file_is_returned_bytes(self, image, tmp_path):
+        path = tmp_path / "result.jpg"
+
+        data = encoder.save_jpeg(image, str(path))
+
+        assert path.read_bytes() == data
+        assert [p.name for p in tmp_path.iterdir()] == ["result.jpg"]  # 임시 파일 없음
@@ -0,0 +1,128 @@
+"""
+=============================================================================
+PetCam AI Server - 이미지 파일 응답 테스트
+=============================================================================
+
+테스트 대상:
+    app/services/file_serving.py (GET /photos/{photo_id})
+
+이 테스트들이 확인하는 것:
+    1. ETag / Last-Modified 헤더가 붙고, If-None-Match가 맞으면 304인지
+    2. Range 요청에 206 + 요청한 구간만 보내는지
+    3. 업스케일 결과가 없으면 원본으로 대체하는지
+    4. X-Accel-Redirect 모드에서 본문 없이 nginx 경로만 넘기는지
+
+실행 방법:
+    pytest tests/test_file_serving.py -v
+=============================================================================
+"""
+
+import os
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import PhotoRecord, ProcessingStatus
+from app.models.user import User
+from app.services import file_serving
+from app.services.ingest import ORIGINALS_DIR
+
+
+@pytest.fixture
+async def photo(db_session: AsyncSession, test_user: User):
+    """결과 파일이 있는 사진 (원본/결과 내용이 다름)"""
+    photo_id = str(uuid.uuid4())
+    os.makedirs("storage/results", exist_ok=True)
+    original_path = f"{ORIGINALS_DIR}/{photo_id}.jpg"
+    upscaled_path = f"storage/results/{photo_id}.jpg"
+    contents = {original_path: b"\xff\xd8\xff" + b"o" * 1000, upscaled_path: os.urandom(4096)}
+    for path, data in contents.items():
+        with open(path, "wb") as f:
+            f.write(data)
+
+    record = PhotoRecord(
+        id=photo_id,
+        owner_id=test_user.id,
+        original_path=original_path,
+        upscaled_path=upscaled_path,
+        status=ProcessingStatus.COMPLETED,
+    )
+    db_session.add(record)
+    await db_session.commit()
+
+    yield record, contents
+
+    for path in contents:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+class TestPhotoFile:
+    """GET /photos/{photo_id}"""
+
+    @pytest.mark.asyncio
+    async def test_conditional_request_returns_304(
+        self, authenticated_client: AsyncClient, photo
+    ):
+        """첫 응답의 ETag로 다시 요청하면 본문 없이 304를 반환합니다."""
+        record, contents = photo
+
+        response = await authenticated_client.get(f"/photos/{record.id}")
+        assert response.status_code == 200
+        assert response.content == contents[record.upscaled_path]
+        assert response.headers["content-type"] == "image/jpeg"
+        etag = response.headers["etag"]
+        assert response.headers["last-modified"]
+
+        response = await authenticated_client.get(
+            f"/photos/{record.id}", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    @pytest.mark.asyncio
+    async def test_range_request_returns_partial_content(
+        self, authenticated_client: AsyncClient, photo
+    ):
+        """Range 요청이면 206과 해당 구간만 보냅니다."""
+        record, contents = photo
+
+        response = await authenticated_client.get(
+            f"/photos/{record.id}", headers={"Range": "bytes=100-199"}
+        )
+
+        assert response.status_code == 206
+        assert response.content == contents[record.upscaled_path][100:200]
+        assert response.headers["content-range"] == "bytes 100-199/4096"
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_original(
+        self, authenticated_client: AsyncClient, photo
+    ):
+        """결과 파일이 없으면 원본을 보냅니다."""
+        record, contents = photo
+        os.remove(record.upscaled_path)
+
+        response = await authenticated_client.get(f"/photos/{record.id}")
+
+        assert response.status_code == 200
+        assert response.content == contents[record.original_path]
+
+    @pytest.mark.asyncio
+    async def test_x_accel_redirect_mode(
+        self, authenticated_client: AsyncClient, photo, monkeypatch
+    ):
+        """X-Accel-Redirect 모드에서는 본문 없이 nginx 내부 경로만 반환합니다."""
+        record, _ = photo
+        monkeypatch.setattr(file_serving, "X_ACCEL_REDIRECT_PREFIX", "/_storage/")
+
+        response = await authenticated_client.get(
+            f"/photos/{record.id}", params={"type": "original"}
+        )
+
+        assert response.status_code == 200
+        assert response.content == b""
+        assert response.headers["x-accel-redirect"] == f"/_storage/originals/{record.id}.jpg"
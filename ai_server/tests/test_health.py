@@ -5,6 +5,7 @@ PetCam AI Server - 헬스체크 API 테스트
 
 테스트 대상:
     GET /health - 서버가 살아있는지 확인하는 API
+    GET /health/ready - 모델이 준비되어 요청을 받을 수 있는지 확인하는 API
 
 왜 필요한가요?
     서버가 정상적으로 동작하는지 확인하는 가장 기본적인 테스트입니다.
@@ -129,3 +130,145 @@ async def test_health_check_response_time(client: AsyncClient):
     
     # 요청도 성공했는지 확인
     assert response.status_code == 200
+
+
+# =============================================================================
+# 테스트 4: 헬스체크에 모델 상태가 포함되어 있는지
+# =============================================================================
+
+@pytest.mark.asyncio
+async def test_health_check_includes_model_state(client: AsyncClient):
+    """
+    헬스체크 응답에 모델 상태(state, load_seconds, warmup_ms)가 포함되는지 확인합니다.
+
+    왜 필요한가요?
+        모델은 import 시점이 아니라 첫 사용 시(또는 백그라운드에서) 로드됩니다.
+        지금 로드 중인지, 실패했는지, 워밍업에 얼마나 걸렸는지 밖에서 볼 수 있어야 합니다.
+    """
+    response = await client.get("/health")
+    data = response.json()
+
+    assert response.status_code == 200
+    assert data["model"]["state"] in ("not_loaded", "loading", "ready", "failed")
+    assert "load_seconds" in data["model"]
+    assert "warmup_ms" in data["model"]
+
+
+# =============================================================================
+# 테스트 5: 모델 로드 중에는 준비 상태가 503인지
+# =============================================================================
+
+@pytest.mark.asyncio
+async def test_readiness_is_503_until_model_ready(client: AsyncClient, monkeypatch):
+    """
+    모델을 로드하는 중에는 /health/ready가 503, 준비되면 200을 반환하는지 확인합니다.
+
+    왜 필요한가요?
+        로드밸런서가 준비된 워커에만 트래픽을 보내도록 하기 위함입니다.
+        /health(생존 확인)는 로드 중에도 200이어야 재시작 루프에 빠지지 않습니다.
+    """
+    from app.api import health
+    from app.services.model_manager import ModelState
+
+    monkeypatch.setattr(health.model_manager, "state", ModelState.LOADING)
+    response = await client.get("/health/ready")
+    assert response.status_code == 503
+    assert (await client.get("/health")).status_code == 200
+
+    monkeypatch.setattr(health.model_manager, "state", ModelState.READY)
+    response = await client.get("/health/ready")
+    assert response.status_code == 200
+    assert response.json()["ready"] is True
+
+
+# =============================================================================
+# 테스트 6: 가중치 로드에 실패하면 준비 상태가 503인지
+# =============================================================================
+
+@pytest.mark.asyncio
+async def test_readiness_is_503_when_weights_fail_to_load(client: AsyncClient, monkeypatch):
+    """
+    RealESRGAN 생성은 성공했지만 가중치 로드에서 실패하면 failed 상태, /health/ready는 503입니다.
+
+    왜 필요한가요?
+        가중치 없는 네트워크로도 워밍업 추론은 성공하기 때문에,
+        실패를 삼키면 ready로 보고되고 엉터리 결과가 캐시에 쌓입니다.
+    """
+    import sys
+    import types
+
+    import torch
+
+    from app.api import health
+    from app.services import model_loader
+    from app.services.model_manager import ModelManager, ModelState
+
+    class _BrokenRealESRGAN:
+        def __init__(self, device, scale):
+            # 네트워크 자체는 동작함 (워밍업 추론은 성공)
+            self.model = lambda batch: torch.nn.functional.interpolate(batch, scale_factor=scale)
+
+        def load_weights(self, path, download=True):
+            raise RuntimeError("weights download failed")
+
+    monkeypatch.setitem(
+        sys.modules, "RealESRGAN", types.SimpleNamespace(RealESRGAN=_BrokenRealESRGAN)
+    )
+    monkeypatch.setattr(model_loader, "model", None)
+    manager = ModelManager(model_loader._load_local_engine, warmup_size=16)
+    monkeypatch.setattr(health, "model_manager", manager)
+
+    assert manager.get() is None
+    assert manager.state == ModelState.FAILED
+    assert model_loader.model is None
+
+    response = await client.get("/health/ready")
+    assert response.status_code == 503
+    assert response.json()["model"]["state"] == "failed"
+
+
+# =============================================================================
+# 테스트 7: v1 이미지 서비스도 가중치가 없으면 failed인지
+# =============================================================================
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("weights", ["missing", "broken"])
+async def test_image_service_readiness_is_503_without_weights(
+    client: AsyncClient, monkeypatch, tmp_path, weights
+):
+    """
+    ImageService(v1 API)도 가중치 파일이 없거나 로드에 실패하면 failed 상태, /health/ready는 503입니다.
+
+    왜 필요한가요?
+        테스트 6과 같은 이유입니다. 학습되지 않은 네트워크로 추론하면 안 됩니다.
+    """
+    import torch
+
+    from app.api import health
+    from app.services import image_service as image_service_module
+    from app.services.model_manager import ModelManager, ModelState
+
+    class _UntrainedRealESRGAN:
+        def __init__(self, device, scale):
+            # 네트워크 자체는 동작함 (워밍업 추론은 성공)
+            self.model = lambda batch: torch.nn.functional.interpolate(batch, scale_factor=scale)
+
+        def load_weights(self, path, download=True):
+            raise RuntimeError("corrupt weights file")
+
+    weights_path = tmp_path / "RealESRGAN_x4.pth"
+    if weights == "broken":
+        weights_path.write_bytes(b"not a checkpoint")
+    monkeypatch.setattr(image_service_module, "RealESRGAN", _UntrainedRealESRGAN)
+    monkeypatch.setattr(image_service_module.settings, "MODEL_PATH", str(weights_path))
+    service = image_service_module.image_service
+    monkeypatch.setattr(service, "_model", None)
+    manager = ModelManager(service._create_engine, warmup_size=16)
+    monkeypatch.setattr(health, "model_manager", manager)
+
+    assert manager.get() is None
+    assert manager.state == ModelState.FAILED
+    assert service._model is None
+
+    response = await client.get("/health/ready")
+    assert response.status_code == 503
@@ -0,0 +1,107 @@
+"""
+=============================================================================
+PetCam AI Server - 배치 추론 엔진 테스트
+=============================================================================
+
+테스트 대상:
+    app/services/inference_engine.py - BatchInferenceEngine
+
+이 테스트들이 확인하는 것:
+    1. 동시에 들어온 같은 크기의 이미지가 한 번의 forward로 묶이는지
+    2. 패딩 후 크기가 다른 이미지는 따로 실행되는지
+    3. 결과가 원래 크기 × scale 로 잘려서 각 작업에 돌아가는지
+    4. forward 실패 시 모든 작업에 예외가 전달되는지
+
+실행 방법:
+    pytest tests/test_inference_engine.py -v
+=============================================================================
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import torch
+import torch.nn.functional as F
+from PIL import Image
+
+from app.services.inference_engine import BatchInferenceEngine
+
+
+class _FakeModel:
+    """nearest 업샘플로 동작하는 가짜 모델 (배치 크기 기록)"""
+
+    def __init__(self, scale: int = 4):
+        self.scale = scale
+        self.batch_sizes = []
+
+    def __call__(self, batch: torch.Tensor) -> torch.Tensor:
+        self.batch_sizes.append(batch.shape[0])
+        return F.interpolate(batch, scale_factor=self.scale, mode="nearest")
+
+
+def test_concurrent_jobs_are_batched():
+    """같은 크기의 이미지 4장이 동시에 들어오면 한 번의 forward로 처리됩니다."""
+    fake = _FakeModel()
+    engine = BatchInferenceEngine(fake, scale=4, max_batch_size=4, max_wait_ms=500)
+
+    futures = [engine.submit(torch.rand(3, 20, 30)) for _ in range(4)]
+    results = [f.result(timeout=5) for f in futures]
+
+    assert fake.batch_sizes == [4]
+    for result in results:
+        assert result.shape == (3, 80, 120)
+
+
+def test_different_shapes_run_in_separate_groups():
+    """패딩 후 크기가 다르면 다른 그룹으로 나뉘어 실행됩니다."""
+    fake = _FakeModel()
+    engine = BatchInferenceEngine(
+        fake, scale=4, max_batch_size=8, max_wait_ms=500, pad_multiple=32
+    )
+
+    # 20x30, 25x31 → 둘 다 32x32로 패딩 / 40x40 → 64x64
+    shapes = [(20, 30), (25, 31), (40, 40)]
+    futures = [engine.submit(torch.rand(3, h, w)) for h, w in shapes]
+    results = [f.result(timeout=5) for f in futures]
+
+    assert sorted(fake.batch_sizes) == [1, 2]
+    for (h, w), result in zip(shapes, results):
+        assert result.shape == (3, h * 4, w * 4)
+
+
+def test_results_match_unbatched_forward():
+    """배치로 묶여도 각 이미지의 결과는 단독 실행과 같아야 합니다."""
+    fake = _FakeModel()
+    engine = BatchInferenceEngine(fake, scale=4, max_batch_size=4, max_wait_ms=200)
+    inputs = [torch.rand(3, 16, 16) for _ in range(3)]
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        results = list(pool.map(engine.infer, inputs))
+
+    for tensor, result in zip(inputs, results):
+        expected = fake(tensor.unsqueeze(0))[0]
+        assert torch.equal(result, expected)
+
+
+def test_forward_error_is_propagated():
+    """forward에서 예외가 나면 배치에 포함된 모든 작업이 같은 예외를 받습니다."""
+
+    def broken(batch):
+        raise RuntimeError("CUDA out of memory")
+
+    engine = BatchInferenceEngine(broken, scale=4, max_batch_size=2, max_wait_ms=200)
+    futures = [engine.submit(torch.rand(3, 8, 8)) for _ in range(2)]
+
+    for future in futures:
+        with pytest.raises(RuntimeError, match="out of memory"):
+            future.result(timeout=5)
+
+
+def test_upscale_returns_pil_image():
+    """upscale()은 PIL 이미지를 받아 scale배 크기의 PIL 이미지를 돌려줍니다."""
+    engine = BatchInferenceEngine(_FakeModel(), scale=4, max_wait_ms=0)
+
+    result = engine.upscale(Image.new("RGB", (10, 6), color="blue"))
+
+    assert result.size == (40, 24)
+    assert result.getpixel((0, 0)) == (0, 0, 255)
@@ -0,0 +1,160 @@
+"""
+=============================================================================
+PetCam AI Server - 스트리밍 업로드 테스트
+=============================================================================
+
+테스트 대상:
+    app/services/ingest.py - receive_uploads (POST /upscale, POST /bestcut)
+
+이 테스트들이 확인하는 것:
+    1. 업로드한 JPEG가 그대로 저장되고 임시 파일(.part)이 남지 않는지
+    2. JPEG가 아니면 415, 크기 제한을 넘으면 413으로 거절되는지
+    3. 거절된 업로드의 임시 파일이 지워지는지
+    4. /bestcut 이 가장 선명한 사진만 남기는지
+
+실행 방법:
+    pytest tests/test_ingest.py -v
+=============================================================================
+"""
+
+import glob
+import hashlib
+import io
+import os
+
+import numpy as np
+import pytest
+from httpx import AsyncClient
+from PIL import Image
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from models import PhotoRecord
+from app.services import ingest
+
+
+def _jpeg(array: np.ndarray) -> bytes:
+    buffer = io.BytesIO()
+    Image.fromarray(array).save(buffer, format="JPEG", quality=95)
+    return buffer.getvalue()
+
+
+def _part_files():
+    return glob.glob(os.path.join(ingest.ORIGINALS_DIR, ".*.part"))
+
+
+class TestStreamingUpload:
+    """POST /upscale 스트리밍 저장"""
+
+    @pytest.mark.asyncio
+    async def test_upload_is_stored_intact(
+        self, authenticated_client: AsyncClient, db_session: AsyncSession
+    ):
+        """업로드한 바이트가 그대로 저장되고 임시 파일은 남지 않습니다."""
+        rng = np.random.default_rng(0)
+        data = _jpeg(rng.integers(0, 256, (600, 800, 3), dtype=np.uint8))
+        assert len(data) > ingest.WRITE_BUFFER_SIZE  # 여러 번 나눠 기록되는 크기
+
+        response = await authenticated_client.post(
+            "/upscale", files={"file": ("cat.jpg", data, "image/jpeg")}
+        )
+
+        assert response.status_code == 200, response.text
+        result = await db_session.execute(
+            select(PhotoRecord).filter(PhotoRecord.id == response.json()["id"])
+        )
+        record = result.scalar_one()
+        with open(record.original_path, "rb") as f:
+            assert hashlib.sha256(f.read()).digest() == hashlib.sha256(data).digest()
+        assert _part_files() == []
+
+        os.remove(record.original_path)
+
+    @pytest.mark.asyncio
+    async def test_non_jpeg_is_rejected(self, authenticated_client: AsyncClient):
+        """JPEG 시그니처가 없으면 415로 거절하고 아무것도 남기지 않습니다."""
+        buffer = io.BytesIO()
+        Image.new("RGB", (16, 16)).save(buffer, format="PNG")
+
+        response = await authenticated_client.post(
+            "/upscale", files={"file": ("cat.png", buffer.getvalue(), "image/png")}
+        )
+
+        assert response.status_code == 415
+        assert _part_files() == []
+
+    @pytest.mark.asyncio
+    async def test_oversized_upload_is_rejected_while_streaming(
+        self, authenticated_client: AsyncClient, monkeypatch
+    ):
+        """크기 제한을 넘으면 413으로 거절하고 임시 파일을 지웁니다."""
+        monkeypatch.setattr(ingest, "MAX_UPLOAD_SIZE", 64 * 1024)
+        data = b"\xff\xd8\xff\xe0" + b"\x00" * (200 * 1024)
+
+        async def body():
+            # Content-Length 없는 chunked 본문 → 받는 도중에 검사해야 함
+            boundary = b"--petcam"
+            yield boundary + b"\r\n"
+            yield b'Content-Disposition: form-data; name="file"; filename="a.jpg"\r\n'
+            yield b"Content-Type: image/jpeg\r\n\r\n"
+            for i in range(0, len(data), 16 * 1024):
+                yield data[i : i + 16 * 1024]
+            yield b"\r\n" + boundary + b"--\r\n"
+
+        response = await authenticated_client.post(
+            "/upscale",
+            content=body(),
+            headers={"Content-Type": "multipart/form-data; boundary=petcam"},
+        )
+
+        assert response.status_code == 413
+        assert _part_files() == []
+
+    @pytest.mark.asyncio
+    async def test_content_length_over_limit_is_rejected_early(
+        self, authenticated_client: AsyncClient, monkeypatch
+    ):
+        """Content-Length가 제한을 넘으면 본문을 읽기 전에 413을 반환합니다."""
+        monkeypatch.setattr(ingest, "MAX_UPLOAD_SIZE", 1024)
+        data = _jpeg(np.zeros((256, 256, 3), dtype=np.uint8)) + b"\x00" * 32 * 1024
+
+        response = await authenticated_client.post(
+            "/upscale", files={"file": ("a.jpg", data, "image/jpeg")}
+        )
+
+        assert response.status_code == 413
+
+
+class TestBestCutUpload:
+    """POST /bestcut 스트리밍 저장"""
+
+    @pytest.mark.asyncio
+    async def test_only_sharpest_frame_is_kept(
+        self, authenticated_client: AsyncClient, db_session: AsyncSession
+    ):
+        """가장 선명한 사진만 원본으로 남고 나머지 임시 파일은 지워집니다."""
+        rng = np.random.default_rng(1)
+        blurry = _jpeg(np.full((64, 64, 3), 128, dtype=np.uint8))
+        sharp = _jpeg(rng.integers(0, 256, (64, 64, 3), dtype=np.uint8))
+        before = set(os.listdir(ingest.ORIGINALS_DIR))
+
+        response = await authenticated_client.post(
+            "/bestcut",
+            files=[
+                ("files", ("a.jpg", blurry, "image/jpeg")),
+                ("files", ("b.jpg", sharp, "image/jpeg")),
+            ],
+        )
+
+        assert response.status_code == 200, response.text
+        result = await db_session.execute(
+            select(PhotoRecord).filter(PhotoRecord.id == response.json()["id"])
+        )
+        record = result.scalar_one()
+        with open(record.original_path, "rb") as f:
+            assert f.read() == sharp
+        assert set(os.listdir(ingest.ORIGINALS_DIR)) - before == {
+            os.path.basename(record.original_path)
+        }
+
+        os.remove(record.original_path)
@@ -0,0 +1,292 @@
+"""
+=============================================================================
+PetCam AI Server - 작업 큐 / 워커 테스트
+=============================================================================
+
+테스트 대상:
+    - app/services/job_queue.py - 작업 점유(claim), lease 만료, 재시도 한도
+    - app/worker.py - 워커가 점유한 작업을 처리 함수로 넘기는지
+    - app/services/ai_service.py - 처리 중 상태 변경 (추론 중에는 커넥션을 잡지 않는지)
+    - POST /upscale - 업로드는 QUEUED 레코드만 남기고 추론하지 않는지
+
+실행 방법:
+    pytest tests/test_job_queue.py -v
+=============================================================================
+"""
+
+import asyncio
+import datetime
+import io
+import os
+import uuid
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from httpx import AsyncClient
+from PIL import Image
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.orm import sessionmaker
+
+from models import PhotoRecord, ProcessingStatus
+from app.core.db_stats import pool_stats
+from app.services import ai_service, job_queue
+from app.worker import UpscaleWorker
+
+
+async def _add_queued(db: AsyncSession, count: int = 1) -> list:
+    """QUEUED 상태의 사진 레코드를 count개 생성"""
+    ids = []
+    base = datetime.datetime.utcnow()
+    for i in range(count):
+        photo_id = str(uuid.uuid4())
+        db.add(
+            PhotoRecord(
+                id=photo_id,
+                original_path=f"storage/originals/{photo_id}.jpg",
+                status=ProcessingStatus.QUEUED,
+                created_at=base + datetime.timedelta(seconds=i),
+            )
+        )
+        ids.append(photo_id)
+    await db.commit()
+    return ids
+
+
+# =============================================================================
+# 작업 점유 테스트
+# =============================================================================
+
+class TestClaimJobs:
+    """job_queue.claim_jobs 테스트 모음"""
+
+    @pytest.mark.asyncio
+    async def test_claim_marks_processing(self, db_session: AsyncSession):
+        """점유한 작업은 PROCESSING + lease 정보가 기록되어야 합니다."""
+        ids = await _add_queued(db_session, 3)
+
+        claimed = await job_queue.claim_jobs(db_session, "worker-a", limit=2)
+
+        # 생성순으로 2개만 점유
+        assert [r.id for r in claimed] == ids[:2]
+        for record in claimed:
+            assert record.status == ProcessingStatus.PROCESSING
+            assert record.locked_by == "worker-a"
+            assert record.locked_until > datetime.datetime.utcnow()
+            assert record.attempts == 1
+
+    @pytest.mark.asyncio
+    async def test_claimed_job_is_not_claimed_twice(self, db_session: AsyncSession):
+        """한 워커가 점유한 작업을 다른 워커가 다시 가져가면 안 됩니다."""
+        await _add_queued(db_session, 1)
+
+        first = await job_queue.claim_jobs(db_session, "worker-a", limit=5)
+        second = await job_queue.claim_jobs(db_session, "worker-b", limit=5)
+
+        assert len(first) == 1
+        assert second == []
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_is_reclaimed(self, db_session: AsyncSession):
+        """
+        워커가 죽어서 lease가 만료되면 다른 워커가 재점유합니다. (크래시 복구)
+        """
+        await _add_queued(db_session, 1)
+        await job_queue.claim_jobs(db_session, "worker-a", visibility_timeout=-1)
+
+        reclaimed = await job_queue.claim_jobs(db_session, "worker-b")
+
+        assert len(reclaimed) == 1
+        assert reclaimed[0].locked_by == "worker-b"
+        assert reclaimed[0].attempts == 2
+
+    @pytest.mark.asyncio
+    async def test_exhausted_job_is_failed(self, db_session: AsyncSession):
+        """재시도 한도를 모두 쓴 작업은 더 이상 점유되지 않고 FAILED 처리됩니다."""
+        ids = await _add_queued(db_session, 1)
+        for i in range(job_queue.JOB_MAX_ATTEMPTS):
+            await job_queue.claim_jobs(db_session, f"worker-{i}", visibility_timeout=-1)
+
+        assert await job_queue.claim_jobs(db_session, "worker-x") == []
+        assert await job_queue.fail_exhausted_jobs(db_session) == 1
+
+        result = await db_session.execute(
+            select(PhotoRecord)
+            .filter(PhotoRecord.id == ids[0])
+            .execution_options(populate_existing=True)
+        )
+        assert result.scalar_one().status == ProcessingStatus.FAILED
+
+    @pytest.mark.asyncio
+    async def test_release_returns_jobs_to_queue(self, db_session: AsyncSession):
+        """정상 종료하는 워커가 반납한 작업은 다시 QUEUED가 됩니다."""
+        await _add_queued(db_session, 2)
+        await job_queue.claim_jobs(db_session, "worker-a", limit=2)
+
+        assert await job_queue.release_jobs(db_session, "worker-a") == 2
+        assert await job_queue.count_queued(db_session) == 2
+
+
+# =============================================================================
+# 워커 테스트
+# =============================================================================
+
+class TestUpscaleWorker:
+    """app.worker.UpscaleWorker 테스트 모음"""
+
+    @pytest.mark.asyncio
+    async def test_run_once_dispatches_claimed_jobs(self, db_session: AsyncSession):
+        """워커는 동시성 한도만큼 작업을 점유해서 처리 함수에 넘깁니다."""
+        ids = await _add_queued(db_session, 3)
+        session_factory = sessionmaker(
+            bind=db_session.bind, class_=AsyncSession, expire_on_commit=False
+        )
+        worker = UpscaleWorker(
+            concurrency=2, session_factory=session_factory, worker_id="worker-a"
+        )
+
+        with patch("app.worker.process_image_task", new=AsyncMock()) as task:
+            claimed = await worker.run_once()
+            # 처리 태스크 종료 대기
+            while worker.in_flight:
+                await asyncio.sleep(0)
+
+        assert claimed == 2
+        called_ids = sorted(call.args[0] for call in task.call_args_list)
+        assert called_ids == sorted(ids[:2])
+
+
+# =============================================================================
+# 처리 작업 상태 변경 테스트
+# =============================================================================
+
+class TestProcessImageTask:
+    """ai_service.process_image_task 의 상태 변경"""
+
+    @pytest.fixture
+    def task_env(self, db_session: AsyncSession, monkeypatch):
+        """process_image_task 가 테스트 DB를 쓰고, 추론 대신 가짜 함수를 실행하도록"""
+        monkeypatch.setattr(
+            ai_service,
+            "SessionLocal",
+            sessionmaker(bind=db_session.bind, class_=AsyncSession, expire_on_commit=False),
+        )
+        held_during_inference = []
+
+        def fake_process(original_path, res_path):
+            held_during_inference.append(pool_stats.checked_out)
+            return "test-model"
+
+        monkeypatch.setattr(ai_service, "process_image_sync", fake_process)
+        return held_during_inference
+
+    async def _get(self, db: AsyncSession, photo_id: str) -> PhotoRecord:
+        result = await db.execute(
+            select(PhotoRecord)
+            .filter(PhotoRecord.id == photo_id)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+
+    @pytest.mark.asyncio
+    async def test_completes_without_holding_connection(
+        self, db_session: AsyncSession, task_env
+    ):
+        """추론 중에는 커넥션을 잡지 않고, 끝나면 COMPLETED로 바꿉니다."""
+        (photo_id,) = await _add_queued(db_session)
+        await job_queue.claim_jobs(db_session, "worker-a")
+        record = await self._get(db_session, photo_id)
+        record.content_hash = "0" * 64  # 결과 캐시 조회(미스)까지 거치도록
+        await db_session.commit()
+
+        await ai_service.process_image_task(photo_id, "unused.jpg", "worker-a")
+
+        assert task_env == [0]
+        record = await self._get(db_session, photo_id)
+        assert record.status == ProcessingStatus.COMPLETED
+        assert record.upscaled_path == f"storage/results/{photo_id}.jpg"
+        assert record.model_version == "test-model"
+
+    @pytest.mark.asyncio
+    async def test_failure_marks_failed(self, db_session: AsyncSession, task_env, monkeypatch):
+        """추론이 실패하면 FAILED와 오류 메시지를 남깁니다."""
+        (photo_id,) = await _add_queued(db_session)
+
+        def broken(original_path, res_path):
+            raise RuntimeError("decode error")
+
+        monkeypatch.setattr(ai_service, "process_image_sync", broken)
+        await job_queue.claim_jobs(db_session, "worker-a")
+        await ai_service.process_image_task(photo_id, "unused.jpg", "worker-a")
+
+        record = await self._get(db_session, photo_id)
+        assert record.status == ProcessingStatus.FAILED
+        assert record.error_message == "decode error"
+
+    @pytest.mark.asyncio
+    async def test_deleted_photo_is_skipped(self, db_session: AsyncSession, task_env):
+        """없는(삭제된) 사진은 추론하지 않습니다."""
+        await ai_service.process_image_task(str(uuid.uuid4()), "unused.jpg", "worker-a")
+
+        assert task_env == []
+
+    @pytest.mark.asyncio
+    async def test_reclaimed_job_is_not_overwritten(
+        self, db_session: AsyncSession, task_env, monkeypatch
+    ):
+        """lease가 만료돼 다른 워커가 재점유한 작업은 이전 워커가 끝내도 기록하지 않습니다."""
+        (photo_id,) = await _add_queued(db_session)
+        await job_queue.claim_jobs(db_session, "worker-a", visibility_timeout=-1)
+
+        def slow_worker_a(original_path, res_path):
+            # worker-a 가 추론하는 동안 lease 만료 → worker-b 가 재점유
+            asyncio.run_coroutine_threadsafe(
+                job_queue.claim_jobs(db_session, "worker-b"), loop
+            ).result(timeout=5)
+            raise RuntimeError("stale worker error")
+
+        loop = asyncio.get_running_loop()
+        monkeypatch.setattr(ai_service, "process_image_sync", slow_worker_a)
+        await ai_service.process_image_task(photo_id, "unused.jpg", "worker-a")
+
+        record = await self._get(db_session, photo_id)
+        assert record.status == ProcessingStatus.PROCESSING
+        assert record.locked_by == "worker-b"
+        assert record.error_message is None
+
+        # 점유하지 않은 작업은 시작하지도 않음
+        assert await job_queue.mark_processing(db_session, photo_id, "worker-a") == (False, None)
+        assert not await job_queue.mark_completed(
+            db_session, photo_id, "worker-a", "storage/results/x.jpg", "v1"
+        )
+
+
+# =============================================================================
+# 업로드 API 테스트
+# =============================================================================
+
+class TestUploadEnqueues:
+    """POST /upscale 가 작업만 큐에 넣는지 확인"""
+
+    @pytest.mark.asyncio
+    async def test_upload_creates_queued_record(
+        self, authenticated_client: AsyncClient, db_session: AsyncSession
+    ):
+        """업로드 직후 레코드는 QUEUED 상태로 남아 워커를 기다립니다."""
+        buffer = io.BytesIO()
+        Image.new("RGB", (32, 32), color="red").save(buffer, format="JPEG")
+        files = {"file": ("test.jpg", buffer.getvalue(), "image/jpeg")}
+
+        response = await authenticated_client.post("/upscale", files=files)
+
+        assert response.status_code == 200, response.text
+        photo_id = response.json()["id"]
+
+        result = await db_session.execute(
+            select(PhotoRecord).filter(PhotoRecord.id == photo_id)
+        )
+        record = result.scalar_one()
+        assert record.status == ProcessingStatus.QUEUED
+        assert record.locked_by is None
+
+        os.remove(record.original_path)
@@ -0,0 +1,137 @@
+"""
+=============================================================================
+PetCam AI Server - Prometheus 메트릭 테스트
+=============================================================================
+
+테스트 대상:
+    - GET /metrics - Prometheus 텍스트 형식
+    - app/core/metrics.py - 단계별 히스토그램, 라우트별 요청 시간, 멀티 프로세스 합계
+
+이 테스트들이 확인하는 것:
+    1. /metrics 에 큐 깊이와 라우트(경로 템플릿)별 요청 시간이 나오는지
+    2. process_image_sync 가 decode / inference / encode / thumbnail 시간을 기록하는지
+    3. PROMETHEUS_MULTIPROC_DIR 을 쓰면 여러 프로세스의 값이 합쳐지는지
+
+실행 방법:
+    pytest tests/test_metrics.py -v
+=============================================================================
+"""
+
+import datetime
+import os
+import subprocess
+import sys
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from PIL import Image
+from prometheus_client import REGISTRY
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import PhotoRecord, ProcessingStatus
+from app.services import ai_service, renditions
+
+AI_SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _stage_count(stage: str) -> float:
+    return REGISTRY.get_sample_value(
+        "petcam_pipeline_stage_seconds_count", {"stage": stage}
+    ) or 0.0
+
+
+class TestMetricsEndpoint:
+    """GET /metrics"""
+
+    @pytest.mark.asyncio
+    async def test_queue_depth_and_route_latency(
+        self, authenticated_client: AsyncClient, db_session: AsyncSession
+    ):
+        """큐 깊이는 DB 기준, 요청 시간은 경로 템플릿 라벨로 기록됩니다."""
+        for i in range(3):
+            db_session.add(
+                PhotoRecord(
+                    id=str(uuid.uuid4()),
+                    original_path=f"storage/originals/{i}.jpg",
+                    status=ProcessingStatus.QUEUED,
+                    created_at=datetime.datetime.utcnow(),
+                )
+            )
+        await db_session.commit()
+        await authenticated_client.get("/photos")
+        await authenticated_client.get("/photos/missing-id")
+
+        response = await authenticated_client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        body = response.text
+        assert "petcam_queue_depth 3.0" in body
+        assert 'route="/photos",status="200"' in body
+        # 실제 ID가 아니라 템플릿으로 묶임
+        assert 'route="/photos/{photo_id}",status="404"' in body
+        assert "missing-id" not in body
+        # DB 커넥션 풀 지표 (/health 가 아니라 여기서 노출)
+        assert "petcam_db_pool_checked_out" in body
+        assert "petcam_db_pool_checkout_wait_seconds_bucket" in body
+        assert "petcam_db_pool_timeouts_total" in body
+
+
+class TestPipelineStages:
+    """process_image_sync 단계별 시간"""
+
+    def test_stages_are_recorded(self, tmp_path, monkeypatch):
+        """모델 없이(4배 리사이즈) 처리해도 단계마다 한 번씩 기록됩니다."""
+        monkeypatch.setattr(ai_service.model_manager, "get", lambda: None)
+        monkeypatch.setattr(renditions, "RENDITIONS_DIR", str(tmp_path / "renditions"))
+        source = tmp_path / "in.jpg"
+        Image.new("RGB", (16, 16), "white").save(source)
+        stages = ("decode", "inference", "encode", "thumbnail")
+        before = {stage: _stage_count(stage) for stage in stages}
+
+        ai_service.process_image_sync(str(source), str(tmp_path / "out.jpg"))
+
+        for stage, count in before.items():
+            assert _stage_count(stage) == count + 1, stage
+
+
+class TestMultiProcess:
+    """PROMETHEUS_MULTIPROC_DIR 사용 시 프로세스 합계"""
+
+    def _run(self, code: str, multiproc_dir) -> str:
+        env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(multiproc_dir)}
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=AI_SERVER_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return result.stdout
+
+    def test_values_from_processes_are_combined(self, tmp_path):
+        """
+        워커 프로세스 두 개의 기록을 어느 프로세스에서 읽어도 합계가 나오고,
+        종료된 프로세스(mark_process_dead)는 처리 중 작업 수에서 빠집니다.
+        """
+        record = (
+            "import os\n"
+            "from app.core import metrics\n"
+            "metrics.observe_stage('inference', 0.2)\n"
+            "metrics.JOBS_IN_FLIGHT.inc()\n"
+            "print(os.getpid())\n"
+        )
+        first_pid = int(self._run(record, tmp_path))
+        self._run(record, tmp_path)
+
+        body = self._run(
+            "from app.core import metrics\n"
+            f"metrics.mark_process_dead({first_pid})\n"
+            "print(metrics.render().decode())\n",
+            tmp_path,
+        )
+
+        assert 'petcam_pipeline_stage_seconds_count{stage="inference"} 2.0' in body
+        assert "petcam_jobs_in_flight 1.0" in body
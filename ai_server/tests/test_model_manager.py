@@ -0,0 +1,116 @@
+"""
+=============================================================================
+PetCam AI Server - 모델 수명주기 테스트
+=============================================================================
+
+테스트 대상:
+    app/services/model_manager.py - ModelManager
+
+이 테스트들이 확인하는 것:
+    1. 모델은 처음 사용할 때 한 번만 로드되는지 (동시에 요청해도 한 번)
+    2. 로드 직후 워밍업 추론이 실행되고 시간이 기록되는지
+    3. 로드 실패 시 failed 상태가 되고, 재시도 간격 전에는 다시 로드하지 않는지
+    4. 백그라운드 로드가 끝나면 ready 상태가 되는지
+
+실행 방법:
+    pytest tests/test_model_manager.py -v
+=============================================================================
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.services.model_manager import ModelManager, ModelState
+
+
+class _FakeEngine:
+    """infer_many 호출 기록용 가짜 엔진"""
+
+    def __init__(self):
+        self.calls = []
+
+    def infer_many(self, arrays):
+        self.calls.append([a.shape for a in arrays])
+        return arrays
+
+
+class TestModelManager:
+    """ModelManager 상태 전이"""
+
+    def test_loads_lazily_once_and_warms_up(self):
+        """여러 스레드가 동시에 get()해도 로더는 한 번만 실행되고 워밍업이 1회 실행됩니다."""
+        engine = _FakeEngine()
+        load_count = []
+
+        def loader():
+            load_count.append(1)
+            time.sleep(0.05)
+            return engine
+
+        manager = ModelManager(loader, warmup_size=16)
+        assert manager.state == ModelState.NOT_LOADED
+        assert load_count == []
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: manager.get(), range(4)))
+
+        assert results == [engine] * 4
+        assert load_count == [1]
+        assert engine.calls == [[(16, 16, 3)]]
+        status = manager.status()
+        assert status["state"] == "ready"
+        assert status["load_seconds"] >= 0.05
+        assert status["warmup_ms"] is not None
+
+    def test_failure_is_reported_and_retried_after_interval(self):
+        """로드에 실패하면 failed 상태, 재시도 간격이 지나면 다시 시도합니다."""
+        attempts = []
+
+        def loader():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("weights download failed")
+            return _FakeEngine()
+
+        manager = ModelManager(loader, warmup_size=0, retry_seconds=0.1)
+
+        assert manager.get() is None
+        assert manager.status()["state"] == "failed"
+        assert "download failed" in manager.status()["error"]
+
+        # 재시도 간격 전에는 로더를 다시 부르지 않음
+        assert manager.get() is None
+        assert len(attempts) == 1
+
+        time.sleep(0.15)
+        assert manager.get() is not None
+        assert manager.ready
+        assert manager.status()["error"] is None
+
+    def test_unavailable_model_is_failed(self):
+        """로더가 None을 반환하면(모델 없음) failed 상태가 됩니다."""
+        manager = ModelManager(lambda: None, warmup_size=0)
+
+        assert manager.get() is None
+        assert manager.state == ModelState.FAILED
+
+    def test_background_load(self):
+        """백그라운드 로드 중에는 loading, 끝나면 ready 상태입니다."""
+        release = threading.Event()
+
+        def loader():
+            release.wait(timeout=5)
+            return _FakeEngine()
+
+        manager = ModelManager(loader, warmup_size=0)
+        thread = manager.start_background_load()
+
+        deadline = time.monotonic() + 2
+        while manager.state != ModelState.LOADING and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert manager.state == ModelState.LOADING
+
+        release.set()
+        thread.join(timeout=5)
+        assert manager.ready
@@ -0,0 +1,148 @@
+"""
+=============================================================================
+PetCam AI Server - 모델 서버 테스트
+=============================================================================
+
+테스트 대상:
+    app/services/model_server.py - ModelServer, RemoteInferenceClient
+    model_server.py - 모델 서버 진입점
+
+이 테스트들이 확인하는 것:
+    1. 클라이언트가 보낸 타일이 서버의 엔진에서 처리되어 그대로 돌아오는지
+    2. 여러 프로세스(클라이언트)의 요청이 서버에서 한 배치로 묶이는지
+    3. 서버 쪽 추론 오류가 클라이언트에 예외로 전달되는지
+    4. 모델 서버 진입점은 DATABASE_URL 없이 import 되는지 (DB를 쓰지 않는 컨테이너)
+
+실행 방법:
+    pytest tests/test_model_server.py -v
+=============================================================================
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+import torch.nn.functional as F
+from PIL import Image
+
+from app.services.inference_engine import BatchInferenceEngine
+from app.services.model_server import ModelServer, RemoteInferenceClient
+
+
+class _FakeModel:
+    """nearest 업샘플로 동작하는 가짜 모델 (배치 크기 기록)"""
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    def __call__(self, batch):
+        self.batch_sizes.append(batch.shape[0])
+        return F.interpolate(batch, scale_factor=4, mode="nearest")
+
+
+@pytest.fixture
+async def model_server(tmp_path):
+    fake = _FakeModel()
+    engine = BatchInferenceEngine(fake, scale=4, max_batch_size=4, max_wait_ms=300)
+    server = ModelServer(engine, str(tmp_path / "model.sock"))
+    await server.start()
+    yield server, fake
+    await server.close()
+
+
+class TestModelServer:
+    """Unix 소켓 왕복 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_round_trip_matches_local_inference(self, model_server):
+        """서버를 거친 결과가 모델을 직접 호출한 결과와 같아야 합니다."""
+        server, _ = model_server
+        client = RemoteInferenceClient(server.socket_path)
+        tiles = [
+            np.random.default_rng(i).integers(0, 256, (12, 20, 3), dtype=np.uint8)
+            for i in range(3)
+        ]
+
+        results = await asyncio.to_thread(client.infer_many, tiles)
+
+        assert len(results) == 3
+        for tile, result in zip(tiles, results):
+            expected = tile.repeat(4, axis=0).repeat(4, axis=1).astype(np.float32)
+            assert result.shape == (48, 80, 3)
+            assert np.array_equal(result, expected)
+
+    @pytest.mark.asyncio
+    async def test_requests_from_clients_are_batched(self, model_server):
+        """서로 다른 클라이언트(연결)의 요청이 한 번의 forward로 묶입니다."""
+        server, fake = model_server
+        clients = [RemoteInferenceClient(server.socket_path) for _ in range(4)]
+        tile = np.zeros((16, 16, 3), dtype=np.uint8)
+
+        def call(client):
+            return client.infer_many([tile])
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = await asyncio.gather(
+                *[asyncio.wrap_future(pool.submit(call, c)) for c in clients]
+            )
+
+        assert len(results) == 4
+        assert fake.batch_sizes == [4]
+
+    @pytest.mark.asyncio
+    async def test_upscale_returns_pil_image(self, model_server):
+        """upscale()은 로컬 엔진과 같이 PIL 이미지를 돌려줍니다."""
+        server, _ = model_server
+        client = RemoteInferenceClient(server.socket_path)
+
+        result = await asyncio.to_thread(
+            client.upscale, Image.new("RGB", (10, 6), color="blue")
+        )
+
+        assert result.size == (40, 24)
+        assert result.getpixel((0, 0)) == (0, 0, 255)
+
+    @pytest.mark.asyncio
+    async def test_server_error_is_raised_on_client(self, tmp_path):
+        """서버에서 추론이 실패하면 클라이언트에서 RuntimeError가 발생합니다."""
+
+        def broken(batch):
+            raise RuntimeError("CUDA out of memory")
+
+        engine = BatchInferenceEngine(broken, scale=4, max_wait_ms=0)
+        server = ModelServer(engine, str(tmp_path / "model.sock"))
+        await server.start()
+        try:
+            client = RemoteInferenceClient(server.socket_path)
+            tile = np.zeros((8, 8, 3), dtype=np.uint8)
+
+            with pytest.raises(RuntimeError, match="out of memory"):
+                await asyncio.to_thread(client.infer_many, [tile, tile])
+
+            # 응답을 모두 읽었으므로 같은 연결을 계속 사용할 수 있어야 함
+            assert (await asyncio.to_thread(client.ping))["ok"] is True
+        finally:
+            await server.close()
+
+
+def test_entrypoint_imports_without_database_url():
+    """model_server.py 는 DB 모듈을 import 하지 않아서 DATABASE_URL 이 없어도 시작됩니다."""
+    ai_server_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = {k: v for k, v in os.environ.items() if k != "DATABASE_URL"}
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, model_server; assert 'database' not in sys.modules",
+        ],
+        cwd=ai_server_dir,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stderr
@@ -6,12 +6,13 @@ PetCam AI Server - 사진 API 테스트
 테스트 대상:
     - GET /photos - 사진 목록 조회
     - POST /upscale - 사진 업로드 및 업스케일
+    - GET /photos/status - 여러 사진의 처리 상태 조회
     - GET /photos/{id} - 특정 사진 조회
     - DELETE /photos/{id} - 사진 삭제
 
 이 테스트들이 확인하는 것:
     1. 사진 목록을 정상적으로 가져오는지
-    2. 페이지네이션(skip, limit)이 동작하는지
+    2. 페이지네이션(skip, limit, cursor)이 동작하는지
     3. 인증 없이 접근하면 거부되는지
     
 주의사항:
@@ -23,10 +24,17 @@ PetCam AI Server - 사진 API 테스트
 =============================================================================
 """
 
+import datetime
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
 from unittest.mock import patch, AsyncMock
 
+from models import PhotoRecord, ProcessingStatus
+from app.auth import get_password_hash
+from app.models.user import User
+
 
 # =============================================================================
 # 사진 목록 조회 테스트
@@ -181,6 +189,63 @@ class TestGetPhotos:
         assert response.status_code == 422, \
             "limit 최대값 초과가 허용되었습니다"
 
+    # =========================================================================
+    # 테스트 7: 커서 페이지네이션
+    # =========================================================================
+
+    @pytest.mark.asyncio
+    async def test_get_photos_with_cursor(
+        self, authenticated_client: AsyncClient, db_session: AsyncSession, test_user: User
+    ):
+        """
+        X-Next-Cursor 헤더를 따라가면 모든 사진을 한 번씩, 최신순으로 받는지 확인합니다.
+
+        커서가 뭔가요?
+            "몇 개 건너뛰기(skip)" 대신 "마지막으로 받은 사진 다음부터"를 뜻하는 표시입니다.
+            뒤 페이지로 가도 느려지지 않고, 그 사이 새 사진이 올라와도 중복/누락이 없습니다.
+        """
+        # 같은 시각에 만든 사진이 섞여 있어도 순서가 고정되는지 함께 확인
+        base = datetime.datetime(2026, 1, 1)
+        for i in range(7):
+            db_session.add(
+                PhotoRecord(
+                    id=f"photo-{i}",
+                    owner_id=test_user.id,
+                    original_path=f"storage/originals/photo-{i}.jpg",
+                    status=ProcessingStatus.QUEUED,
+                    created_at=base + datetime.timedelta(minutes=i // 2),
+                )
+            )
+        await db_session.commit()
+
+        seen = []
+        cursor = None
+        while True:
+            params = {"limit": 3, **({"cursor": cursor} if cursor else {})}
+            response = await authenticated_client.get("/photos", params=params)
+            assert response.status_code == 200
+            seen += [photo["id"] for photo in response.json()]
+            cursor = response.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+
+        # created_at DESC, 같은 시각이면 id DESC
+        assert seen == [f"photo-{i}" for i in reversed(range(7))]
+
+    # =========================================================================
+    # 테스트 8: 잘못된 커서
+    # =========================================================================
+
+    @pytest.mark.asyncio
+    async def test_get_photos_invalid_cursor(self, authenticated_client: AsyncClient):
+        """
+        해석할 수 없는 커서는 400으로 거부되는지 확인합니다.
+        """
+        response = await authenticated_client.get("/photos?cursor=not-a-cursor")
+
+        assert response.status_code == 400, \
+            "잘못된 커서가 허용되었습니다"
+
 
 # =============================================================================
 # 사진 업로드 테스트
@@ -231,6 +296,77 @@ class TestUploadPhoto:
             "파일 없는 업로드가 허용되었습니다"
 
 
+# =============================================================================
+# 처리 상태 일괄 조회 테스트
+# =============================================================================
+
+class TestGetPhotosStatus:
+    """
+    여러 사진의 처리 상태 조회 API 테스트 모음
+
+    GET /photos/status?ids=a,b,c
+    """
+
+    @pytest.mark.asyncio
+    async def test_status_for_many_ids(
+        self, authenticated_client: AsyncClient, db_session: AsyncSession, test_user: User
+    ):
+        """
+        요청한 사진의 상태만 한 번에 받는지 확인합니다.
+
+        - 없는 ID는 결과에서 빠짐
+        - 값이 없는 error_message는 생략
+        - 업스케일 결과가 있는 사진만 renditions가 채워짐
+        """
+        for photo_id, status, upscaled_path, error in (
+            ("p-done", ProcessingStatus.COMPLETED, "storage/results/p-done.jpg", None),
+            ("p-queued", ProcessingStatus.QUEUED, None, None),
+            ("p-failed", ProcessingStatus.FAILED, None, "decode error"),
+        ):
+            db_session.add(
+                PhotoRecord(
+                    id=photo_id,
+                    owner_id=test_user.id,
+                    original_path=f"storage/originals/{photo_id}.jpg",
+                    upscaled_path=upscaled_path,
+                    status=status,
+                    error_message=error,
+                )
+            )
+        await db_session.commit()
+
+        response = await authenticated_client.get(
+            "/photos/status", params={"ids": "p-done,p-queued,p-failed,p-missing,p-done"}
+        )
+
+        assert response.status_code == 200
+        by_id = {photo["id"]: photo for photo in response.json()}
+        assert by_id == {
+            "p-done": {
+                "id": "p-done",
+                "status": "COMPLETED",
+                "renditions": ["thumb", "medium", "full"],
+            },
+            "p-queued": {"id": "p-queued", "status": "QUEUED", "renditions": []},
+            "p-failed": {
+                "id": "p-failed",
+                "status": "FAILED",
+                "error_message": "decode error",
+                "renditions": [],
+            },
+        }
+
+    @pytest.mark.asyncio
+    async def test_status_id_limit(self, authenticated_client: AsyncClient):
+        """ids가 비었거나 100개를 넘으면 400"""
+        response = await authenticated_client.get("/photos/status", params={"ids": ""})
+        assert response.status_code == 400
+
+        too_many = ",".join(f"id-{i}" for i in range(101))
+        response = await authenticated_client.get("/photos/status", params={"ids": too_many})
+        assert response.status_code == 400
+
+
 # =============================================================================
 # 사진 삭제 테스트
 # =============================================================================
@@ -322,3 +458,51 @@ class TestGetPhotoById:
         # 401 = 인증 필요
         assert response.status_code == 401, \
             "인증 없이 사진 조회가 허용되었습니다"
+
+
+# =============================================================================
+# 사진 소유자 테스트
+# =============================================================================
+
+class TestPhotoOwnership:
+    """
+    다른 사용자의 사진이 보이지 않는지 확인하는 테스트 모음
+
+    GET /photos, GET /photos/{id}, DELETE /photos/{id}
+    """
+
+    @pytest.mark.asyncio
+    async def test_other_users_photo_is_hidden(
+        self, authenticated_client: AsyncClient, db_session: AsyncSession
+    ):
+        """
+        다른 사용자의 사진은 목록에 없고, 조회/삭제하면 404인지 확인합니다.
+
+        왜 403이 아니라 404인가요?
+            403이면 "그 사진이 있다"는 사실을 알려주게 됩니다.
+        """
+        other = User(username="otheruser", hashed_password=get_password_hash("otherpassword"))
+        db_session.add(other)
+        await db_session.commit()
+        db_session.add(
+            PhotoRecord(
+                id="others-photo",
+                owner_id=other.id,
+                original_path="storage/originals/others-photo.jpg",
+                status=ProcessingStatus.QUEUED,
+            )
+        )
+        await db_session.commit()
+
+        response = await authenticated_client.get("/photos")
+        assert response.json() == [], "다른 사용자의 사진이 목록에 보입니다"
+
+        response = await authenticated_client.get("/photos/others-photo")
+        assert response.status_code == 404
+
+        response = await authenticated_client.get("/photos/status?ids=others-photo")
+        assert response.json() == []
+
+        response = await authenticated_client.delete("/photos/others-photo")
+        assert response.status_code == 404
+        assert await db_session.get(PhotoRecord, "others-photo") is not None
@@ -0,0 +1,88 @@
+"""
+=============================================================================
+PetCam AI Server - 사용자(principal) 캐시 테스트
+=============================================================================
+
+테스트 대상:
+    app/services/principal_cache.py (get_current_user)
+
+이 테스트들이 확인하는 것:
+    1. 같은 토큰의 두 번째 요청은 users 테이블을 조회하지 않는지
+    2. 사용자를 비활성화하면 캐시가 바로 지워지고 400이 되는지
+    3. 크기 제한을 넘으면 가장 오래 안 쓴 항목부터 지워지는지
+    4. TTL이 지나면 다시 조회하는지
+
+실행 방법:
+    pytest tests/test_principal_cache.py -v
+=============================================================================
+"""
+
+import time
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import User
+from app.services.principal_cache import PrincipalCache, principals
+
+
+class TestPrincipalCache:
+    """get_current_user 의 사용자 캐시"""
+
+    @pytest.mark.asyncio
+    async def test_second_request_skips_user_query(
+        self, authenticated_client: AsyncClient, db_session: AsyncSession
+    ):
+        """캐시된 동안에는 DB의 사용자 행이 바뀌어도 다시 읽지 않습니다."""
+        response = await authenticated_client.get("/photos")
+        assert response.status_code == 200
+        hits = principals.hits
+
+        # ORM 이벤트를 거치지 않는 변경 → 캐시가 그대로면 여전히 200
+        await db_session.execute(text("UPDATE users SET is_active = 0"))
+        await db_session.commit()
+        response = await authenticated_client.get("/photos")
+
+        assert response.status_code == 200
+        assert principals.hits == hits + 1
+
+    @pytest.mark.asyncio
+    async def test_deactivation_invalidates(
+        self, authenticated_client: AsyncClient, db_session: AsyncSession, test_user: User
+    ):
+        """사용자를 비활성화하면 다음 요청부터 바로 거부됩니다."""
+        assert (await authenticated_client.get("/photos")).status_code == 200
+
+        test_user.is_active = False
+        await db_session.commit()
+        response = await authenticated_client.get("/photos")
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Inactive user"
+
+    def test_lru_eviction(self):
+        """최대 크기를 넘으면 가장 오래 사용하지 않은 사용자를 지웁니다."""
+        cache = PrincipalCache(ttl=60, maxsize=2)
+        cache.put("a", User(username="a"))
+        cache.put("b", User(username="b"))
+        assert cache.get("a") is not None  # a를 최근 사용으로
+
+        cache.put("c", User(username="c"))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+    def test_expired_entry_is_reloaded(self, monkeypatch):
+        """TTL이 지난 항목은 미스로 처리합니다."""
+        cache = PrincipalCache(ttl=60, maxsize=10)
+        cache.put("a", User(username="a"))
+        now = time.monotonic()
+        monkeypatch.setattr(
+            "app.services.principal_cache.time.monotonic", lambda: now + 61
+        )
+
+        assert cache.get("a") is None
+        assert cache.snapshot()["size"] == 0
@@ -0,0 +1,122 @@
+"""
+=============================================================================
+PetCam AI Server - 렌디션(썸네일/미리보기) 테스트
+=============================================================================
+
+테스트 대상:
+    app/services/renditions.py (GET /photos/{photo_id}?size=...&format=...)
+
+이 테스트들이 확인하는 것:
+    1. size=thumb 요청 시 작은 이미지를 만들어 저장하고, 다음 요청은 같은 파일을 쓰는지
+    2. format=webp 요청 시 WebP로 응답하는지
+    3. 업스케일 직후 thumb/medium을 미리 만드는지
+    4. 사진을 지우면 렌디션도 지워지는지
+
+실행 방법:
+    pytest tests/test_renditions.py -v
+=============================================================================
+"""
+
+import io
+import os
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from PIL import Image
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import PhotoRecord, ProcessingStatus
+from app.models.user import User
+from app.services import renditions
+
+
+@pytest.fixture
+async def photo(db_session: AsyncSession, test_user: User):
+    """업스케일이 끝난 사진 (결과 2048x1536)"""
+    photo_id = str(uuid.uuid4())
+    os.makedirs("storage/results", exist_ok=True)
+    upscaled_path = f"storage/results/{photo_id}.jpg"
+    Image.new("RGB", (2048, 1536), (30, 120, 200)).save(upscaled_path, format="JPEG")
+
+    record = PhotoRecord(
+        id=photo_id,
+        owner_id=test_user.id,
+        original_path=f"storage/originals/{photo_id}.jpg",
+        upscaled_path=upscaled_path,
+        status=ProcessingStatus.COMPLETED,
+    )
+    db_session.add(record)
+    await db_session.commit()
+
+    yield record
+
+    if os.path.exists(upscaled_path):
+        os.remove(upscaled_path)
+    renditions.remove_renditions(upscaled_path)
+
+
+class TestRenditions:
+    """GET /photos/{photo_id}?size=..."""
+
+    @pytest.mark.asyncio
+    async def test_thumbnail_is_generated_and_cached(
+        self, authenticated_client: AsyncClient, photo
+    ):
+        """썸네일을 한 번 만들어 저장하고, 다음 요청부터 같은 파일을 보냅니다."""
+        response = await authenticated_client.get(f"/photos/{photo.id}", params={"size": "thumb"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/jpeg"
+        image = Image.open(io.BytesIO(response.content))
+        assert max(image.size) == renditions.RENDITION_SIZES["thumb"]
+        path = renditions.rendition_path(photo.upscaled_path, "thumb", "jpeg")
+        assert os.path.exists(path)
+
+        again = await authenticated_client.get(f"/photos/{photo.id}", params={"size": "thumb"})
+        assert again.headers["etag"] == response.headers["etag"]
+
+    @pytest.mark.asyncio
+    async def test_webp_rendition(self, authenticated_client: AsyncClient, photo):
+        """format=webp 이면 WebP로 응답합니다."""
+        if not renditions.is_supported("webp"):
+            pytest.skip("Pillow built without WebP")
+
+        response = await authenticated_client.get(
+            f"/photos/{photo.id}", params={"size": "medium", "format": "webp"}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/webp"
+        assert Image.open(io.BytesIO(response.content)).format == "WEBP"
+
+    @pytest.mark.asyncio
+    async def test_invalid_size_is_rejected(self, authenticated_client: AsyncClient, photo):
+        """정해진 크기 이름이 아니면 422입니다."""
+        response = await authenticated_client.get(f"/photos/{photo.id}", params={"size": "huge"})
+
+        assert response.status_code == 422
+
+    def test_pregenerate_after_upscale(self, photo):
+        """업스케일 결과 이미지로 thumb/medium을 미리 만듭니다."""
+        image = Image.open(photo.upscaled_path)
+
+        renditions.pregenerate(image, photo.upscaled_path)
+
+        for size in ("thumb", "medium"):
+            path = renditions.rendition_path(photo.upscaled_path, size, "jpeg")
+            assert max(Image.open(path).size) == renditions.RENDITION_SIZES[size]
+
+    @pytest.mark.asyncio
+    async def test_renditions_are_deleted_with_photo(
+        self, authenticated_client: AsyncClient, photo
+    ):
+        """사진을 지우면 렌디션 파일도 함께 지워집니다."""
+        await authenticated_client.get(f"/photos/{photo.id}", params={"size": "thumb"})
+        path = renditions.rendition_path(photo.upscaled_path, "thumb", "jpeg")
+        assert os.path.exists(path)
+
+        response = await authenticated_client.delete(f"/photos/{photo.id}")
+
+        assert response.status_code == 200
+        assert not os.path.exists(path)
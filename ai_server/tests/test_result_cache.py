@@ -0,0 +1,203 @@
+"""
+=============================================================================
+PetCam AI Server - 결과 캐시 테스트
+=============================================================================
+
+테스트 대상:
+    app/services/result_cache.py (POST /upscale, DELETE /photos/{id})
+
+이 테스트들이 확인하는 것:
+    1. 같은 내용의 완료된 결과가 있으면 새 업로드가 그 결과를 가리키는지 (추론/저장 없음)
+    2. 모델 버전이 다르면 재사용하지 않는지
+    3. 공유 중인 파일은 마지막 레코드가 지워질 때만 삭제되는지
+    4. 파일이 지워진 오래된 레코드가 있어도 더 최근의 유효한 결과를 재사용하는지
+    5. PostgreSQL에서는 재사용/삭제가 같은 내용의 행을 잠그는지 (SELECT ... FOR UPDATE)
+
+실행 방법:
+    pytest tests/test_result_cache.py -v
+=============================================================================
+"""
+
+import datetime
+import hashlib
+import io
+import os
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from httpx import AsyncClient
+from PIL import Image
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from models import PhotoRecord, ProcessingStatus
+from app.models.user import User
+from app.services import result_cache
+from app.services.ingest import ORIGINALS_DIR
+
+
+def _jpeg(color) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (32, 32), color).save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+@pytest.fixture
+async def completed_photo(db_session: AsyncSession, test_user: User):
+    """이미 업스케일이 끝난 사진 (원본/결과 파일 포함)"""
+    data = _jpeg((200, 100, 50))
+    photo_id = str(uuid.uuid4())
+    os.makedirs("storage/results", exist_ok=True)
+    original_path = f"{ORIGINALS_DIR}/{photo_id}.jpg"
+    upscaled_path = f"storage/results/{photo_id}.jpg"
+    for path in (original_path, upscaled_path):
+        with open(path, "wb") as f:
+            f.write(data)
+
+    record = PhotoRecord(
+        id=photo_id,
+        owner_id=test_user.id,
+        original_path=original_path,
+        upscaled_path=upscaled_path,
+        status=ProcessingStatus.COMPLETED,
+        content_hash=hashlib.sha256(data).hexdigest(),
+        model_version=result_cache.MODEL_VERSION,
+    )
+    db_session.add(record)
+    await db_session.commit()
+
+    yield record, data
+
+    for path in (original_path, upscaled_path):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+async def _get(db_session: AsyncSession, photo_id: str) -> PhotoRecord:
+    result = await db_session.execute(
+        select(PhotoRecord)
+        .filter(PhotoRecord.id == photo_id)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one()
+
+
+class TestResultCache:
+    """같은 내용 재업로드 시 결과 재사용"""
+
+    @pytest.mark.asyncio
+    async def test_duplicate_upload_reuses_result(
+        self, authenticated_client: AsyncClient, db_session: AsyncSession, completed_photo
+    ):
+        """같은 JPEG를 다시 올리면 원본을 저장하지 않고 기존 결과를 가리킵니다."""
+        original, data = completed_photo
+        hits = result_cache.stats.hits
+        before = set(os.listdir(ORIGINALS_DIR))
+
+        response = await authenticated_client.post(
+            "/upscale", files={"file": ("retry.jpg", data, "image/jpeg")}
+        )
+
+        assert response.status_code == 200, response.text
+        record = await _get(db_session, response.json()["id"])
+        assert record.status == ProcessingStatus.COMPLETED
+        assert record.original_path == original.original_path
+        assert record.upscaled_path == original.upscaled_path
+        assert set(os.listdir(ORIGINALS_DIR)) == before
+        assert result_cache.stats.hits == hits + 1
+
+    @pytest.mark.asyncio
+    async def test_stale_record_does_not_hide_newer_result(
+        self, db_session: AsyncSession, test_user: User, completed_photo
+    ):
+        """파일이 지워진 더 오래된 레코드가 있어도 파일이 남아 있는 결과를 찾습니다."""
+        original, data = completed_photo
+        stale = PhotoRecord(
+            id=str(uuid.uuid4()),
+            owner_id=test_user.id,
+            original_path=f"{ORIGINALS_DIR}/missing-{uuid.uuid4()}.jpg",
+            upscaled_path=f"storage/results/missing-{uuid.uuid4()}.jpg",
+            status=ProcessingStatus.COMPLETED,
+            content_hash=original.content_hash,
+            model_version=result_cache.MODEL_VERSION,
+            created_at=original.created_at - datetime.timedelta(days=1),
+        )
+        db_session.add(stale)
+        await db_session.commit()
+
+        found = await result_cache.find_result(db_session, original.content_hash)
+
+        assert found is not None
+        assert found.id == original.id
+
+    @pytest.mark.asyncio
+    async def test_other_model_version_is_not_reused(
+        self, authenticated_client: AsyncClient, db_session: AsyncSession, completed_photo
+    ):
+        """다른 모델 버전의 결과는 재사용하지 않고 큐에 넣습니다."""
+        original, data = completed_photo
+        original.model_version = result_cache.FALLBACK_VERSION
+        await db_session.commit()
+
+        response = await authenticated_client.post(
+            "/upscale", files={"file": ("retry.jpg", data, "image/jpeg")}
+        )
+
+        assert response.status_code == 200, response.text
+        record = await _get(db_session, response.json()["id"])
+        assert record.status == ProcessingStatus.QUEUED
+        assert record.content_hash == original.content_hash
+        assert record.original_path != original.original_path
+        os.remove(record.original_path)
+
+    @pytest.mark.asyncio
+    async def test_shared_files_are_deleted_with_last_reference(
+        self, authenticated_client: AsyncClient, db_session: AsyncSession, completed_photo
+    ):
+        """공유 파일은 가리키는 레코드가 모두 지워진 뒤에만 삭제됩니다."""
+        original, data = completed_photo
+        response = await authenticated_client.post(
+            "/upscale", files={"file": ("retry.jpg", data, "image/jpeg")}
+        )
+        duplicate_id = response.json()["id"]
+
+        response = await authenticated_client.delete(f"/photos/{original.id}")
+        assert response.status_code == 200
+        assert os.path.exists(original.original_path)
+        assert os.path.exists(original.upscaled_path)
+
+        response = await authenticated_client.delete(f"/photos/{duplicate_id}")
+        assert response.status_code == 200
+        assert not os.path.exists(original.original_path)
+        assert not os.path.exists(original.upscaled_path)
+
+
+class _RecordingSession:
+    """PostgreSQL 세션처럼 보이고 실행한 쿼리만 기록하는 가짜 세션"""
+
+    def __init__(self):
+        self.bind = SimpleNamespace(dialect=postgresql.dialect())
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(str(statement.compile(dialect=postgresql.dialect())))
+        return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: []))
+
+
+class TestCacheLocking:
+    """재사용과 삭제의 직렬화 (PostgreSQL 행 잠금)"""
+
+    @pytest.mark.asyncio
+    async def test_lookup_and_delete_lock_shared_rows(self):
+        """결과 조회와 삭제 전 잠금 모두 같은 content_hash 행을 FOR UPDATE 로 잠급니다."""
+        session = _RecordingSession()
+
+        await result_cache.find_result(session, "0" * 64)
+        await result_cache.lock_shared(session, "0" * 64)
+
+        assert len(session.statements) == 2
+        for statement in session.statements:
+            assert "content_hash" in statement
+            assert statement.endswith("FOR UPDATE")
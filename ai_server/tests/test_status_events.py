@@ -0,0 +1,202 @@
+"""
+=============================================================================
+PetCam AI Server - 처리 상태 이벤트 (SSE) 테스트
+=============================================================================
+
+테스트 대상:
+    - GET /photos/events - 사진 처리 상태 스트림 (Server-Sent Events)
+    - app/services/status_events.py - 커밋될 때만 이벤트 전달 (memory 백엔드)
+
+이 테스트들이 확인하는 것:
+    1. 구독하면 현재 상태를 먼저 보내고, 워커의 상태 변경을 이어서 보내는지
+    2. 모든 사진이 끝나면(COMPLETED/FAILED) 스트림이 닫히는지
+    3. 다른 사용자의 사진은 구독할 수 없는지 (조회가 실패해도 구독이 남지 않는지)
+    4. 롤백된 상태 변경은 전달되지 않는지
+    5. 긴 오류 메시지가 NOTIFY payload 한도를 넘지 않는지
+
+실행 방법:
+    pytest tests/test_status_events.py -v
+=============================================================================
+"""
+
+import asyncio
+import datetime
+import json
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import PhotoRecord, ProcessingStatus
+from app.models.user import User
+from app.services import job_queue, status_events
+
+
+async def _add_photo(
+    db: AsyncSession, owner: User, status: ProcessingStatus = ProcessingStatus.QUEUED
+) -> str:
+    photo_id = str(uuid.uuid4())
+    db.add(
+        PhotoRecord(
+            id=photo_id,
+            original_path=f"storage/originals/{photo_id}.jpg",
+            status=status,
+            owner_id=owner.id,
+            created_at=datetime.datetime.utcnow(),
+        )
+    )
+    await db.commit()
+    return photo_id
+
+
+async def _wait_subscribed(db: AsyncSession, count: int = 1):
+    """엔드포인트가 구독 + 현재 상태 조회를 마칠 때까지 대기"""
+    for _ in range(200):
+        if status_events.broker.subscriber_count == count and not db.in_transaction():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("subscription was not registered")
+
+
+def _events(body: str) -> list:
+    return [
+        json.loads(line[len("data: "):])
+        for line in body.splitlines()
+        if line.startswith("data: ")
+    ]
+
+
+class TestPhotoEvents:
+    """GET /photos/events"""
+
+    @pytest.mark.asyncio
+    async def test_streams_snapshot_then_updates(
+        self, authenticated_client: AsyncClient, db_session: AsyncSession, test_user: User
+    ):
+        """현재 상태(QUEUED) → PROCESSING → COMPLETED 순서로 받고 스트림이 끝납니다."""
+        photo_id = await _add_photo(db_session, test_user)
+
+        request = asyncio.create_task(
+            authenticated_client.get("/photos/events", params={"ids": photo_id})
+        )
+        await _wait_subscribed(db_session)
+        await job_queue.claim_jobs(db_session, "worker-a", limit=1)
+        await job_queue.mark_completed(
+            db_session, photo_id, "worker-a", "storage/results/x.jpg", "v1"
+        )
+        response = await asyncio.wait_for(request, timeout=5)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert [e["status"] for e in _events(response.text)] == [
+            "QUEUED",
+            "PROCESSING",
+            "COMPLETED",
+        ]
+        assert status_events.broker.subscriber_count == 0
+
+    @pytest.mark.asyncio
+    async def test_finished_photo_closes_immediately(
+        self, authenticated_client: AsyncClient, db_session: AsyncSession, test_user: User
+    ):
+        """이미 끝난 사진은 현재 상태만 보내고 바로 닫힙니다."""
+        photo_id = await _add_photo(db_session, test_user, ProcessingStatus.COMPLETED)
+
+        response = await authenticated_client.get("/photos/events", params={"ids": photo_id})
+
+        assert response.status_code == 200
+        assert _events(response.text) == [{"id": photo_id, "status": "COMPLETED"}]
+
+    @pytest.mark.asyncio
+    async def test_other_users_photo_not_found(
+        self, authenticated_client: AsyncClient, db_session: AsyncSession
+    ):
+        """다른 사용자의 사진만 요청하면 404"""
+        other = User(username="other", hashed_password="x", is_active=True)
+        db_session.add(other)
+        await db_session.commit()
+        photo_id = await _add_photo(db_session, other)
+
+        response = await authenticated_client.get("/photos/events", params={"ids": photo_id})
+
+        assert response.status_code == 404
+        assert status_events.broker.subscriber_count == 0
+
+    @pytest.mark.asyncio
+    async def test_lookup_failure_releases_subscription(
+        self,
+        authenticated_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user: User,
+        monkeypatch,
+    ):
+        """현재 상태 조회가 실패해도 구독이 남지 않습니다."""
+        photo_id = await _add_photo(db_session, test_user)
+        # 사용자 캐시를 채워 둠 (인증은 커밋하지 않도록)
+        finished_id = await _add_photo(db_session, test_user, ProcessingStatus.COMPLETED)
+        await authenticated_client.get("/photos/events", params={"ids": finished_id})
+
+        async def broken_commit():
+            raise RuntimeError("connection lost")
+
+        monkeypatch.setattr(db_session, "commit", broken_commit)
+        with pytest.raises(RuntimeError, match="connection lost") as excinfo:
+            await authenticated_client.get("/photos/events", params={"ids": photo_id})
+
+        # excinfo 가 핸들러 프레임을 잡고 있어도 (약한 참조 정리에 기대지 않고) 해제됨
+        assert excinfo.value is not None
+        assert status_events.broker.subscriber_count == 0
+
+    @pytest.mark.asyncio
+    async def test_requires_ids(self, authenticated_client: AsyncClient):
+        """ids 가 비어 있으면 400"""
+        response = await authenticated_client.get("/photos/events", params={"ids": ","})
+
+        assert response.status_code == 400
+
+
+class TestMemoryBroker:
+    """커밋될 때만 전달"""
+
+    @pytest.mark.asyncio
+    async def test_rolled_back_change_is_not_delivered(self, db_session: AsyncSession):
+        """롤백된 트랜잭션의 이벤트는 버리고, 다음 커밋에 섞이지 않습니다."""
+        broker = status_events.MemoryBroker()
+        async with broker.subscribe(["a"]) as subscription:
+            await broker.publish(db_session, {"id": "a", "status": "FAILED"})
+            await db_session.rollback()
+            await broker.publish(db_session, {"id": "a", "status": "COMPLETED"})
+            await db_session.commit()
+
+            assert await subscription.get(timeout=1) == {"id": "a", "status": "COMPLETED"}
+            assert await subscription.get(timeout=0.05) is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("message", ["x" * 20000, "디코딩 오류 " * 5000])
+    async def test_long_error_message_fits_notify_payload(
+        self, db_session: AsyncSession, test_user: User, message: str
+    ):
+        """긴 오류 메시지도 FAILED 처리되고, 이벤트는 NOTIFY 한도(8000바이트) 안으로 잘립니다."""
+        photo_id = await _add_photo(db_session, test_user)
+        await job_queue.claim_jobs(db_session, "worker-a")
+
+        async with status_events.broker.subscribe([photo_id]) as subscription:
+            assert await job_queue.mark_failed(db_session, photo_id, "worker-a", message)
+            payload = await subscription.get(timeout=1)
+
+        assert payload["status"] == "FAILED"
+        assert message.startswith(payload["error_message"][:-1])
+        assert len(json.dumps(payload).encode()) < 8000
+        record = await db_session.get(PhotoRecord, photo_id, populate_existing=True)
+        assert record.error_message == message  # 전체 메시지는 DB에 남음
+
+
+def test_broker_without_publish_cannot_be_created():
+    """publish 를 구현하지 않은 백엔드는 처음 발행할 때가 아니라 만들 때 실패합니다."""
+
+    class IncompleteBroker(status_events.Broker):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteBroker()
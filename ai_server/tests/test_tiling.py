@@ -0,0 +1,172 @@
+"""
+=============================================================================
+PetCam AI Server - 타일 업스케일 테스트
+=============================================================================
+
+테스트 대상:
+    app/services/tiling.py - 타일 분할 / 합성 (overlap 블렌딩), 입력 전처리 (load_input)
+
+이 테스트들이 확인하는 것:
+    1. 타일이 이미지 전체를 빠짐없이 덮는지
+    2. 모델에는 tile_size보다 큰 입력이 절대 들어가지 않는지 (메모리 상한)
+    3. 타일로 나눠 처리해도 결과에 이음새가 생기지 않는지
+    4. 축소 디코딩(draft) 결과가 전체 해상도 디코딩 + LANCZOS 와 충분히 가까운지 (PSNR)
+    5. 잘못된 UPSCALE_RESAMPLE 값은 import 시점에 거부되는지
+    6. TILE_SIZE<=0 (타일링 없이 전체 이미지 추론) 은 import 시점에 거부되는지
+
+실행 방법:
+    pytest tests/test_tiling.py -v
+=============================================================================
+"""
+
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+from PIL import Image, ImageFilter
+
+from app.services.tiling import limit_input_size, load_input, plan_tiles, upscale_tiled
+
+
+def _nearest_x4(tiles):
+    """타일마다 nearest x4 업샘플 (위치와 무관한 '완벽한' 모델)"""
+    return [
+        np.repeat(np.repeat(t.astype(np.float32), 4, axis=0), 4, axis=1)
+        for t in tiles
+    ]
+
+
+def _random_image(width: int, height: int) -> Image.Image:
+    rng = np.random.default_rng(0)
+    return Image.fromarray(rng.integers(0, 256, (height, width, 3), dtype=np.uint8))
+
+
+@pytest.mark.parametrize("width,height", [(100, 70), (64, 64), (30, 20)])
+def test_tiles_cover_whole_image(width, height):
+    """모든 픽셀이 최소 하나의 타일에 포함되어야 합니다."""
+    covered = np.zeros((height, width), dtype=bool)
+    for y, x, h, w in plan_tiles(width, height, tile=32, overlap=8):
+        assert h <= 32 and w <= 32
+        covered[y : y + h, x : x + w] = True
+
+    assert covered.all()
+
+
+def test_tiled_result_has_no_seams():
+    """
+    위치와 무관한 모델이라면 타일 결과가 전체 이미지 결과와 똑같아야 합니다.
+    (블렌딩 가중치 합이 1이 아니거나 좌표가 어긋나면 이음새가 생김)
+    """
+    image = _random_image(100, 70)
+
+    tiled = upscale_tiled(image, _nearest_x4, scale=4, tile_size=32, overlap=8)
+    expected = image.resize((400, 280), Image.NEAREST)
+
+    assert tiled.size == (400, 280)
+    diff = np.abs(np.asarray(tiled, dtype=int) - np.asarray(expected, dtype=int))
+    assert diff.max() <= 1
+
+
+def test_model_input_is_bounded_by_tile_size():
+    """이미지 크기와 상관없이 모델에는 tile_size 이하의 타일만 들어갑니다."""
+    seen = []
+
+    def record(tiles):
+        seen.extend(t.shape for t in tiles)
+        return _nearest_x4(tiles)
+
+    upscale_tiled(
+        _random_image(200, 150), record, scale=4, tile_size=48, overlap=8, batch_size=3
+    )
+
+    assert max(h for h, _, _ in seen) <= 48
+    assert max(w for _, w, _ in seen) <= 48
+
+
+def test_limit_input_size_keeps_aspect_ratio():
+    """최대 크기를 넘는 입력은 비율을 유지한 채 축소됩니다."""
+    image = Image.new("RGB", (3200, 2400))
+
+    limit_input_size(image, max_size=1600)
+
+    assert image.size == (1600, 1200)
+
+
+def _psnr(a: Image.Image, b: Image.Image) -> float:
+    diff = np.asarray(a, np.float64) - np.asarray(b, np.float64)
+    return 10 * np.log10(255.0**2 / np.mean(diff**2))
+
+
+def _full_decode(path, max_size: int) -> Image.Image:
+    """이전 방식: 전체 해상도 디코딩 → LANCZOS"""
+    image = Image.open(path).convert("RGB")
+    image.thumbnail((max_size, max_size), Image.LANCZOS)
+    return image
+
+
+@pytest.fixture
+def large_jpeg(tmp_path):
+    """휴대폰 원본 같은 큰 JPEG (부드러운 그라디언트 + 약한 노이즈)"""
+    path = tmp_path / "large.jpg"
+    yy, xx = np.mgrid[0:1500, 0:2000].astype(np.float32)
+    base = np.stack([xx / 2000 * 200, yy / 1500 * 200, (xx + yy) / 3500 * 200], axis=-1)
+    noise = np.random.default_rng(0).normal(0, 12, base.shape)
+    image = Image.fromarray(np.clip(base + noise + 20, 0, 255).astype(np.uint8))
+    image.filter(ImageFilter.GaussianBlur(1)).save(path, format="JPEG", quality=92)
+    return path
+
+
+@pytest.mark.parametrize("resample, min_psnr", [("lanczos", 40.0), ("area", 35.0)])
+def test_load_input_reduced_decode_quality(large_jpeg, resample, min_psnr):
+    """1/2 배율(1000x750)로 디코딩한 뒤 줄여도 이전 방식과 같은 크기, PSNR 기준 이상"""
+    image = load_input(large_jpeg, max_size=900, resample=resample)
+
+    assert image.size == (900, 675)
+    assert image.mode == "RGB"
+    assert _psnr(image, _full_decode(large_jpeg, 900)) >= min_psnr
+
+
+def test_load_input_draft_only_for_large_jpeg(tmp_path):
+    """max_size 이하이거나 JPEG가 아니면 이전 방식과 같은 결과"""
+    source = _random_image(1200, 900)
+    jpeg_path, png_path = tmp_path / "small.jpg", tmp_path / "large.png"
+    source.save(jpeg_path, format="JPEG")
+    source.resize((2400, 1800)).save(png_path, format="PNG")
+
+    assert np.array_equal(
+        np.asarray(load_input(jpeg_path, max_size=1600)),
+        np.asarray(Image.open(jpeg_path).convert("RGB")),
+    )
+    assert np.array_equal(
+        np.asarray(load_input(png_path, max_size=1600)),
+        np.asarray(_full_decode(png_path, 1600)),
+    )
+
+
+def test_invalid_resample_setting_fails_at_import():
+    """UPSCALE_RESAMPLE 오타는 첫 업로드가 아니라 시작할 때 ValueError 로 드러납니다."""
+    result = subprocess.run(
+        [sys.executable, "-c", "import app.services.tiling"],
+        env={**os.environ, "UPSCALE_RESAMPLE": "bilinear"},
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode != 0
+    assert "ValueError: UPSCALE_RESAMPLE must be one of lanczos, area" in result.stderr
+
+
+@pytest.mark.parametrize("tile_size", ["0", "-1"])
+def test_non_positive_tile_size_fails_at_import(tile_size):
+    """TILE_SIZE<=0 은 전체 이미지를 한 번에 추론하지 않고 시작할 때 ValueError 로 막힙니다."""
+    result = subprocess.run(
+        [sys.executable, "-c", "import app.services.tiling"],
+        env={**os.environ, "TILE_SIZE": tile_size},
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode != 0
+    assert "ValueError: TILE_SIZE must be a positive number of pixels" in result.stderr
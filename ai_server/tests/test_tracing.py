@@ -0,0 +1,119 @@
+"""
+=============================================================================
+PetCam AI Server - 요청 ID / 처리 과정 추적 테스트
+=============================================================================
+
+테스트 대상:
+    app/core/tracing.py (TracingMiddleware, job_span, in_current_context)
+
+이 테스트들이 확인하는 것:
+    1. X-Request-ID 를 그대로 돌려주고, 없거나 이상한 값이면 새로 만드는지
+    2. 업로드 요청의 trace 가 작업 큐를 거쳐 워커의 단계(queue.wait, inference...)까지 이어지는지
+    3. 추론 스레드(run_in_executor)에서 만든 span 도 작업 span 의 자식인지
+
+실행 방법:
+    pytest tests/test_tracing.py -v
+=============================================================================
+"""
+
+import asyncio
+import io
+import os
+
+import pytest
+from httpx import AsyncClient
+from PIL import Image
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.orm import sessionmaker
+
+from models import PhotoRecord
+from app.core import tracing
+from app.services import ai_service
+from app.worker import UpscaleWorker
+
+
+class TestRequestID:
+    """X-Request-ID 헤더"""
+
+    @pytest.mark.asyncio
+    async def test_request_id_is_echoed(self, client: AsyncClient):
+        response = await client.get("/health", headers={"X-Request-ID": "app-1234.abc"})
+
+        assert response.headers["x-request-id"] == "app-1234.abc"
+
+    @pytest.mark.asyncio
+    async def test_request_id_is_generated(self, client: AsyncClient):
+        """없거나 허용하지 않는 문자가 있으면 새 ID (로그 주입 방지)"""
+        generated = (await client.get("/health")).headers["x-request-id"]
+        replaced = (
+            await client.get("/health", headers={"X-Request-ID": "bad id\r\nx"})
+        ).headers["x-request-id"]
+
+        assert len(generated) == 32
+        assert replaced != "bad id\r\nx" and len(replaced) == 32
+
+
+class TestUploadTrace:
+    """업로드 → 작업 큐 → 워커가 하나의 trace"""
+
+    @pytest.mark.asyncio
+    async def test_worker_continues_upload_trace(
+        self, authenticated_client: AsyncClient, db_session: AsyncSession, monkeypatch
+    ):
+        session_factory = sessionmaker(
+            bind=db_session.bind, class_=AsyncSession, expire_on_commit=False
+        )
+        monkeypatch.setattr(ai_service, "SessionLocal", session_factory)
+
+        def fake_process(original_path, res_path):
+            # 추론 스레드에서 실행 (컨텍스트를 넘기지 않으면 새 trace 가 됨)
+            with tracing.stage("inference"):
+                return "test-model"
+
+        monkeypatch.setattr(ai_service, "process_image_sync", fake_process)
+        tracing.memory_exporter.clear()
+
+        buffer = io.BytesIO()
+        Image.new("RGB", (32, 32), color="red").save(buffer, format="JPEG")
+        response = await authenticated_client.post(
+            "/upscale",
+            files={"file": ("test.jpg", buffer.getvalue(), "image/jpeg")},
+            headers={"X-Request-ID": "upload-42"},
+        )
+        assert response.status_code == 200, response.text
+        photo_id = response.json()["id"]
+
+        record = (
+            await db_session.execute(select(PhotoRecord).filter(PhotoRecord.id == photo_id))
+        ).scalar_one()
+        assert record.request_id == "upload-42"
+        assert record.traceparent
+
+        worker = UpscaleWorker(session_factory=session_factory, worker_id="worker-a")
+        assert await worker.run_once() == 1
+        while worker.in_flight:
+            await asyncio.sleep(0.01)
+        os.remove(record.original_path)
+
+        spans = {span.name: span for span in tracing.recent_spans()}
+        request_span = spans["POST /upscale"]
+        trace_spans = tracing.recent_spans(request_span.context.trace_id)
+        names = {span.name for span in trace_spans}
+        assert {
+            "upload.receive",
+            "upload.commit",
+            "db.commit",
+            "upscale.job",
+            "queue.wait",
+            "inference",
+            "db_update",
+        } <= names
+
+        job = spans["upscale.job"]
+        # 업로드 요청 안의 span (FastAPI 가 만드는 endpoint span) 이 부모
+        assert job.parent.span_id in {span.context.span_id for span in trace_spans}
+        assert job.parent.span_id != job.context.span_id
+        assert job.attributes["request_id"] == "upload-42"
+        assert spans["inference"].parent.span_id == job.context.span_id
+        assert spans["queue.wait"].end_time <= spans["inference"].start_time
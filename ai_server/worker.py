@@ -0,0 +1,34 @@
+"""
+PetCam AI Server - 업스케일 워커 진입점
+
+API 서버(main.py)와 별도 프로세스로 실행합니다.
+모델 로드(또는 모델 서버 연결)와 워밍업이 끝난 뒤 photos 테이블의 QUEUED 작업을 처리합니다.
+
+실행:
+    python worker.py
+    WORKER_CONCURRENCY=2 python worker.py
+"""
+
+import os
+import asyncio
+import logging
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# 로깅 설정
+log_level = os.getenv("LOG_LEVEL", "info").upper()
+logging.basicConfig(
+    level=getattr(logging, log_level, logging.INFO),
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
+from app.core.metrics import clear_host_files  # noqa: E402
+from app.worker import run_worker, WORKER_CONCURRENCY  # noqa: E402
+
+
+if __name__ == "__main__":
+    # 이 컨테이너의 이전 실행이 남긴 메트릭 파일 정리 (PROMETHEUS_MULTIPROC_DIR 사용 시)
+    clear_host_files()
+    asyncio.run(run_worker(WORKER_CONCURRENCY))